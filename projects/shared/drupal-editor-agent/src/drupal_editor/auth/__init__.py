@@ -2,5 +2,6 @@
 
 from drupal_editor.auth.terminus import TerminusAuth
 from drupal_editor.auth.playwright import PlaywrightAuth
+from drupal_editor.auth.rest import RestAuth
 
-__all__ = ["TerminusAuth", "PlaywrightAuth"]
+__all__ = ["TerminusAuth", "PlaywrightAuth", "RestAuth"]
@@ -0,0 +1,214 @@
+"""
+Shared Chromium manager for the Playwright backend.
+
+Every PlaywrightAuth gets its own isolated BrowserContext (cookies, storage,
+routes), but all of them share one Playwright driver and one browser process
+per event loop. The browser starts on first use and shuts down once no site
+has used it for `idle_timeout` seconds, or when the loop cancels the idle
+wait on its way out.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, ClassVar, Optional
+
+from rich.console import Console
+
+console = Console()
+
+
+class BrowserManager:
+    """
+    Share one Chromium process across PlaywrightAuth instances.
+
+    Usage:
+        manager = BrowserManager.default()
+        context = await manager.acquire("https://savaslabs.com|admin", viewport=...)
+        ...
+        await manager.release(context)
+
+        # JS heap per context, for spotting a runaway site
+        print(await manager.memory_report())
+    """
+
+    # Playwright objects and asyncio locks belong to the loop they were
+    # created on, so default() hands out one manager per (loop, headless)
+    _instances: ClassVar[dict[tuple[asyncio.AbstractEventLoop, bool], "BrowserManager"]] = {}
+
+    def __init__(
+        self,
+        headless: bool = True,
+        idle_timeout: float = 30.0,
+    ):
+        """
+        Initialize the manager.
+
+        Args:
+            headless: Launch Chromium headless
+            idle_timeout: Seconds to keep the browser running after the last
+                          context is released (0 shuts down immediately)
+        """
+        self.headless = headless
+        self.idle_timeout = idle_timeout
+        self._playwright = None
+        self._browser = None
+        self._contexts: dict[Any, str] = {}
+        self._lock = asyncio.Lock()
+        self._idle_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def default(cls, headless: bool = True) -> BrowserManager:
+        """
+        Return the shared manager for the running loop and headless setting.
+
+        Must be called from a coroutine. Managers left behind by loops that
+        have since closed are dropped.
+        """
+        loop = asyncio.get_running_loop()
+        for key in [key for key in cls._instances if key[0].is_closed()]:
+            del cls._instances[key]
+
+        manager = cls._instances.get((loop, headless))
+        if manager is None:
+            manager = cls._instances[(loop, headless)] = cls(headless=headless)
+        return manager
+
+    @classmethod
+    async def shutdown_all(cls) -> None:
+        """Stop every shared manager of the running loop (e.g. before it exits)."""
+        loop = asyncio.get_running_loop()
+        for (manager_loop, _), manager in list(cls._instances.items()):
+            if manager_loop is loop:
+                await manager.shutdown()
+
+    @property
+    def users(self) -> int:
+        """Number of contexts currently handed out."""
+        return len(self._contexts)
+
+    async def _ensure_browser(self) -> Any:
+        """Start the Playwright driver and Chromium if not already running."""
+        if self._browser is not None and self._browser.is_connected():
+            return self._browser
+
+        from playwright.async_api import async_playwright
+
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+
+        console.print("[yellow]Launching shared browser...[/yellow]")
+        self._browser = await self._playwright.chromium.launch(headless=self.headless)
+        return self._browser
+
+    async def acquire(self, key: str, **context_options: Any) -> Any:
+        """
+        Create an isolated BrowserContext on the shared browser.
+
+        Args:
+            key: Label for the context (e.g. base URL and username), used in reports
+            **context_options: Passed to Browser.new_context()
+
+        Returns:
+            A new BrowserContext; give it back with release()
+        """
+        async with self._lock:
+            if self._idle_task:
+                idle_task, self._idle_task = self._idle_task, None
+                idle_task.cancel()
+
+            browser = await self._ensure_browser()
+            context = await browser.new_context(**context_options)
+            self._contexts[context] = key
+            return context
+
+    async def release(self, context: Any) -> None:
+        """Close a context and shut the browser down once nothing uses it."""
+        async with self._lock:
+            if self._contexts.pop(context, None) is None:
+                return
+            try:
+                await context.close()
+            except Exception as e:
+                console.print(f"[dim]Could not close browser context: {e}[/dim]")
+
+            if self._contexts:
+                return
+            if self.idle_timeout <= 0:
+                await self._stop()
+            else:
+                self._idle_task = asyncio.create_task(self._shutdown_when_idle())
+
+    async def _shutdown_when_idle(self) -> None:
+        """Stop the browser if no context is acquired within idle_timeout."""
+        try:
+            await asyncio.sleep(self.idle_timeout)
+        except asyncio.CancelledError:
+            # acquire() and shutdown() clear _idle_task before cancelling it;
+            # anything else (asyncio.run tearing the loop down) must not leave
+            # Chromium running. The lock is skipped: nothing else will run.
+            if self._idle_task is asyncio.current_task():
+                self._idle_task = None
+                if not self._contexts:
+                    await self._stop()
+            raise
+        async with self._lock:
+            self._idle_task = None
+            if not self._contexts:
+                await self._stop()
+
+    async def _stop(self) -> None:
+        """Close the browser and stop the Playwright driver."""
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+            console.print("[dim]Shared browser stopped[/dim]")
+
+    async def shutdown(self) -> None:
+        """Close every context and stop the browser now."""
+        async with self._lock:
+            if self._idle_task:
+                idle_task, self._idle_task = self._idle_task, None
+                idle_task.cancel()
+            for context in list(self._contexts):
+                try:
+                    await context.close()
+                except Exception:
+                    pass
+            self._contexts.clear()
+            await self._stop()
+
+    async def memory_report(self) -> list[dict]:
+        """
+        Report JS heap usage per context.
+
+        Uses the Chrome DevTools Protocol (Performance.getMetrics) on each
+        open page. Returns one entry per context with its key, page count
+        and used JS heap in bytes.
+        """
+        report = []
+        for context, key in list(self._contexts.items()):
+            heap_bytes = 0
+            for page in context.pages:
+                try:
+                    session = await context.new_cdp_session(page)
+                    await session.send("Performance.enable")
+                    metrics = await session.send("Performance.getMetrics")
+                    await session.detach()
+                except Exception:
+                    continue
+                for metric in metrics.get("metrics", []):
+                    if metric.get("name") == "JSHeapUsedSize":
+                        heap_bytes += int(metric.get("value", 0))
+            report.append({
+                "key": key,
+                "pages": len(context.pages),
+                "js_heap_bytes": heap_bytes,
+            })
+        return report
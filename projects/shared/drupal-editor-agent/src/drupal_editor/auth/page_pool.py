@@ -0,0 +1,157 @@
+"""
+Page pool for the Playwright backend.
+
+Keeps a bounded set of tabs open inside one authenticated browser context,
+so several admin-UI operations can run in parallel while sharing the session.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator
+
+from rich.console import Console
+
+console = Console()
+
+
+@dataclass
+class _PooledPage:
+    """A page owned by the pool, with its usage count."""
+
+    page: Any
+    uses: int = 0
+
+
+class PagePool:
+    """
+    Bounded pool of pages that share one BrowserContext.
+
+    Pages are created lazily up to `size`, handed out one caller at a time,
+    and recycled (closed and replaced on next checkout) after `max_uses`
+    checkouts or after an operation raised while holding them.
+
+    Usage:
+        pool = PagePool(context, size=4, max_uses=50)
+
+        async with pool.page() as page:
+            await page.goto("https://example.com/node/1/edit")
+
+        await pool.close()
+    """
+
+    def __init__(
+        self,
+        context: Any,
+        size: int = 1,
+        max_uses: int = 50,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            context: Authenticated Playwright BrowserContext
+            size: Maximum number of pages open at once
+            max_uses: Recycle a page after this many checkouts
+        """
+        if size < 1:
+            raise ValueError("Page pool size must be at least 1")
+
+        self._context = context
+        self.size = size
+        self.max_uses = max_uses
+        self._slots = asyncio.Semaphore(size)
+        self._idle: list[_PooledPage] = []
+        self._in_use = 0
+        self._created = 0
+        self._recycled = 0
+        self._closed = False
+
+    def adopt(self, page: Any) -> None:
+        """Add an already-open page (e.g. the login page) to the idle set."""
+        if len(self._idle) + self._in_use >= self.size:
+            return
+        self._idle.append(_PooledPage(page=page))
+        self._created += 1
+
+    async def checkout(self) -> _PooledPage:
+        """Wait for a free slot and return a page for exclusive use."""
+        if self._closed:
+            raise RuntimeError("Page pool is closed")
+
+        await self._slots.acquire()
+        try:
+            while self._idle:
+                pooled = self._idle.pop()
+                if not pooled.page.is_closed():
+                    break
+            else:
+                pooled = _PooledPage(page=await self._context.new_page())
+                self._created += 1
+        except BaseException:
+            self._slots.release()
+            raise
+
+        self._in_use += 1
+        return pooled
+
+    async def checkin(self, pooled: _PooledPage, failed: bool = False) -> None:
+        """Return a page to the pool, recycling it if it is worn out or broken."""
+        pooled.uses += 1
+        self._in_use -= 1
+
+        try:
+            recycle = (
+                failed
+                or self._closed
+                or pooled.uses >= self.max_uses
+                or pooled.page.is_closed()
+            )
+            if recycle:
+                self._recycled += 1
+                if not pooled.page.is_closed():
+                    try:
+                        await pooled.page.close()
+                    except Exception as e:
+                        console.print(f"[dim]Could not close recycled page: {e}[/dim]")
+            else:
+                self._idle.append(pooled)
+        finally:
+            self._slots.release()
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Any]:
+        """Check out a page for the duration of the block."""
+        pooled = await self.checkout()
+        failed = False
+        try:
+            yield pooled.page
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            await self.checkin(pooled, failed=failed)
+
+    async def close(self) -> None:
+        """Close idle pages. Pages still checked out are closed on checkin."""
+        self._closed = True
+        while self._idle:
+            pooled = self._idle.pop()
+            if not pooled.page.is_closed():
+                try:
+                    await pooled.page.close()
+                except Exception:
+                    pass
+
+    @property
+    def stats(self) -> dict:
+        """Current pool counters, for logging and tuning."""
+        return {
+            "size": self.size,
+            "in_use": self._in_use,
+            "idle": len(self._idle),
+            "created": self._created,
+            "recycled": self._recycled,
+        }
@@ -6,14 +6,52 @@ Universal fallback for any Drupal site - works via the admin UI.
 
 from __future__ import annotations
 
+import asyncio
 import os
-from typing import Optional
+import re
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Iterable, Optional
 from pathlib import Path
 
 from rich.console import Console
 
+from drupal_editor.auth.browser_manager import BrowserManager
+from drupal_editor.auth.page_pool import PagePool
+from drupal_editor.auth.resources import ResourcePolicy
+from drupal_editor.auth.screenshots import ScreenshotPolicy, ScreenshotWriter
+from drupal_editor.auth.session_store import SessionStore
+
 console = Console()
 
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Present on every node edit form; waiting for it replaces generic load states
+EDIT_FORM_SELECTOR = 'form [name="title[0][value]"]'
+
+# The form's Save button; #edit-actions closes the form, so once it is visible
+# every field above it has been parsed
+SUBMIT_SELECTOR = '#edit-actions [type="submit"]'
+
+# True once every named field has a control and, where CKEditor 5 is attached
+# to it, the editor instance exists (or the page has finished loading without one)
+_FIELDS_READY_SCRIPT = """
+(fields) => fields.every((name) => {
+    const el = document.querySelector(`form [name="${name}[0][value]"], form [name="${name}"]`);
+    if (!el) {
+        return false;
+    }
+    if (el.tagName !== 'TEXTAREA' || !document.querySelector(`[data-editor-for="${el.id}"]`)) {
+        return true;
+    }
+    const editors = window.Drupal && window.Drupal.CKEditor5Instances;
+    const editorId = el.getAttribute('data-ckeditor5-id');
+    return Boolean(editorId && editors && editors.get(editorId)) || document.readyState === 'complete';
+})
+"""
+
+# Status or error messages rendered after a form submit
+MESSAGES_SELECTOR = ".messages--status, .messages.status, .messages--error, .messages.error"
+
 
 class PlaywrightAuth:
     """
@@ -32,8 +70,14 @@ class PlaywrightAuth:
 
         # Edit a node via the UI
         await auth.edit_node(nid=123, changes={"body": "New content"})
+
+        # Run several operations in parallel tabs (pool_size > 1)
+        async with auth.checkout_page() as page:
+            await page.goto(f"{auth.base_url}/node/123/edit")
     """
 
+    auth_method = "playwright"
+
     def __init__(
         self,
         base_url: str,
@@ -41,6 +85,17 @@ class PlaywrightAuth:
         password: str,
         headless: bool = True,
         screenshots_dir: Optional[Path] = None,
+        pool_size: int = 1,
+        page_max_uses: int = 50,
+        reuse_session: bool = True,
+        session_store: Optional[SessionStore] = None,
+        resource_policy: Optional[ResourcePolicy] = None,
+        screenshot_policy: ScreenshotPolicy | str = ScreenshotPolicy.ALWAYS,
+        screenshot_format: str = "jpeg",
+        screenshot_quality: int = 70,
+        screenshots_max_bytes: int = 200 * 1024 * 1024,
+        form_post: bool = False,
+        browser_manager: Optional[BrowserManager] = None,
     ):
         """
         Initialize Playwright auth.
@@ -51,42 +106,95 @@ class PlaywrightAuth:
             password: Admin password
             headless: Run browser in headless mode
             screenshots_dir: Directory to save screenshots (for audit trail)
+            pool_size: Number of tabs that can run operations concurrently
+            page_max_uses: Recycle a tab after this many operations
+            reuse_session: Reuse a saved, encrypted login session when still valid
+            session_store: Where sessions are saved (defaults to SessionStore())
+            resource_policy: Which requests to abort (defaults to ResourcePolicy();
+                             pass ResourcePolicy(enabled=False) to load everything)
+            screenshot_policy: "off", "on_failure", "always" or "field"
+            screenshot_format: "jpeg", "webp" (needs Pillow) or "png"
+            screenshot_quality: JPEG/WebP quality (1-100)
+            screenshots_max_bytes: Evict oldest screenshots beyond this directory size
+            form_post: Submit node edits as plain HTTP form posts using the
+                       session cookies, falling back to the browser for JS-only widgets
+            browser_manager: Browser to open this site's context in (defaults to
+                             the running loop's shared BrowserManager for `headless`)
         """
         self.base_url = base_url.rstrip("/")
         self.username = username
         self.password = password
         self.headless = headless
         self.screenshots_dir = screenshots_dir or Path("./screenshots")
-        self._browser = None
+        self.screenshots = ScreenshotWriter(
+            self.screenshots_dir,
+            policy=screenshot_policy,
+            image_format=screenshot_format,
+            quality=screenshot_quality,
+            max_dir_bytes=screenshots_max_bytes,
+        )
+        self._browser_manager = browser_manager
+        self._manager: Optional[BrowserManager] = None
         self._context = None
         self._page = None
+        self._pool: Optional[PagePool] = None
+        self.pool_size = pool_size
+        self.page_max_uses = page_max_uses
+        self._auth_lock = asyncio.Lock()
+        self._session_store = (session_store or SessionStore()) if reuse_session else None
+        self.resource_policy = resource_policy or ResourcePolicy()
+        self.form_post = form_post
+        self._http = None
         self._authenticated = False
 
     async def authenticate(self) -> bool:
         """
         Login to Drupal via the admin UI.
 
+        If a saved session exists and is still accepted by the site,
+        the login form is skipped entirely.
+
         Returns True if login succeeds.
         """
         try:
-            from playwright.async_api import async_playwright
+            import playwright.async_api  # noqa: F401
         except ImportError:
             console.print("[red]Playwright not installed. Run: pip install playwright && playwright install[/red]")
             return False
 
-        console.print(f"[yellow]Launching browser for {self.base_url}...[/yellow]")
+        console.print(f"[yellow]Opening browser context for {self.base_url}...[/yellow]")
 
-        playwright = await async_playwright().start()
-        self._browser = await playwright.chromium.launch(headless=self.headless)
+        # Re-authenticating: give back the previous context first
+        await self._release_context()
 
-        # Create context with realistic settings
-        self._context = await self._browser.new_context(
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        saved_state = None
+        if self._session_store:
+            saved_state = self._session_store.load(self.base_url, self.username)
+
+        # Isolated context on the shared browser, with realistic settings.
+        # The default manager is per event loop, so resolve it here.
+        self._manager = self._browser_manager or BrowserManager.default(headless=self.headless)
+        self._context = await self._manager.acquire(
+            f"{self.base_url}|{self.username}",
+            user_agent=USER_AGENT,
             viewport={"width": 1280, "height": 800},
+            storage_state=saved_state,
         )
+        await self.resource_policy.apply(self._context, self.base_url)
 
         self._page = await self._context.new_page()
 
+        if saved_state:
+            if await self._session_is_valid():
+                console.print("[green]Reused saved session[/green]")
+                self._start_pool()
+                self._authenticated = True
+                return True
+
+            console.print("[dim]Saved session expired, logging in again[/dim]")
+            self._session_store.clear(self.base_url, self.username)
+            await self._context.clear_cookies()
+
         # Navigate to login page
         login_url = f"{self.base_url}/user/login"
         console.print(f"[dim]Navigating to {login_url}[/dim]")
@@ -111,28 +219,161 @@ class PlaywrightAuth:
 
             if logged_in:
                 console.print("[green]Login successful[/green]")
+                await self._save_session()
+                self._start_pool()
                 self._authenticated = True
                 return True
             else:
                 console.print("[red]Login failed - no logout link found[/red]")
                 # Take screenshot for debugging
-                await self._save_screenshot("login_failed")
+                await self._save_screenshot("login_failed", failed=True)
                 return False
 
         except Exception as e:
             console.print(f"[red]Login error: {e}[/red]")
             return False
 
-    async def _save_screenshot(self, name: str) -> Optional[str]:
-        """Save a screenshot and return the path."""
-        if not self._page:
-            return None
+    async def _session_is_valid(self) -> bool:
+        """
+        Cheap check that the context's cookies still belong to a logged-in user.
 
-        self.screenshots_dir.mkdir(parents=True, exist_ok=True)
-        path = self.screenshots_dir / f"{name}.png"
-        await self._page.screenshot(path=str(path))
-        console.print(f"[dim]Screenshot saved: {path}[/dim]")
-        return str(path)
+        GET /user without following redirects: Drupal sends authenticated
+        users to /user/{uid} and anonymous users to /user/login. No page is
+        rendered in the browser.
+        """
+        try:
+            response = await self._context.request.get(
+                f"{self.base_url}/user",
+                max_redirects=0,
+                timeout=10000,
+            )
+        except Exception as e:
+            console.print(f"[dim]Session probe failed: {e}[/dim]")
+            return False
+
+        location = response.headers.get("location", "")
+        return 300 <= response.status < 400 and re.search(r"/user/\d+", location) is not None
+
+    async def _save_session(self) -> None:
+        """Persist the authenticated storage state for the next run."""
+        if not self._session_store:
+            return
+        try:
+            state = await self._context.storage_state()
+            self._session_store.save(self.base_url, self.username, state)
+        except Exception as e:
+            console.print(f"[yellow]Could not save session: {e}[/yellow]")
+
+    def _start_pool(self) -> None:
+        """Create the page pool for the authenticated context."""
+        self._pool = PagePool(
+            self._context,
+            size=self.pool_size,
+            max_uses=self.page_max_uses,
+        )
+        # Reuse the login tab as the first pooled page
+        self._pool.adopt(self._page)
+
+    async def ensure_authenticated(self) -> bool:
+        """Authenticate once, even when called from concurrent operations."""
+        if self._authenticated:
+            return True
+        async with self._auth_lock:
+            if self._authenticated:
+                return True
+            return await self.authenticate()
+
+    @asynccontextmanager
+    async def checkout_page(self) -> AsyncIterator[Any]:
+        """
+        Check out a tab from the page pool for one operation.
+
+        Tabs share the authenticated session. A tab is recycled after
+        `page_max_uses` operations or when the block raises.
+        """
+        if not await self.ensure_authenticated():
+            raise RuntimeError(f"Failed to authenticate to {self.base_url}")
+
+        async with self._pool.page() as page:
+            yield page
+
+    async def http_client(self):
+        """
+        Get an httpx.AsyncClient that carries the browser session cookies.
+
+        Used for browserless requests (form posts, probes) against the same
+        authenticated session. Redirects are not followed, so callers can
+        inspect where Drupal sends them after a submit.
+        """
+        if self._http is None:
+            if not await self.ensure_authenticated():
+                raise RuntimeError(f"Failed to authenticate to {self.base_url}")
+
+            import httpx
+
+            cookies = httpx.Cookies()
+            for cookie in await self._context.cookies(self.base_url):
+                cookies.set(
+                    cookie["name"],
+                    cookie["value"],
+                    domain=cookie.get("domain", ""),
+                    path=cookie.get("path", "/"),
+                )
+
+            self._http = httpx.AsyncClient(
+                base_url=self.base_url,
+                cookies=cookies,
+                headers={"User-Agent": USER_AGENT},
+                follow_redirects=False,
+                timeout=30.0,
+            )
+        return self._http
+
+    async def open_edit_form(
+        self,
+        page: Any,
+        url: str,
+        fields: Iterable[str] = (),
+        timeout: int = 30000,
+    ) -> None:
+        """
+        Navigate to an entity edit form and wait only for what will be used.
+
+        Waits for the Save button and for the controls of `fields` (and
+        their CKEditor instances, where attached) rather than for the full
+        load event.
+
+        Args:
+            page: Page to navigate
+            url: Edit form URL
+            fields: Field machine names that are about to be filled
+            timeout: Milliseconds to wait
+        """
+        await page.goto(url, wait_until="commit", timeout=timeout)
+        await page.wait_for_selector(EDIT_FORM_SELECTOR, state="attached", timeout=timeout)
+        await page.wait_for_selector(SUBMIT_SELECTOR, state="visible", timeout=timeout)
+        fields = list(fields)
+        if fields:
+            await page.wait_for_function(_FIELDS_READY_SCRIPT, arg=fields, timeout=timeout)
+
+    async def _save_screenshot(
+        self,
+        name: str,
+        page: Any = None,
+        failed: bool = False,
+        clip_selector: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Capture a screenshot per the screenshot policy and return its path.
+
+        The file is written in the background; see ScreenshotWriter.
+        """
+        return await self.screenshots.capture(
+            page or self._page,
+            name,
+            failed=failed,
+            clip_selector=clip_selector,
+        )
 
     async def get_node(self, nid: int) -> Optional[dict]:
         """
@@ -140,26 +381,24 @@ class PlaywrightAuth:
 
         Note: This is less efficient than Drush but works universally.
         """
-        if not self._authenticated:
-            await self.authenticate()
-
         edit_url = f"{self.base_url}/node/{nid}/edit"
         console.print(f"[dim]Fetching node from {edit_url}[/dim]")
 
         try:
-            await self._page.goto(edit_url, wait_until="domcontentloaded", timeout=30000)
+            async with self.checkout_page() as page:
+                await self.open_edit_form(page, edit_url)
 
-            # Extract basic node info from the edit form
-            title = await self._page.locator('input[name="title[0][value]"]').input_value()
+                # Extract basic node info from the edit form
+                title = await page.locator('input[name="title[0][value]"]').input_value()
 
-            # Try to get moderation state
-            moderation_state = None
-            try:
-                moderation_select = self._page.locator('select[name="moderation_state[0][state]"]')
-                if await moderation_select.count() > 0:
-                    moderation_state = await moderation_select.input_value()
-            except Exception:
-                pass
+                # Try to get moderation state
+                moderation_state = None
+                try:
+                    moderation_select = page.locator('select[name="moderation_state[0][state]"]')
+                    if await moderation_select.count() > 0:
+                        moderation_state = await moderation_select.input_value()
+                except Exception:
+                    pass
 
             return {
                 "nid": nid,
@@ -175,16 +414,36 @@ class PlaywrightAuth:
         """Get the site URL."""
         return self.base_url
 
-    async def close(self) -> None:
-        """Clean up browser resources."""
-        if self._browser:
-            await self._browser.close()
-            self._browser = None
+    async def _release_context(self) -> None:
+        """Close pooled pages and hand the context back to the browser manager."""
+        if self._http:
+            await self._http.aclose()
+            self._http = None
+        if self._pool:
+            await self._pool.close()
+            self._pool = None
+        if self._context:
+            await self._manager.release(self._context)
             self._context = None
-            self._page = None
-            self._authenticated = False
+        self._page = None
+        self._authenticated = False
+
+    async def close(self) -> None:
+        """
+        Clean up browser resources.
+
+        Closes this site's context; the shared browser (and its Playwright
+        driver) stops once no other PlaywrightAuth is using it.
+        """
+        await self.screenshots.flush()
+        await self._release_context()
 
     @property
     def page(self):
-        """Get the current page for advanced operations."""
+        """
+        Get the login page for advanced operations.
+
+        The login page is also the first pooled tab; use checkout_page()
+        when running operations concurrently.
+        """
         return self._page
@@ -0,0 +1,100 @@
+"""
+Request interception for the Playwright backend.
+
+Admin edit pages pull in images, fonts and analytics that the automation
+never looks at. A ResourcePolicy aborts those requests at the browser
+context so only the HTML, styles and form scripts (including the editor
+that body fields are filled through) are fetched.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlsplit
+
+from rich.console import Console
+
+console = Console()
+
+# Playwright resource types that never matter for form automation
+DEFAULT_BLOCKED_TYPES = frozenset({"image", "media", "font"})
+
+# Same-site URL fragments to block. Empty by default: editor assets must
+# load so formatted text is filled through CKEditor, not its hidden textarea.
+DEFAULT_BLOCKED_PATTERNS: tuple[str, ...] = ()
+
+# CKEditor 5 assets, for callers that only edit plain fields and want the
+# lighter page (body fields then fall back to the raw textarea)
+CKEDITOR5_PATTERNS = (
+    "/core/assets/vendor/ckeditor5/",
+    "/core/modules/ckeditor5/js/build/",
+)
+
+
+@dataclass
+class ResourcePolicy:
+    """
+    Which browser requests to abort.
+
+    Usage:
+        # Defaults: block images/media/fonts and third-party hosts
+        policy = ResourcePolicy()
+
+        # Allow a CDN the admin theme depends on
+        policy = ResourcePolicy(allowed_hosts=("cdn.example.com",))
+
+        # Also skip CKEditor when only plain fields are edited
+        policy = ResourcePolicy(blocked_patterns=CKEDITOR5_PATTERNS)
+
+        # Load everything (e.g. for debugging screenshots)
+        policy = ResourcePolicy(enabled=False)
+    """
+
+    enabled: bool = True
+    blocked_types: frozenset[str] = DEFAULT_BLOCKED_TYPES
+    block_third_party: bool = True
+    allowed_hosts: tuple[str, ...] = ()
+    blocked_patterns: tuple[str, ...] = DEFAULT_BLOCKED_PATTERNS
+    blocked_count: int = field(default=0, init=False)
+
+    def should_block(self, url: str, resource_type: str, site_host: str) -> bool:
+        """Decide whether a request should be aborted."""
+        if not self.enabled:
+            return False
+
+        # Never block the documents we navigate to (including login redirects)
+        if resource_type == "document":
+            return False
+
+        if resource_type in self.blocked_types:
+            return True
+
+        host = urlsplit(url).hostname or ""
+        if self.block_third_party and not self._is_allowed_host(host, site_host):
+            return True
+
+        return any(pattern in url for pattern in self.blocked_patterns)
+
+    def _is_allowed_host(self, host: str, site_host: str) -> bool:
+        """True for the site itself, its subdomains and explicitly allowed hosts."""
+        if not host or host == site_host or host.endswith(f".{site_host}"):
+            return True
+        return host in self.allowed_hosts
+
+    async def apply(self, context: Any, base_url: str) -> None:
+        """Install the policy as a route handler on a BrowserContext."""
+        if not self.enabled:
+            return
+
+        site_host = urlsplit(base_url).hostname or ""
+
+        async def handle(route) -> None:
+            request = route.request
+            if self.should_block(request.url, request.resource_type, site_host):
+                self.blocked_count += 1
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await context.route("**/*", handle)
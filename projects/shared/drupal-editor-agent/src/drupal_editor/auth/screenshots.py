@@ -0,0 +1,202 @@
+"""
+Audit screenshots for Playwright operations.
+
+Captures happen on the page (the browser does the JPEG encoding); writing
+to disk, optional WebP transcoding and directory eviction run in a
+background thread so the edit itself never waits on the filesystem.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import threading
+from enum import Enum
+from pathlib import Path
+from typing import Any, Optional
+
+from rich.console import Console
+
+console = Console()
+
+# File extensions ScreenshotWriter produces; eviction only ever touches these
+SCREENSHOT_EXTENSIONS = frozenset({".jpg", ".webp", ".png"})
+
+
+class ScreenshotPolicy(str, Enum):
+    """When to take audit screenshots."""
+
+    OFF = "off"
+    ON_FAILURE = "on_failure"  # Only when an operation fails
+    ALWAYS = "always"  # Full viewport before and after each edit
+    FIELD = "field"  # Clipped to the changed field when it can be located
+
+
+class ScreenshotWriter:
+    """
+    Capture screenshots according to a policy and write them in the background.
+
+    The returned path is known immediately, so it can go into the changelog,
+    while the file appears once the background write finishes. Call flush()
+    before exiting to make sure pending writes land.
+
+    Usage:
+        writer = ScreenshotWriter(Path("./screenshots"), policy="on_failure")
+        path = await writer.capture(page, "node_123_after", failed=True)
+        await writer.flush()
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        policy: ScreenshotPolicy | str = ScreenshotPolicy.ALWAYS,
+        image_format: str = "jpeg",
+        quality: int = 70,
+        max_dir_bytes: int = 200 * 1024 * 1024,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            directory: Directory to save screenshots in
+            policy: ScreenshotPolicy or its string value
+            image_format: "jpeg", "webp" (needs Pillow) or "png"
+            quality: JPEG/WebP quality (1-100)
+            max_dir_bytes: Evict oldest screenshots once they exceed this size
+                           in total (other files in the directory are left alone)
+        """
+        self.directory = Path(directory)
+        self.policy = ScreenshotPolicy(policy)
+        self.quality = quality
+        self.max_dir_bytes = max_dir_bytes
+        self.image_format = image_format.lower()
+
+        if self.image_format == "webp" and not _pillow_available():
+            console.print("[yellow]Pillow not installed - saving screenshots as JPEG instead of WebP[/yellow]")
+            self.image_format = "jpeg"
+        if self.image_format not in ("jpeg", "webp", "png"):
+            raise ValueError(f"Unsupported screenshot format: {image_format}")
+
+        self._pending: set[asyncio.Task] = set()
+        self._dir_bytes: Optional[int] = None
+        self._evict_lock = threading.Lock()
+
+    @property
+    def extension(self) -> str:
+        return "jpg" if self.image_format == "jpeg" else self.image_format
+
+    def wants(self, failed: bool = False) -> bool:
+        """Whether the policy calls for a screenshot in this situation."""
+        if self.policy == ScreenshotPolicy.OFF:
+            return False
+        if self.policy == ScreenshotPolicy.ON_FAILURE:
+            return failed
+        return True
+
+    async def capture(
+        self,
+        page: Any,
+        name: str,
+        failed: bool = False,
+        clip_selector: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Take a screenshot if the policy allows it and schedule the write.
+
+        Args:
+            page: Playwright page
+            name: File name without extension
+            failed: The operation failed (always captured unless policy is OFF)
+            clip_selector: Element to clip to under the FIELD policy
+
+        Returns:
+            Path the screenshot will be written to, or None if skipped
+        """
+        if page is None or not self.wants(failed):
+            return None
+
+        # Playwright only encodes PNG/JPEG; WebP is transcoded off-thread
+        capture_type = "jpeg" if self.image_format == "jpeg" else "png"
+        options: dict[str, Any] = {"type": capture_type}
+        if capture_type == "jpeg":
+            options["quality"] = self.quality
+
+        try:
+            data = None
+            if self.policy == ScreenshotPolicy.FIELD and clip_selector and not failed:
+                element = page.locator(clip_selector).first
+                if await element.count() > 0:
+                    data = await element.screenshot(**options)
+            if data is None:
+                data = await page.screenshot(**options)
+        except Exception as e:
+            console.print(f"[dim]Screenshot {name} skipped: {e}[/dim]")
+            return None
+
+        path = self.directory / f"{name}.{self.extension}"
+        task = asyncio.create_task(asyncio.to_thread(self._write, path, data))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+        return str(path)
+
+    def _write(self, path: Path, data: bytes) -> None:
+        """Encode (if needed), write and evict. Runs in a worker thread."""
+        if self.image_format == "webp":
+            from PIL import Image
+
+            buffer = io.BytesIO()
+            Image.open(io.BytesIO(data)).save(buffer, format="WEBP", quality=self.quality)
+            data = buffer.getvalue()
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        previous = path.stat().st_size if path.exists() else 0
+        path.write_bytes(data)
+        console.print(f"[dim]Screenshot saved: {path}[/dim]")
+
+        with self._evict_lock:
+            if self._dir_bytes is None:
+                self._dir_bytes = self._scan_size()
+            else:
+                self._dir_bytes += len(data) - previous
+            if self._dir_bytes > self.max_dir_bytes:
+                self._evict()
+
+    def _screenshot_files(self) -> list[Path]:
+        """Screenshot files in the directory, by extension."""
+        return [
+            p for p in self.directory.iterdir()
+            if p.suffix.lower() in SCREENSHOT_EXTENSIONS and p.is_file()
+        ]
+
+    def _scan_size(self) -> int:
+        """Total size of the screenshots in the directory."""
+        return sum(p.stat().st_size for p in self._screenshot_files())
+
+    def _evict(self) -> None:
+        """Delete oldest screenshots until they are under 90% of the cap."""
+        files = sorted(self._screenshot_files(), key=lambda p: p.stat().st_mtime)
+        total = sum(p.stat().st_size for p in files)
+        target = int(self.max_dir_bytes * 0.9)
+        for path in files:
+            if total <= target:
+                break
+            size = path.stat().st_size
+            path.unlink(missing_ok=True)
+            total -= size
+        self._dir_bytes = total
+
+    async def flush(self) -> None:
+        """Wait for all pending writes to finish."""
+        if self._pending:
+            results = await asyncio.gather(*list(self._pending), return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    console.print(f"[yellow]Screenshot write failed: {result}[/yellow]")
+
+
+def _pillow_available() -> bool:
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        return False
+    return True
@@ -0,0 +1,148 @@
+"""
+Encrypted on-disk cache of Playwright storage state.
+
+Lets PlaywrightAuth reuse an authenticated session across CLI runs instead
+of going through /user/login every time.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+from rich.console import Console
+
+console = Console()
+
+DEFAULT_SESSION_DIR = Path.home() / ".cache" / "drupal-editor" / "sessions"
+
+
+class SessionStore:
+    """
+    Store Playwright storage state (cookies + localStorage) encrypted at rest.
+
+    Each entry is keyed by base URL and username. The encryption key comes
+    from DRUPAL_SESSION_KEY (a Fernet key) or is generated once and kept in
+    a 0600 key file next to the entries.
+
+    Requires the optional `cryptography` package; without it the store is
+    disabled and every run falls back to a full login.
+
+    Usage:
+        store = SessionStore()
+        state = store.load("https://savaslabs.com", "admin")
+        ...
+        store.save("https://savaslabs.com", "admin", await context.storage_state())
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        key: Optional[str] = None,
+        max_age: int = 12 * 60 * 60,
+    ):
+        """
+        Initialize the session store.
+
+        Args:
+            directory: Where to keep entries (defaults to DRUPAL_SESSION_DIR
+                       or ~/.cache/drupal-editor/sessions)
+            key: Fernet key (defaults to DRUPAL_SESSION_KEY or a generated key file)
+            max_age: Ignore entries older than this many seconds
+        """
+        env_dir = os.getenv("DRUPAL_SESSION_DIR")
+        self.directory = Path(directory or env_dir or DEFAULT_SESSION_DIR)
+        self.max_age = max_age
+        self._key = key or os.getenv("DRUPAL_SESSION_KEY")
+        self._fernet = None
+        self._disabled = False
+
+    def _cipher(self):
+        """Return the Fernet cipher, or None if encryption is unavailable."""
+        if self._fernet is not None or self._disabled:
+            return self._fernet
+
+        try:
+            from cryptography.fernet import Fernet
+        except ImportError:
+            console.print(
+                "[yellow]cryptography not installed - session reuse disabled. "
+                "Run: uv sync --extra session[/yellow]"
+            )
+            self._disabled = True
+            return None
+
+        key = self._key or self._load_or_create_key(Fernet)
+        self._fernet = Fernet(key)
+        return self._fernet
+
+    def _load_or_create_key(self, fernet_cls) -> bytes:
+        """Read the key file, creating it with owner-only permissions if missing."""
+        key_path = self.directory / ".key"
+        if key_path.exists():
+            return key_path.read_bytes().strip()
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        key = fernet_cls.generate_key()
+        fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(key)
+        return key
+
+    def _path(self, base_url: str, username: str) -> Path:
+        """Entry file for a site/user pair."""
+        digest = hashlib.sha256(f"{base_url.rstrip('/')}\n{username}".encode()).hexdigest()
+        return self.directory / f"{digest[:32]}.session"
+
+    def load(self, base_url: str, username: str) -> Optional[dict]:
+        """Return saved storage state, or None if missing, expired or unreadable."""
+        path = self._path(base_url, username)
+        if not path.exists():
+            return None
+
+        cipher = self._cipher()
+        if cipher is None:
+            return None
+
+        try:
+            payload = json.loads(cipher.decrypt(path.read_bytes(), ttl=self.max_age))
+        except Exception:
+            # Expired, tampered with, or encrypted with a different key
+            self.clear(base_url, username)
+            return None
+
+        if payload.get("base_url") != base_url.rstrip("/") or payload.get("username") != username:
+            return None
+
+        return payload.get("storage_state")
+
+    def save(self, base_url: str, username: str, storage_state: dict) -> bool:
+        """Encrypt and write storage state. Returns False if the store is disabled."""
+        cipher = self._cipher()
+        if cipher is None:
+            return False
+
+        payload = {
+            "base_url": base_url.rstrip("/"),
+            "username": username,
+            "saved_at": time.time(),
+            "storage_state": storage_state,
+        }
+        token = cipher.encrypt(json.dumps(payload).encode())
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(base_url, username)
+        tmp_path = path.with_suffix(".tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(token)
+        os.replace(tmp_path, path)
+        return True
+
+    def clear(self, base_url: str, username: str) -> None:
+        """Forget the saved session for a site/user pair."""
+        self._path(base_url, username).unlink(missing_ok=True)
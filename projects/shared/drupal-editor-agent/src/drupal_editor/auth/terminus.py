@@ -44,6 +44,8 @@ class TerminusAuth:
         result = await auth.php_eval('print "Hello";')
     """
 
+    auth_method = "terminus"
+
     def __init__(
         self,
         site_name: str,
@@ -13,6 +13,18 @@ Usage:
 
     # Get node info
     uv run python -m drupal_editor.cli get-node --nid 123
+
+    # Query the change store (DRUPAL_EDITOR_DB, default logs/changes.db)
+    uv run python -m drupal_editor.cli history --target node/123 --days 30
+    uv run python -m drupal_editor.cli stats --days 7
+    uv run python -m drupal_editor.cli summary --session 20251227_143022_1a2b3c4d
+    uv run python -m drupal_editor.cli summary --file logs/job.ndjson --max-chars 3500
+
+    # Export stored changes for analytics (needs `uv sync --extra analytics`)
+    uv run python -m drupal_editor.cli export --out exports/changes.parquet --days 90
+
+    # Merge the per-worker shards of a multi-process job
+    uv run python -m drupal_editor.cli merge-shards --dir logs/shards --session 20251227_143022_1a2b3c4d --out logs/job.ndjson
 """
 
 from __future__ import annotations
@@ -27,6 +39,8 @@ from dotenv import load_dotenv
 
 console = Console()
 
+DEFAULT_STORE_PATH = "logs/changes.db"
+
 
 def main():
     """Main entry point."""
@@ -38,6 +52,7 @@ def main():
     )
 
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
+    default_db = os.getenv("DRUPAL_EDITOR_DB", DEFAULT_STORE_PATH)
 
     # update-node command
     update_parser = subparsers.add_parser("update-node", help="Update a node field")
@@ -45,7 +60,7 @@ def main():
     update_parser.add_argument("--field", required=True, help="Field name (e.g., body, title)")
     update_parser.add_argument("--value", required=True, help="New value for the field")
     update_parser.add_argument("--reason", default="Ava: Updated content", help="Reason for change")
-    update_parser.add_argument("--auth", choices=["terminus", "playwright"], help="Auth method (auto-detect if not specified)")
+    update_parser.add_argument("--auth", choices=["terminus", "playwright", "rest"], help="Auth method (auto-detect if not specified)")
     update_parser.add_argument("--site", help="Pantheon site name (for Terminus)")
     update_parser.add_argument("--env", default="live", help="Pantheon environment (default: live)")
 
@@ -56,25 +71,56 @@ def main():
     replace_parser.add_argument("--find", required=True, help="Text to find")
     replace_parser.add_argument("--replace", required=True, help="Replacement text")
     replace_parser.add_argument("--reason", default="Ava: Text replacement", help="Reason for change")
-    replace_parser.add_argument("--auth", choices=["terminus", "playwright"], help="Auth method")
+    replace_parser.add_argument("--auth", choices=["terminus", "playwright", "rest"], help="Auth method")
     replace_parser.add_argument("--site", help="Pantheon site name")
     replace_parser.add_argument("--env", default="live", help="Pantheon environment")
 
     # get-node command
     get_parser = subparsers.add_parser("get-node", help="Get node information")
     get_parser.add_argument("--nid", type=int, required=True, help="Node ID")
-    get_parser.add_argument("--auth", choices=["terminus", "playwright"], help="Auth method")
+    get_parser.add_argument("--auth", choices=["terminus", "playwright", "rest"], help="Auth method")
     get_parser.add_argument("--site", help="Pantheon site name")
     get_parser.add_argument("--env", default="live", help="Pantheon environment")
 
     # test-auth command
     auth_parser = subparsers.add_parser("test-auth", help="Test authentication")
-    auth_parser.add_argument("--auth", choices=["terminus", "playwright"], help="Auth method to test")
+    auth_parser.add_argument("--auth", choices=["terminus", "playwright", "rest"], help="Auth method to test")
     auth_parser.add_argument("--site", help="Pantheon site name (for Terminus)")
     auth_parser.add_argument("--env", default="live", help="Pantheon environment")
 
     # summary command
-    subparsers.add_parser("summary", help="Show summary of changes made this session")
+    summary_parser = subparsers.add_parser("summary", help="Show summary of a stored session (default: latest)")
+    summary_parser.add_argument("--session", help="Session ID")
+    summary_parser.add_argument("--file", help="Summarize an NDJSON changelog instead of the store")
+    summary_parser.add_argument("--max-chars", type=int, default=3500, help="Split into messages of this size")
+    summary_parser.add_argument("--db", default=default_db, help="Change store path")
+
+    # history command
+    history_parser = subparsers.add_parser("history", help="List stored changes")
+    history_parser.add_argument("--target", help="Target, e.g. node/123")
+    history_parser.add_argument("--operation", help="Operation, e.g. update_node")
+    history_parser.add_argument("--days", type=float, help="Only the last N days")
+    history_parser.add_argument("--failed", action="store_true", help="Only failed changes")
+    history_parser.add_argument("--limit", type=int, default=50, help="Maximum changes (default: 50)")
+    history_parser.add_argument("--db", default=default_db, help="Change store path")
+
+    # stats command
+    stats_parser = subparsers.add_parser("stats", help="Failure rate by operation")
+    stats_parser.add_argument("--days", type=float, default=7, help="Only the last N days (default: 7)")
+    stats_parser.add_argument("--db", default=default_db, help="Change store path")
+
+    # export command
+    export_parser = subparsers.add_parser("export", help="Export stored changes to Parquet or Arrow")
+    export_parser.add_argument("--out", required=True, help="Output file (.parquet, or .arrow for Arrow IPC)")
+    export_parser.add_argument("--days", type=float, help="Only the last N days")
+    export_parser.add_argument("--session", help="Only this session")
+    export_parser.add_argument("--db", default=default_db, help="Change store path")
+
+    # merge-shards command
+    merge_parser = subparsers.add_parser("merge-shards", help="Merge per-worker changelog shards")
+    merge_parser.add_argument("--dir", required=True, help="Shard directory")
+    merge_parser.add_argument("--session", required=True, help="Session ID shared by the workers")
+    merge_parser.add_argument("--out", help="Merged NDJSON file (omit to only print the summary)")
 
     args = parser.parse_args()
 
@@ -94,8 +140,18 @@ async def run_command(args):
         await test_auth(args)
         return
 
-    if args.command == "summary":
-        console.print("[yellow]No changes in this session[/yellow]")
+    if args.command == "summary" and args.file:
+        from drupal_editor.tracking.summary import StreamingSummary
+
+        print_pages(StreamingSummary.from_ndjson(args.file).pages(args.max_chars))
+        return
+
+    if args.command in ("summary", "history", "stats", "export"):
+        show_stored(args)
+        return
+
+    if args.command == "merge-shards":
+        merge_shards(args)
         return
 
     # Create client based on args
@@ -103,6 +159,9 @@ async def run_command(args):
     if not client:
         sys.exit(1)
 
+    # Keep every change for the history/stats/summary commands
+    client.changelog.store_to(os.getenv("DRUPAL_EDITOR_DB", DEFAULT_STORE_PATH))
+
     try:
         if args.command == "update-node":
             await update_node(client, args)
@@ -119,6 +178,14 @@ async def run_command(args):
 
     finally:
         await client.close()
+        await _stop_shared_browser()
+
+
+async def _stop_shared_browser():
+    """Stop the shared Playwright browser, if one was started, before exiting."""
+    from drupal_editor.auth.browser_manager import BrowserManager
+
+    await BrowserManager.shutdown_all()
 
 
 async def create_client(args):
@@ -149,6 +216,21 @@ async def create_client(args):
         console.print(f"[blue]Using Terminus auth for {site}.{env}[/blue]")
         return DrupalClient.with_terminus(site_name=site, env=env)
 
+    elif auth_method == "rest" or (auth_method is None and os.getenv("DRUPAL_API_AUTH")):
+        base_url = os.getenv("DRUPAL_BASE_URL")
+        if not base_url:
+            console.print("[red]Error: DRUPAL_BASE_URL required for REST[/red]")
+            return None
+
+        console.print(f"[blue]Using REST auth for {base_url}[/blue]")
+        return DrupalClient.with_rest(
+            base_url=base_url,
+            auth_type=os.getenv("DRUPAL_API_AUTH", "cookie"),
+            username=os.getenv("DRUPAL_USERNAME"),
+            password=os.getenv("DRUPAL_PASSWORD"),
+            token=os.getenv("DRUPAL_API_TOKEN"),
+        )
+
     elif auth_method == "playwright" or auth_method is None:
         base_url = os.getenv("DRUPAL_BASE_URL")
         username = os.getenv("DRUPAL_USERNAME")
@@ -172,6 +254,7 @@ async def test_auth(args):
     """Test authentication."""
     from drupal_editor.auth.terminus import TerminusAuth
     from drupal_editor.auth.playwright import PlaywrightAuth
+    from drupal_editor.auth.rest import RestAuth
 
     auth_method = args.auth
 
@@ -194,6 +277,24 @@ async def test_auth(args):
                 console.print("[red]Terminus authentication failed[/red]")
             return
 
+    if auth_method == "rest":
+        base_url = os.getenv("DRUPAL_BASE_URL")
+        if base_url:
+            console.print(f"[yellow]Testing REST auth for {base_url}...[/yellow]")
+            auth = RestAuth(
+                base_url=base_url,
+                auth_type=os.getenv("DRUPAL_API_AUTH", "cookie"),
+                username=os.getenv("DRUPAL_USERNAME"),
+                password=os.getenv("DRUPAL_PASSWORD"),
+                token=os.getenv("DRUPAL_API_TOKEN"),
+            )
+            if await auth.authenticate():
+                console.print("[green]REST authentication successful![/green]")
+            else:
+                console.print("[red]REST authentication failed[/red]")
+            await auth.close()
+            return
+
     if auth_method == "playwright" or auth_method is None:
         base_url = os.getenv("DRUPAL_BASE_URL")
         username = os.getenv("DRUPAL_USERNAME")
@@ -213,11 +314,105 @@ async def test_auth(args):
             else:
                 console.print("[red]Playwright authentication failed[/red]")
             await auth.close()
+            await _stop_shared_browser()
             return
 
     console.print("[red]No valid auth configuration found[/red]")
 
 
+def merge_shards(args):
+    """Merge the shards of a session into one log and print its summary."""
+    from drupal_editor.tracking import shards
+
+    paths = shards.find_shards(args.dir, args.session)
+    if not paths:
+        console.print(f"[yellow]No shards for session {args.session} in {args.dir}[/yellow]")
+        return
+
+    result = shards.merge_shards(paths, output=args.out, session_id=args.session)
+    if args.out:
+        console.print(f"[green]Merged {result.records} changes from {result.shards} shards into {args.out}[/green]")
+    print_pages(result.pages())
+
+
+def print_pages(pages: list[str]) -> None:
+    """Print summary pages separated by rules."""
+    for i, page in enumerate(pages):
+        if i:
+            console.rule()
+        console.print(page)
+
+
+def show_stored(args):
+    """Run the summary, history, stats and export commands against the change store."""
+    from drupal_editor.tracking.store import ChangeStore
+    from drupal_editor.tracking.summary import StreamingSummary
+
+    if not os.path.exists(args.db):
+        console.print(f"[yellow]No change store at {args.db}[/yellow]")
+        return
+
+    with ChangeStore(args.db) as store:
+        if args.command == "summary":
+            session_id = args.session
+            if session_id is None:
+                sessions = store.sessions(limit=1)
+                if not sessions:
+                    console.print("[yellow]No changes recorded[/yellow]")
+                    return
+                session_id = sessions[0].session_id
+
+            # Streamed from the database; the session is never loaded whole
+            summary = StreamingSummary(session_id=session_id)
+            for record in store.iter_history(session_id=session_id):
+                summary.add(record)
+            print_pages(summary.pages(args.max_chars))
+
+        elif args.command == "history":
+            records = store.history(
+                target=args.target,
+                operation=args.operation,
+                success=False if args.failed else None,
+                days=args.days,
+                limit=args.limit,
+            )
+            if not records:
+                console.print("[yellow]No matching changes[/yellow]")
+                return
+            for record in records:
+                status = "[green]ok[/green]" if record.success else f"[red]failed: {record.error}[/red]"
+                console.print(
+                    f"{record.timestamp:%Y-%m-%d %H:%M} {record.target} {record.operation} "
+                    f"{record.field} - {record.reason} {status}"
+                )
+                if record.revision_url:
+                    console.print(f"  [dim]{record.revision_url}[/dim]")
+
+        elif args.command == "stats":
+            stats = store.failure_rates(days=args.days)
+            if not stats:
+                console.print(f"[yellow]No changes in the last {args.days:g} days[/yellow]")
+                return
+            for row in stats:
+                color = "red" if row.failed else "green"
+                console.print(
+                    f"{row.operation}: {row.total} changes, "
+                    f"[{color}]{row.failed} failed ({row.failure_rate:.1%})[/{color}]"
+                )
+
+        elif args.command == "export":
+            from drupal_editor.tracking.columnar import write_arrow, write_parquet
+
+            write = write_arrow if args.out.endswith((".arrow", ".feather")) else write_parquet
+            records = store.iter_history(session_id=args.session, days=args.days, with_session=True)
+            try:
+                count = write(records, args.out)
+            except ImportError as e:
+                console.print(f"[red]{e}[/red]")
+                return
+            console.print(f"[green]Exported {count} changes to {args.out}[/green]")
+
+
 async def update_node(client, args):
     """Update a node field."""
     console.print(f"\n[yellow]Updating node/{args.nid} field '{args.field}'...[/yellow]")
@@ -1,26 +1,25 @@
 """
 Main DrupalClient - facade for making changes to Drupal sites.
 
-Supports two authentication backends:
+Supports three authentication backends:
 1. Terminus/Drush (PRIMARY) - for Pantheon-hosted sites with CLI access
-2. Playwright (FALLBACK) - browser automation for any Drupal site
+2. REST/JSON:API - for sites with the core rest/jsonapi modules enabled
+3. Playwright (FALLBACK) - browser automation for any Drupal site
 """
 
 from __future__ import annotations
 
+import asyncio
 import os
-from typing import TYPE_CHECKING
 
 from drupal_editor.auth.terminus import TerminusAuth
 from drupal_editor.auth.playwright import PlaywrightAuth
+from drupal_editor.auth.rest import RestAuth
 from drupal_editor.operations.nodes import NodeEditor
 from drupal_editor.operations.taxonomy import TaxonomyManager
 from drupal_editor.operations.media import MediaEditor
 from drupal_editor.tracking.changelog import ChangeLog
 
-if TYPE_CHECKING:
-    pass
-
 
 class DrupalClient:
     """
@@ -33,6 +32,7 @@ class DrupalClient:
         # Or explicitly choose
         client = DrupalClient.with_terminus(site_name="savas-labs")
         client = DrupalClient.with_playwright(base_url="https://example.com", username="admin", password="...")
+        client = DrupalClient.with_rest(base_url="https://example.com", auth_type="basic", username="agent", password="...")
 
         # Make changes
         revision = await client.nodes.create_draft_revision(
@@ -44,7 +44,7 @@ class DrupalClient:
 
     def __init__(
         self,
-        auth: TerminusAuth | PlaywrightAuth,
+        auth: TerminusAuth | PlaywrightAuth | RestAuth,
         changelog: ChangeLog | None = None,
     ):
         self.auth = auth
@@ -61,7 +61,7 @@ class DrupalClient:
         Auto-detect authentication method from environment.
 
         Checks for Terminus credentials first (PANTHEON_MACHINE_TOKEN + PANTHEON_SITE),
-        falls back to Playwright if not available.
+        then REST (DRUPAL_API_AUTH set), and falls back to Playwright.
         """
         pantheon_token = os.getenv("PANTHEON_MACHINE_TOKEN")
         pantheon_site = os.getenv("PANTHEON_SITE")
@@ -72,11 +72,20 @@ class DrupalClient:
                 env=os.getenv("PANTHEON_ENV", "live"),
             )
 
-        # Fallback to Playwright
         base_url = os.getenv("DRUPAL_BASE_URL")
         username = os.getenv("DRUPAL_USERNAME")
         password = os.getenv("DRUPAL_PASSWORD")
 
+        api_auth = os.getenv("DRUPAL_API_AUTH")
+        if base_url and api_auth:
+            return cls.with_rest(
+                base_url=base_url,
+                auth_type=api_auth,
+                username=username,
+                password=password,
+                token=os.getenv("DRUPAL_API_TOKEN"),
+            )
+
         if base_url and username and password:
             return cls.with_playwright(
                 base_url=base_url,
@@ -87,6 +96,7 @@ class DrupalClient:
         raise ValueError(
             "No valid authentication found. Set either:\n"
             "  - PANTHEON_MACHINE_TOKEN + PANTHEON_SITE (for Terminus)\n"
+            "  - DRUPAL_BASE_URL + DRUPAL_API_AUTH (+ credentials) (for REST)\n"
             "  - DRUPAL_BASE_URL + DRUPAL_USERNAME + DRUPAL_PASSWORD (for Playwright)"
         )
 
@@ -106,12 +116,51 @@ class DrupalClient:
         base_url: str,
         username: str,
         password: str,
+        pool_size: int = 1,
+        screenshot_policy: str = "always",
+        form_post: bool = False,
     ) -> DrupalClient:
-        """Create client using Playwright browser automation."""
+        """
+        Create client using Playwright browser automation.
+
+        Set pool_size > 1 to run that many node edits in parallel tabs.
+        screenshot_policy is one of "off", "on_failure", "always", "field".
+        form_post=True submits plain fields as HTTP form posts using the
+        session cookies, only rendering pages for JS-only widgets.
+        """
         auth = PlaywrightAuth(
             base_url=base_url,
             username=username,
             password=password,
+            pool_size=pool_size,
+            screenshot_policy=screenshot_policy,
+            form_post=form_post,
+        )
+        return cls(auth=auth)
+
+    @classmethod
+    def with_rest(
+        cls,
+        base_url: str,
+        auth_type: str = "cookie",
+        username: str | None = None,
+        password: str | None = None,
+        token: str | None = None,
+        allow_in_place: bool = False,
+    ) -> DrupalClient:
+        """
+        Create client using the core REST / JSON:API backend.
+
+        auth_type is "basic", "cookie" or "oauth". Node saves are refused
+        unless a new revision is guaranteed, or allow_in_place is set.
+        """
+        auth = RestAuth(
+            base_url=base_url,
+            auth_type=auth_type,
+            username=username,
+            password=password,
+            token=token,
+            allow_in_place=allow_in_place,
         )
         return cls(auth=auth)
 
@@ -122,6 +171,8 @@ class DrupalClient:
     async def close(self) -> None:
         """Clean up resources."""
         await self.auth.close()
+        # Joins the changelog's writer thread; keep it off the event loop
+        await asyncio.to_thread(self.changelog.close)
 
     def get_summary(self) -> str:
         """Get a summary of all changes made."""
@@ -132,6 +183,4 @@ class DrupalClient:
     @property
     def auth_method(self) -> str:
         """Return the authentication method being used."""
-        if isinstance(self.auth, TerminusAuth):
-            return "terminus"
-        return "playwright"
+        return self.auth.auth_method
@@ -0,0 +1,207 @@
+"""
+Parsing of Drupal entity edit forms from raw HTML.
+
+Used by the browserless form-post path: fetch /node/{nid}/edit with the
+Playwright session cookies, read the form state (form_build_id, form_token,
+current field values) and POST it back with the changes applied.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Optional
+
+# Input types whose value is submitted as-is
+_TEXT_INPUT_TYPES = {"text", "hidden", "email", "url", "number", "tel", "search", "date", "time"}
+
+# Drupal error messages (Claro/Olivero and older themes)
+_ERROR_MESSAGES_RE = re.compile(
+    r'<div[^>]*class="[^"]*messages--error[^"]*"[^>]*>(.*?)</div>',
+    re.DOTALL | re.IGNORECASE,
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+@dataclass
+class DrupalForm:
+    """Submittable state of an HTML form."""
+
+    form_id: str
+    action: str
+    values: list[tuple[str, str]] = field(default_factory=list)
+    # name -> "input" | "textarea" | "select" | "checkbox" | "radio" | "submit" | ...
+    controls: dict[str, str] = field(default_factory=dict)
+    submit_values: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def form_build_id(self) -> Optional[str]:
+        return self.get("form_build_id")
+
+    @property
+    def form_token(self) -> Optional[str]:
+        return self.get("form_token")
+
+    def get(self, name: str) -> Optional[str]:
+        """First submitted value for a control name."""
+        for key, value in self.values:
+            if key == name:
+                return value
+        return None
+
+    def resolve_field(self, field_name: str) -> Optional[str]:
+        """
+        Map a field machine name to the plain control that holds its value.
+
+        Returns None when the field is only editable through a JS widget
+        (media library, autocomplete-only, paragraphs, ...).
+        """
+        for name in (f"{field_name}[0][value]", field_name):
+            if self.controls.get(name) in ("input", "textarea", "select"):
+                return name
+        return None
+
+    def set(self, name: str, value: str) -> None:
+        """Replace (or add) the submitted value for a control."""
+        self.values = [(k, v) for k, v in self.values if k != name]
+        self.values.append((name, value))
+
+    def submission(self, op: str = "Save") -> list[tuple[str, str]]:
+        """Form values plus the named submit button, ready to POST."""
+        data = list(self.values)
+        for name, value in self.submit_values.items():
+            if value == op:
+                data.append((name, value))
+                break
+        else:
+            data.append(("op", op))
+        return data
+
+
+class _FormParser(HTMLParser):
+    """Collect controls of the first form whose id matches a pattern."""
+
+    def __init__(self, form_id_pattern: re.Pattern):
+        super().__init__(convert_charrefs=True)
+        self.form_id_pattern = form_id_pattern
+        self.form: Optional[DrupalForm] = None
+        self._in_form = False
+        self._done = False
+        self._textarea: Optional[str] = None
+        self._textarea_text: list[str] = []
+        self._select: Optional[str] = None
+        self._select_multiple = False
+        self._select_values: list[str] = []
+        self._select_first: Optional[str] = None
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        if self._done:
+            return
+        if self._textarea is not None:
+            # Unescaped markup inside a textarea is text, not tags
+            self._textarea_text.append(self.get_starttag_text() or "")
+            return
+        a = {k: (v or "") for k, v in attrs}
+
+        if tag == "form" and not self._in_form:
+            if self.form_id_pattern.search(a.get("id", "")):
+                self._in_form = True
+                self.form = DrupalForm(form_id=a.get("id", ""), action=a.get("action", ""))
+            return
+
+        if not self._in_form or self.form is None:
+            return
+
+        name = a.get("name")
+        if tag == "input" and name:
+            input_type = a.get("type", "text").lower()
+            if "disabled" in a:
+                return
+            if input_type in ("checkbox", "radio"):
+                self.form.controls[name] = input_type
+                if "checked" in a:
+                    self.form.values.append((name, a.get("value", "on")))
+            elif input_type == "submit":
+                self.form.controls[name] = "submit"
+                self.form.submit_values[name] = a.get("value", "")
+            elif input_type in _TEXT_INPUT_TYPES:
+                self.form.controls[name] = "hidden" if input_type == "hidden" else "input"
+                self.form.values.append((name, a.get("value", "")))
+            else:
+                # file uploads and other types we can't reproduce
+                self.form.controls[name] = input_type
+        elif tag == "textarea" and name and "disabled" not in a:
+            self._textarea = name
+            self._textarea_text = []
+        elif tag == "select" and name and "disabled" not in a:
+            self._select = name
+            self._select_multiple = "multiple" in a
+            self._select_values = []
+            self._select_first = None
+        elif tag == "option" and self._select:
+            value = a.get("value", "")
+            if self._select_first is None:
+                self._select_first = value
+            if "selected" in a:
+                if not self._select_multiple:
+                    self._select_values = []
+                self._select_values.append(value)
+        elif tag == "button" and name and a.get("type", "submit") == "submit":
+            self.form.controls[name] = "submit"
+            self.form.submit_values[name] = a.get("value", "")
+
+    def handle_data(self, data: str) -> None:
+        if self._textarea is not None:
+            self._textarea_text.append(data)
+
+    def handle_endtag(self, tag: str) -> None:
+        if not self._in_form or self.form is None:
+            return
+        if self._textarea is not None and tag != "textarea":
+            self._textarea_text.append(f"</{tag}>")
+            return
+        if tag == "textarea" and self._textarea is not None:
+            text = "".join(self._textarea_text)
+            # Browsers drop a single leading newline in textarea content
+            if text.startswith("\n"):
+                text = text[1:]
+            self.form.controls[self._textarea] = "textarea"
+            self.form.values.append((self._textarea, text))
+            self._textarea = None
+        elif tag == "select" and self._select is not None:
+            self.form.controls[self._select] = "select"
+            values = self._select_values
+            # A single select without a selected option submits its first
+            # option; a multiple select submits nothing
+            if not values and not self._select_multiple and self._select_first is not None:
+                values = [self._select_first]
+            for value in values:
+                self.form.values.append((self._select, value))
+            self._select = None
+        elif tag == "form":
+            self._in_form = False
+            self._done = True
+
+
+def parse_form(html: str, form_id_pattern: str = r"^node-.+-(edit-)?form$") -> Optional[DrupalForm]:
+    """
+    Parse the first form whose id matches `form_id_pattern`.
+
+    Returns None if no such form is on the page (e.g. access denied,
+    or the session cookies were not accepted).
+    """
+    parser = _FormParser(re.compile(form_id_pattern))
+    parser.feed(html)
+    parser.close()
+    return parser.form
+
+
+def extract_error_messages(html: str) -> list[str]:
+    """Return the text of Drupal error messages on a page."""
+    messages = []
+    for match in _ERROR_MESSAGES_RE.finditer(html):
+        text = " ".join(_TAG_RE.sub(" ", match.group(1)).split())
+        if text:
+            messages.append(text)
+    return messages
@@ -6,18 +6,31 @@ Primarily used for updating alt text on images.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
-from dataclasses import dataclass
+import base64
+import json
+from typing import TYPE_CHECKING, AsyncIterator, Optional
+from dataclasses import dataclass, field
 
 from rich.console import Console
 
 if TYPE_CHECKING:
     from drupal_editor.auth.terminus import TerminusAuth
     from drupal_editor.auth.playwright import PlaywrightAuth
+    from drupal_editor.auth.rest import RestAuth
     from drupal_editor.tracking.changelog import ChangeLog
 
 console = Console()
 
+# Alt values that say nothing about the image
+PLACEHOLDER_ALTS = (
+    "image", "img", "photo", "picture", "graphic", "placeholder",
+    "alt", "alt text", "untitled", "default", "thumbnail", "banner",
+)
+
+# Alt values that look like a file name rather than a description
+FILENAME_EXTENSIONS = ("jpg", "jpeg", "png", "gif", "webp", "svg", "tif", "tiff", "bmp", "heic")
+CAMERA_PREFIXES = ("IMG_", "IMG-", "DSC_", "DSC0", "DCIM", "PXL_", "Screenshot", "Screen Shot")
+
 
 @dataclass
 class MediaUpdate:
@@ -27,6 +40,22 @@ class MediaUpdate:
     success: bool
     revision_url: Optional[str] = None
     error: Optional[str] = None
+    previous_alt: Optional[str] = None
+
+
+@dataclass
+class MediaAltIssue:
+    """An image media entity whose alt text needs attention."""
+
+    mid: int
+    bundle: str
+    issue: str  # "empty", "placeholder" or "filename"
+    alt: str
+    file_uri: str
+    width: Optional[int] = None
+    height: Optional[int] = None
+    filesize: Optional[int] = None
+    referencing_nids: list[int] = field(default_factory=list)
 
 
 class MediaEditor:
@@ -38,7 +67,7 @@ class MediaEditor:
 
     def __init__(
         self,
-        auth: "TerminusAuth | PlaywrightAuth",
+        auth: "TerminusAuth | PlaywrightAuth | RestAuth",
         changelog: "ChangeLog",
     ):
         self.auth = auth
@@ -61,13 +90,169 @@ class MediaEditor:
         Returns:
             MediaUpdate with success status
         """
+        from drupal_editor.auth.rest import RestAuth
         from drupal_editor.auth.terminus import TerminusAuth
 
         if isinstance(self.auth, TerminusAuth):
             return await self._update_via_drush(mid, alt_text, reason)
+        elif isinstance(self.auth, RestAuth):
+            return await self._update_via_rest(mid, alt_text, reason)
         else:
             return await self._update_via_browser(mid, alt_text, reason)
 
+    async def update_alt_texts(
+        self,
+        alt_texts: dict[int, str],
+        reason: str,
+        chunk_size: int = 50,
+    ) -> dict[int, MediaUpdate]:
+        """
+        Update alt text on many media entities.
+
+        With Terminus, each chunk is loaded with loadMultiple() and saved in
+        a single php:eval, instead of one Drush round trip per media item.
+        Other backends update the items one by one.
+
+        Args:
+            alt_texts: Mapping of media ID to new alt text
+            reason: Reason for the change (used as the revision log message)
+            chunk_size: Media entities per remote execution
+
+        Returns:
+            Mapping of media ID to MediaUpdate (with previous_alt on success)
+        """
+        from drupal_editor.auth.terminus import TerminusAuth
+
+        if not isinstance(self.auth, TerminusAuth):
+            results = {}
+            for mid, alt_text in alt_texts.items():
+                results[mid] = await self.update_alt_text(mid, alt_text, reason)
+            return results
+
+        auth: TerminusAuth = self.auth  # type: ignore
+        site_url = await auth.get_site_url()
+
+        items = list(alt_texts.items())
+        results: dict[int, MediaUpdate] = {}
+
+        for start in range(0, len(items), chunk_size):
+            chunk = items[start:start + chunk_size]
+            console.print(
+                f"[yellow]Updating alt text for media {start + 1}-{start + len(chunk)} of {len(items)}...[/yellow]"
+            )
+            responses = await self._update_chunk_via_drush(chunk, reason)
+
+            for mid, alt_text in chunk:
+                response = responses.get(mid, {"success": False, "error": "No result returned"})
+                if not response.get("success"):
+                    error = response.get("error", "Unknown error")
+                    self._record_failure(mid, alt_text, reason, error)
+                    results[mid] = MediaUpdate(mid=mid, success=False, error=error)
+                    continue
+
+                revision_url = f"{site_url}/media/{mid}/edit"
+                previous_alt = response.get("previous_alt") or ""
+                self.changelog.record(
+                    auth_method="terminus",
+                    operation="update_media",
+                    target=f"media/{mid}",
+                    field="alt",
+                    old_value=previous_alt,
+                    new_value=alt_text,
+                    reason=reason,
+                    revision_url=revision_url,
+                    success=True,
+                )
+                results[mid] = MediaUpdate(
+                    mid=mid,
+                    success=True,
+                    revision_url=revision_url,
+                    previous_alt=previous_alt,
+                )
+
+        succeeded = sum(1 for r in results.values() if r.success)
+        console.print(f"[green]Updated alt text on {succeeded}/{len(items)} media items[/green]")
+        return results
+
+    async def _update_chunk_via_drush(
+        self,
+        chunk: list[tuple[int, str]],
+        reason: str,
+    ) -> dict[int, dict]:
+        """
+        Set alt text on one chunk of media entities in a single php:eval.
+
+        Returns the per-mid response dicts; on a failed execution every mid
+        in the chunk gets the same error.
+        """
+        auth: TerminusAuth = self.auth  # type: ignore
+
+        # Base64 JSON avoids quoting problems with arbitrary alt text
+        payload = base64.b64encode(
+            json.dumps({"items": [[mid, alt] for mid, alt in chunk], "reason": reason}).encode()
+        ).decode()
+
+        php_code = f"""
+$payload = json_decode(base64_decode('{payload}'), TRUE);
+$storage = \\Drupal::entityTypeManager()->getStorage('media');
+$mids = array_map(function ($item) {{ return $item[0]; }}, $payload['items']);
+$entities = $storage->loadMultiple($mids);
+$results = [];
+
+foreach ($payload['items'] as [$mid, $alt]) {{
+    $media = $entities[$mid] ?? NULL;
+    if (!$media) {{
+        $results[] = ['mid' => $mid, 'success' => false, 'error' => 'Media not found'];
+        continue;
+    }}
+
+    $source_field = $media->getSource()->getConfiguration()['source_field'] ?? 'field_media_image';
+    if (!$media->hasField($source_field) || $media->get($source_field)->isEmpty()) {{
+        $results[] = ['mid' => $mid, 'success' => false, 'error' => 'No image field found'];
+        continue;
+    }}
+
+    $item = $media->get($source_field)->first();
+    $previous_alt = $item->alt;
+    $item->alt = $alt;
+
+    if ($media->getEntityType()->isRevisionable()) {{
+        $media->setNewRevision(TRUE);
+        $media->setRevisionLogMessage($payload['reason']);
+    }}
+
+    try {{
+        $media->save();
+        $results[] = [
+            'mid' => $mid,
+            'success' => true,
+            'previous_alt' => $previous_alt,
+            'revision_id' => $media->getRevisionId() ?? $media->id(),
+        ];
+    }} catch (\\Exception $e) {{
+        $results[] = ['mid' => $mid, 'success' => false, 'error' => $e->getMessage()];
+    }}
+}}
+
+// Keep memory flat across chunks
+$storage->resetCache($mids);
+print json_encode(['success' => true, 'results' => $results]);
+"""
+        result = await auth.php_eval(php_code)
+        mids = [mid for mid, _ in chunk]
+
+        if not result.success:
+            error = f"Drush failed: {result.stderr}"
+            return {mid: {"success": False, "error": error} for mid in mids}
+
+        try:
+            response = json.loads(result.stdout.strip())
+        except Exception:
+            error = f"Invalid response: {result.stdout}"
+            return {mid: {"success": False, "error": error} for mid in mids}
+
+        return {int(item["mid"]): item for item in response.get("results", [])}
+
     async def _update_via_drush(
         self,
         mid: int,
@@ -98,6 +283,7 @@ if (!$media->hasField($source_field)) {{
 }}
 
 // Update alt text
+$previous_alt = $media->get($source_field)->alt;
 $media->get($source_field)->alt = '{alt_escaped}';
 
 // Create new revision if revision support exists
@@ -111,6 +297,7 @@ try {{
     print json_encode([
         'success' => true,
         'mid' => $media->id(),
+        'previous_alt' => $previous_alt,
         'revision_id' => $media->getRevisionId() ?? $media->id(),
     ]);
 }} catch (\\Exception $e) {{
@@ -125,7 +312,6 @@ try {{
             return MediaUpdate(mid=mid, success=False, error=error)
 
         try:
-            import json
             response = json.loads(result.stdout.strip())
         except Exception:
             error = f"Invalid response: {result.stdout}"
@@ -146,7 +332,44 @@ try {{
             operation="update_media",
             target=f"media/{mid}",
             field="alt",
-            old_value="(previous alt)",
+            old_value=response.get("previous_alt") or "",
+            new_value=alt_text,
+            reason=reason,
+            revision_url=revision_url,
+            success=True,
+        )
+
+        console.print(f"[green]Updated alt text for media/{mid}[/green]")
+
+        return MediaUpdate(
+            mid=mid,
+            success=True,
+            revision_url=revision_url,
+            previous_alt=response.get("previous_alt"),
+        )
+
+    async def _update_via_rest(
+        self,
+        mid: int,
+        alt_text: str,
+        reason: str,
+    ) -> MediaUpdate:
+        """Update alt text via a REST PATCH."""
+        auth: RestAuth = self.auth  # type: ignore
+
+        response = await auth.update_media_alt(mid, alt_text, reason)
+        if not response.get("success"):
+            error = response.get("error", "Unknown error")
+            self._record_failure(mid, alt_text, reason, error)
+            return MediaUpdate(mid=mid, success=False, error=error)
+
+        revision_url = f"{auth.base_url}/media/{mid}/edit"
+        self.changelog.record(
+            auth_method="rest",
+            operation="update_media",
+            target=f"media/{mid}",
+            field="alt",
+            old_value=response.get("previous_alt", ""),
             new_value=alt_text,
             reason=reason,
             revision_url=revision_url,
@@ -155,7 +378,12 @@ try {{
 
         console.print(f"[green]Updated alt text for media/{mid}[/green]")
 
-        return MediaUpdate(mid=mid, success=True, revision_url=revision_url)
+        return MediaUpdate(
+            mid=mid,
+            success=True,
+            revision_url=revision_url,
+            previous_alt=response.get("previous_alt"),
+        )
 
     async def _update_via_browser(
         self,
@@ -177,7 +405,7 @@ try {{
     ) -> None:
         """Record failed update."""
         self.changelog.record(
-            auth_method="terminus" if hasattr(self.auth, "drush") else "playwright",
+            auth_method=self.auth.auth_method,
             operation="update_media",
             target=f"media/{mid}",
             field="alt",
@@ -187,3 +415,208 @@ try {{
             success=False,
             error=error,
         )
+
+    async def iter_missing_alt(
+        self,
+        bundles: Optional[list[str]] = None,
+        page_size: int = 500,
+        placeholders: tuple[str, ...] = PLACEHOLDER_ALTS,
+    ) -> AsyncIterator[list[MediaAltIssue]]:
+        """
+        Stream image media whose alt text is empty, a file name or a placeholder.
+
+        Runs one database query per page on the server (no entity loads),
+        paging by media ID, and also reports which nodes reference each
+        media item through entity reference fields. Only the default
+        translation of each media item is checked. Requires Terminus.
+
+        Args:
+            bundles: Media types to audit (default: every image-sourced type)
+            page_size: Media items per page
+            placeholders: Lowercase alt values treated as placeholders
+
+        Yields:
+            Lists of MediaAltIssue, one list per page, ordered by mid
+        """
+        from drupal_editor.auth.terminus import TerminusAuth
+
+        if not isinstance(self.auth, TerminusAuth):
+            console.print("[yellow]Media alt audit is only supported via Terminus[/yellow]")
+            return
+
+        auth: TerminusAuth = self.auth  # type: ignore
+        placeholders = tuple(p.lower() for p in placeholders)
+        after_mid = 0
+
+        while True:
+            payload = base64.b64encode(json.dumps({
+                "bundles": bundles or [],
+                "after": after_mid,
+                "limit": page_size,
+                "placeholders": list(placeholders),
+                "extensions": list(FILENAME_EXTENSIONS),
+                "prefixes": list(CAMERA_PREFIXES),
+            }).encode()).decode()
+
+            php_code = _MISSING_ALT_PHP.replace("__PAYLOAD__", payload)
+            result = await auth.php_eval(php_code)
+
+            if not result.success:
+                console.print(f"[red]Media alt audit failed: {result.stderr}[/red]")
+                return
+
+            try:
+                response = json.loads(result.stdout.strip())
+            except Exception:
+                console.print(f"[red]Invalid response: {result.stdout[:200]}[/red]")
+                return
+
+            if not response.get("success"):
+                console.print(f"[red]Media alt audit failed: {response.get('error', 'Unknown error')}[/red]")
+                return
+
+            page = [
+                MediaAltIssue(
+                    mid=int(row["mid"]),
+                    bundle=row["bundle"],
+                    issue=_classify_alt(row.get("alt"), placeholders),
+                    alt=row.get("alt") or "",
+                    file_uri=row.get("uri") or "",
+                    width=_int_or_none(row.get("width")),
+                    height=_int_or_none(row.get("height")),
+                    filesize=_int_or_none(row.get("filesize")),
+                    referencing_nids=[int(nid) for nid in row.get("nids", [])],
+                )
+                for row in response.get("items", [])
+            ]
+            if page:
+                yield page
+
+            next_mid = response.get("next")
+            if not next_mid:
+                return
+            after_mid = int(next_mid)
+
+
+def _classify_alt(alt: Optional[str], placeholders: tuple[str, ...]) -> str:
+    """Label why an alt value was flagged by the audit query."""
+    text = (alt or "").strip()
+    if not text:
+        return "empty"
+    if text.lower() in placeholders:
+        return "placeholder"
+    return "filename"
+
+
+def _int_or_none(value) -> Optional[int]:
+    return int(value) if value not in (None, "") else None
+
+
+# One page of the media alt audit. Reads the image field tables directly
+# (through the table mapping, so custom field names work) and joins
+# file_managed for the file details.
+_MISSING_ALT_PHP = r"""
+$payload = json_decode(base64_decode('__PAYLOAD__'), TRUE);
+$etm = \Drupal::entityTypeManager();
+$efm = \Drupal::service('entity_field.manager');
+$db = \Drupal::database();
+
+// Image-sourced media types, grouped by source field
+$fields = [];
+$types = $etm->getStorage('media_type')->loadMultiple($payload['bundles'] ?: NULL);
+foreach ($types as $type) {
+    $source = $type->getSource();
+    if ($source->getPluginId() !== 'image') {
+        continue;
+    }
+    $fields[$source->getConfiguration()['source_field']][] = $type->id();
+}
+
+$media_defs = $efm->getFieldStorageDefinitions('media');
+$media_mapping = $etm->getStorage('media')->getTableMapping();
+$rows = [];
+
+foreach ($fields as $field_name => $bundles) {
+    $def = $media_defs[$field_name] ?? NULL;
+    if (!$def) {
+        continue;
+    }
+    $table = $media_mapping->getDedicatedDataTableName($def);
+    $alt = 'm.' . $media_mapping->getFieldColumnName($def, 'alt');
+
+    $query = $db->select($table, 'm');
+    $query->join('file_managed', 'fm', 'fm.fid = m.' . $media_mapping->getFieldColumnName($def, 'target_id'));
+    $query->join('media_field_data', 'mfd', 'mfd.mid = m.entity_id AND mfd.langcode = m.langcode AND mfd.default_langcode = 1');
+    $query->addField('m', 'entity_id', 'mid');
+    $query->addField('m', 'bundle', 'bundle');
+    $query->addField('m', $media_mapping->getFieldColumnName($def, 'alt'), 'alt');
+    $query->addField('m', $media_mapping->getFieldColumnName($def, 'width'), 'width');
+    $query->addField('m', $media_mapping->getFieldColumnName($def, 'height'), 'height');
+    $query->addField('fm', 'uri', 'uri');
+    $query->addField('fm', 'filesize', 'filesize');
+
+    $missing = $query->orConditionGroup()
+        ->isNull($alt)
+        ->where("TRIM($alt) = ''")
+        ->where("$alt = fm.filename")
+        ->where("LOWER(TRIM($alt)) IN (:placeholders[])", [':placeholders[]' => $payload['placeholders']]);
+    foreach ($payload['extensions'] as $ext) {
+        $missing->condition($alt, '%.' . $db->escapeLike($ext), 'LIKE');
+    }
+    foreach ($payload['prefixes'] as $prefix) {
+        $missing->condition($alt, $db->escapeLike($prefix) . '%', 'LIKE');
+    }
+
+    $query->condition('m.deleted', 0)
+        ->condition('m.delta', 0)
+        ->condition('m.bundle', $bundles, 'IN')
+        ->condition('m.entity_id', $payload['after'], '>')
+        ->condition($missing)
+        ->orderBy('m.entity_id')
+        ->range(0, $payload['limit']);
+
+    foreach ($query->execute()->fetchAll(\PDO::FETCH_ASSOC) as $row) {
+        $row['nids'] = [];
+        $rows[(int) $row['mid']] = $row;
+    }
+}
+
+// Merge the per-field pages into one page ordered by mid
+ksort($rows);
+$full = count($rows) >= $payload['limit'];
+$rows = array_slice($rows, 0, $payload['limit'], TRUE);
+
+// Nodes referencing these media items through entity reference fields
+if ($rows) {
+    $node_defs = $efm->getFieldStorageDefinitions('node');
+    $node_mapping = $etm->getStorage('node')->getTableMapping();
+    foreach ($node_defs as $def) {
+        if ($def->getType() !== 'entity_reference'
+            || $def->getSetting('target_type') !== 'media'
+            || !$node_mapping->requiresDedicatedTableStorage($def)) {
+            continue;
+        }
+        $column = $node_mapping->getFieldColumnName($def, 'target_id');
+        $refs = $db->select($node_mapping->getDedicatedDataTableName($def), 'r')
+            ->fields('r', ['entity_id', $column])
+            ->condition('r.' . $column, array_keys($rows), 'IN')
+            ->condition('r.deleted', 0)
+            ->distinct()
+            ->execute();
+        foreach ($refs as $ref) {
+            $rows[(int) $ref->$column]['nids'][] = (int) $ref->entity_id;
+        }
+    }
+}
+
+foreach ($rows as &$row) {
+    $row['nids'] = array_values(array_unique($row['nids']));
+}
+unset($row);
+
+print json_encode([
+    'success' => true,
+    'items' => array_values($rows),
+    'next' => $full && $rows ? array_key_last($rows) : NULL,
+]);
+"""
@@ -16,10 +16,85 @@ from rich.console import Console
 if TYPE_CHECKING:
     from drupal_editor.auth.terminus import TerminusAuth
     from drupal_editor.auth.playwright import PlaywrightAuth
+    from drupal_editor.auth.rest import RestAuth
     from drupal_editor.tracking.changelog import ChangeLog
 
 console = Console()
 
+# Page-side form filler for the Playwright backend. Maps each requested field
+# to its widget (input, textarea, select or CKEditor 5 instance) and fills them
+# all, plus the moderation state and revision log, in a single round trip.
+_FILL_FORM_SCRIPT = """
+({changes, moderationState, reason}) => {
+    const anchor = document.querySelector('form [name="title[0][value]"]');
+    const form = anchor ? anchor.form : document.querySelector('form.node-form');
+    if (!form) {
+        return {error: 'Node edit form not found'};
+    }
+
+    const setValue = (el, value) => {
+        const proto = Object.getPrototypeOf(el);
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+    };
+    const control = (name) => {
+        for (const candidate of [`${name}[0][value]`, name]) {
+            const el = form.elements.namedItem(candidate);
+            if (el && !(el instanceof RadioNodeList)) {
+                return el;
+            }
+        }
+        return null;
+    };
+    const hasOption = (select, value) => Array.from(select.options).some((o) => o.value === value);
+    const editors = (window.Drupal && window.Drupal.CKEditor5Instances) || null;
+
+    const fields = {};
+    for (const [name, value] of Object.entries(changes)) {
+        const el = control(name);
+        if (!el) {
+            fields[name] = 'missing';
+            continue;
+        }
+        const editorId = el.getAttribute('data-ckeditor5-id');
+        const editor = editorId && editors ? editors.get(editorId) : null;
+        if (editor) {
+            // Drupal copies editor data back to the textarea on submit
+            editor.setData(value);
+            setValue(el, value);
+            fields[name] = 'ckeditor5';
+        } else if (el.tagName === 'SELECT') {
+            if (!hasOption(el, value)) {
+                fields[name] = 'invalid_option';
+                continue;
+            }
+            setValue(el, value);
+            fields[name] = 'select';
+        } else {
+            setValue(el, value);
+            fields[name] = el.tagName.toLowerCase();
+        }
+    }
+
+    let moderation = false;
+    const moderationSelect = form.elements.namedItem('moderation_state[0][state]');
+    if (moderationSelect && moderationSelect.tagName === 'SELECT') {
+        moderation = hasOption(moderationSelect, moderationState) ? true : null;
+        if (moderation) {
+            setValue(moderationSelect, moderationState);
+        }
+    }
+
+    const revisionLog = form.elements.namedItem('revision_log[0][value]');
+    if (revisionLog && revisionLog.tagName === 'TEXTAREA') {
+        setValue(revisionLog, reason);
+    }
+
+    return {fields, moderation, revisionLog: Boolean(revisionLog)};
+}
+"""
+
 
 @dataclass
 class DraftRevision:
@@ -45,7 +120,7 @@ class NodeEditor:
 
     def __init__(
         self,
-        auth: "TerminusAuth | PlaywrightAuth",
+        auth: "TerminusAuth | PlaywrightAuth | RestAuth",
         changelog: "ChangeLog",
         moderation_state: str = DEFAULT_MODERATION_STATE,
     ):
@@ -53,7 +128,7 @@ class NodeEditor:
         Initialize node editor.
 
         Args:
-            auth: Authentication backend (Terminus or Playwright)
+            auth: Authentication backend (Terminus, Playwright or REST)
             changelog: Change tracking log
             moderation_state: Moderation state for new revisions (default: ava_suggestion)
         """
@@ -81,10 +156,13 @@ class NodeEditor:
         Returns:
             DraftRevision with revision details
         """
+        from drupal_editor.auth.rest import RestAuth
         from drupal_editor.auth.terminus import TerminusAuth
 
         if isinstance(self.auth, TerminusAuth):
             return await self._via_drush(nid, changes, reason)
+        elif isinstance(self.auth, RestAuth):
+            return await self._via_rest(nid, changes, reason)
         else:
             return await self._via_browser(nid, changes, reason)
 
@@ -250,6 +328,59 @@ try {{
             success=True,
         )
 
+    async def _via_rest(
+        self,
+        nid: int,
+        changes: dict[str, str],
+        reason: str,
+    ) -> DraftRevision:
+        """Create draft revision via a REST PATCH."""
+        auth: RestAuth = self.auth  # type: ignore
+
+        console.print(f"[yellow]Creating draft revision for node/{nid}...[/yellow]")
+        response = await auth.update_node(nid, changes, reason, self.moderation_state)
+
+        if not response.get("success"):
+            error_msg = response.get("error", "Unknown error")
+            self._record_failure(nid, changes, reason, error_msg)
+            return DraftRevision(
+                nid=nid,
+                revision_id=0,
+                moderation_state="",
+                revision_url="",
+                success=False,
+                error=error_msg,
+            )
+
+        revision_id = response["revision_id"]
+        revision_url = f"{auth.base_url}/node/{nid}/revisions/{revision_id}/view"
+        if not response.get("new_revision"):
+            console.print(f"[yellow]node/{nid} was saved in place (allow_in_place), not as a new revision[/yellow]")
+
+        for field_name, new_value in changes.items():
+            self.changelog.record(
+                auth_method="rest",
+                operation="update_node",
+                target=f"node/{nid}",
+                field=field_name,
+                old_value=response["previous"].get(field_name, ""),
+                new_value=new_value,
+                reason=reason,
+                revision_id=revision_id,
+                revision_url=revision_url,
+                success=True,
+            )
+
+        console.print(f"[green]Created revision {revision_id} for node/{nid}[/green]")
+
+        return DraftRevision(
+            nid=nid,
+            revision_id=revision_id,
+            moderation_state=response.get("moderation_state", self.moderation_state),
+            revision_url=revision_url,
+            success=True,
+        )
+
     async def _via_browser(
         self,
         nid: int,
@@ -257,89 +388,98 @@ try {{
         reason: str,
     ) -> DraftRevision:
         """Create draft revision via Playwright browser automation."""
-        from drupal_editor.auth.playwright import PlaywrightAuth
+        from drupal_editor.auth.playwright import MESSAGES_SELECTOR
 
         auth: PlaywrightAuth = self.auth  # type: ignore
 
-        if not auth._authenticated:
-            if not await auth.authenticate():
-                return DraftRevision(
-                    nid=nid,
-                    revision_id=0,
-                    moderation_state="",
-                    revision_url="",
-                    success=False,
-                    error="Failed to authenticate",
-                )
+        if not await auth.ensure_authenticated():
+            return DraftRevision(
+                nid=nid,
+                revision_id=0,
+                moderation_state="",
+                revision_url="",
+                success=False,
+                error="Failed to authenticate",
+            )
+
+        if auth.form_post:
+            revision = await self._via_form_post(nid, changes, reason)
+            if revision is not None:
+                return revision
+            console.print(f"[dim]Falling back to the browser for node/{nid}[/dim]")
 
-        page = auth.page
         edit_url = f"{auth.base_url}/node/{nid}/edit"
 
         console.print(f"[yellow]Opening {edit_url}...[/yellow]")
 
+        # Under the "field" screenshot policy, clip to the first changed field
+        first_field = next(iter(changes), "").replace("_", "-")
+        field_selector = f'[data-drupal-selector="edit-{first_field}-wrapper"]'
+        failure_screenshot = None
+
         try:
-            await page.goto(edit_url, wait_until="domcontentloaded", timeout=30000)
-
-            # Take screenshot before changes
-            before_screenshot = await auth._save_screenshot(f"node_{nid}_before")
-
-            # Apply changes to form fields
-            for field_name, new_value in changes.items():
-                # Try different field selectors
-                selectors = [
-                    f'textarea[name="{field_name}[0][value]"]',
-                    f'input[name="{field_name}[0][value]"]',
-                    f'textarea[name="{field_name}"]',
-                    f'input[name="{field_name}"]',
-                    # CKEditor iframe handling would go here
-                ]
-
-                filled = False
-                for selector in selectors:
-                    try:
-                        element = page.locator(selector)
-                        if await element.count() > 0:
-                            await element.fill(new_value)
-                            filled = True
-                            console.print(f"[dim]Filled {field_name}[/dim]")
-                            break
-                    except Exception:
-                        continue
-
-                if not filled:
-                    console.print(f"[yellow]Warning: Could not find field {field_name}[/yellow]")
-
-            # Set moderation state
-            moderation_selector = 'select[name="moderation_state[0][state]"]'
-            try:
-                moderation_select = page.locator(moderation_selector)
-                if await moderation_select.count() > 0:
-                    await moderation_select.select_option(self.moderation_state)
-                    console.print(f"[dim]Set moderation state: {self.moderation_state}[/dim]")
-            except Exception as e:
-                console.print(f"[yellow]Could not set moderation state: {e}[/yellow]")
-
-            # Set revision log message
-            revision_log_selector = 'textarea[name="revision_log[0][value]"]'
-            try:
-                revision_log = page.locator(revision_log_selector)
-                if await revision_log.count() > 0:
-                    await revision_log.fill(reason)
-            except Exception:
-                pass
-
-            # Submit the form
-            await page.click('input[type="submit"][value="Save"], button[type="submit"]')
-            await page.wait_for_load_state("domcontentloaded")
-
-            # Take screenshot after save
-            after_screenshot = await auth._save_screenshot(f"node_{nid}_after")
-
-            # Try to extract revision ID from URL or page
-            current_url = page.url
-
-            # Look for success message
-            success_message = await page.locator('.messages--status, .messages.status').count() > 0
+            async with auth.checkout_page() as page:
+                try:
+                    await auth.open_edit_form(page, edit_url, fields=changes)
+
+                    # Take screenshot before changes
+                    await auth._save_screenshot(
+                        f"node_{nid}_before", page, clip_selector=field_selector
+                    )
+
+                    # Resolve and fill every field, moderation state and revision
+                    # log in one page-side evaluation
+                    filled = await page.evaluate(
+                        _FILL_FORM_SCRIPT,
+                        {
+                            "changes": changes,
+                            "moderationState": self.moderation_state,
+                            "reason": reason,
+                        },
+                    )
+                    if filled.get("error"):
+                        raise RuntimeError(filled["error"])
+
+                    unfilled = []
+                    for field_name, widget in filled["fields"].items():
+                        if widget in ("missing", "invalid_option"):
+                            console.print(f"[yellow]Warning: Could not fill field {field_name} ({widget})[/yellow]")
+                            unfilled.append(f"{field_name} ({widget})")
+                        else:
+                            console.print(f"[dim]Filled {field_name} ({widget})[/dim]")
+                    # Never save a partial edit that would be recorded as complete
+                    if unfilled:
+                        raise RuntimeError(f"Could not fill {', '.join(unfilled)}; form not submitted")
+                    if filled["moderation"] is None:
+                        # Saving would use the form's default state, possibly Published
+                        raise RuntimeError(
+                            f"Moderation state {self.moderation_state} not offered; form not submitted"
+                        )
+                    if filled["moderation"]:
+                        console.print(f"[dim]Set moderation state: {self.moderation_state}[/dim]")
+
+                    # Submit the form
+                    await page.click('input[type="submit"][value="Save"], button[type="submit"]')
+                    await page.wait_for_selector(MESSAGES_SELECTOR, state="attached", timeout=30000)
+
+                    # Try to extract revision ID from URL or page
+                    current_url = page.url
+
+                    # Look for success message
+                    success_message = await page.locator('.messages--status, .messages.status').count() > 0
+
+                    # Take screenshot after save (or of the failure)
+                    after_screenshot = await auth._save_screenshot(
+                        f"node_{nid}_after" if success_message else f"node_{nid}_failed",
+                        page,
+                        failed=not success_message,
+                        clip_selector=MESSAGES_SELECTOR,
+                    )
+                except Exception:
+                    failure_screenshot = await auth._save_screenshot(
+                        f"node_{nid}_failed", page, failed=True
+                    )
+                    raise
 
             if success_message:
                 # Record success
@@ -368,7 +508,7 @@ try {{
                 )
             else:
                 error_msg = "No success message found after save"
-                self._record_failure(nid, changes, reason, error_msg)
+                self._record_failure(nid, changes, reason, error_msg, after_screenshot)
                 return DraftRevision(
                     nid=nid,
                     revision_id=0,
@@ -380,6 +520,91 @@ try {{
 
         except Exception as e:
             error_msg = str(e)
+            self._record_failure(nid, changes, reason, error_msg, failure_screenshot)
+            return DraftRevision(
+                nid=nid,
+                revision_id=0,
+                moderation_state="",
+                revision_url="",
+                success=False,
+                error=error_msg,
+            )
+
+    async def _via_form_post(
+        self,
+        nid: int,
+        changes: dict[str, str],
+        reason: str,
+    ) -> Optional[DraftRevision]:
+        """
+        Create draft revision by posting the edit form over HTTP.
+
+        Reuses the Playwright session cookies, so no page is rendered.
+        Returns None when the form can't be handled without a browser
+        (a changed field only has a JS widget, or the form didn't load),
+        in which case the caller falls back to _via_browser.
+        """
+        from urllib.parse import urlencode
+
+        from drupal_editor.operations.forms import extract_error_messages, parse_form
+
+        auth: PlaywrightAuth = self.auth  # type: ignore
+        edit_path = f"/node/{nid}/edit"
+
+        try:
+            client = await auth.http_client()
+            response = await client.get(edit_path)
+        except Exception as e:
+            console.print(f"[dim]Form fetch failed for node/{nid}: {e}[/dim]")
+            return None
+
+        if response.status_code != 200:
+            return None
+
+        form = parse_form(response.text)
+        if form is None or not form.form_build_id:
+            return None
+
+        old_values: dict[str, str] = {}
+        for field_name, new_value in changes.items():
+            control = form.resolve_field(field_name)
+            if control is None:
+                console.print(f"[dim]{field_name} needs a JS widget[/dim]")
+                return None
+            old_values[field_name] = form.get(control) or ""
+            form.set(control, new_value)
+
+        if form.controls.get("moderation_state[0][state]") == "select":
+            form.set("moderation_state[0][state]", self.moderation_state)
+        if "revision_log[0][value]" in form.controls:
+            form.set("revision_log[0][value]", reason)
+        if form.controls.get("revision") == "checkbox":
+            form.set("revision", "1")
+
+        console.print(f"[yellow]Posting edit form for node/{nid}...[/yellow]")
+
+        try:
+            response = await client.post(
+                form.action or edit_path,
+                content=urlencode(form.submission()),
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+            )
+        except Exception as e:
+            error_msg = f"Form post failed: {e}"
+            self._record_failure(nid, changes, reason, error_msg)
+            return DraftRevision(
+                nid=nid,
+                revision_id=0,
+                moderation_state="",
+                revision_url="",
+                success=False,
+                error=error_msg,
+            )
+
+        location = response.headers.get("location", "")
+        if response.status_code not in (301, 302, 303) or location.rstrip("/").endswith("/edit"):
+            errors = extract_error_messages(response.text)
+            error_msg = "; ".join(errors) if errors else f"Form post returned HTTP {response.status_code}"
             self._record_failure(nid, changes, reason, error_msg)
             return DraftRevision(
                 nid=nid,
@@ -390,23 +615,50 @@ try {{
                 error=error_msg,
             )
 
+        revision_url = str(response.url.join(location)) if location else f"{auth.base_url}/node/{nid}"
+
+        for field_name, new_value in changes.items():
+            self.changelog.record(
+                auth_method="playwright",
+                operation="update_node",
+                target=f"node/{nid}",
+                field=field_name,
+                old_value=old_values[field_name],
+                new_value=new_value,
+                reason=reason,
+                revision_url=revision_url,
+                success=True,
+            )
+
+        console.print(f"[green]Saved changes to node/{nid} (form post)[/green]")
+
+        return DraftRevision(
+            nid=nid,
+            revision_id=0,  # Not exposed by the form redirect
+            moderation_state=self.moderation_state,
+            revision_url=f"{auth.base_url}/node/{nid}",
+            success=True,
+        )
+
     def _record_failure(
         self,
         nid: int,
         changes: dict[str, str],
         reason: str,
         error: str,
+        screenshot_path: Optional[str] = None,
     ) -> None:
         """Record a failed change attempt."""
         for field_name, new_value in changes.items():
             self.changelog.record(
-                auth_method="terminus" if hasattr(self.auth, "drush") else "playwright",
+                auth_method=self.auth.auth_method,
                 operation="update_node",
                 target=f"node/{nid}",
                 field=field_name,
                 old_value="",
                 new_value=new_value,
                 reason=reason,
+                screenshot_path=screenshot_path,
                 success=False,
                 error=error,
             )
@@ -426,6 +678,7 @@ try {{
         performs the replacement, and creates a draft revision.
         """
         # Get current value
+        from drupal_editor.auth.rest import RestAuth
         from drupal_editor.auth.terminus import TerminusAuth
 
         if isinstance(self.auth, TerminusAuth):
@@ -441,6 +694,10 @@ if ($node && $node->hasField('{field}')) {{
 """
             result = await self.auth.php_eval(php_code)
             current_value = result.stdout if result.success else ""
+        elif isinstance(self.auth, RestAuth):
+            entity = await self.auth.get_entity("node", nid)
+            items = (entity or {}).get(field) or []
+            current_value = str(items[0].get("value") or "") if items else ""
         else:
             # For Playwright, we'd need to extract from the form
             console.print("[yellow]Find/replace via Playwright not fully implemented[/yellow]")
@@ -10,17 +10,24 @@ when the node is saved, so those can be applied automatically.
 
 from __future__ import annotations
 
+import base64
 import json
-from typing import TYPE_CHECKING, Optional
-from dataclasses import dataclass
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Optional
+from dataclasses import dataclass, field
 
 from rich.console import Console
 
 from drupal_editor.operations.nodes import DraftRevision
+from drupal_editor.operations.term_index import VocabularyIndex
+from drupal_editor.operations.term_matcher import TermMatcher
+from drupal_editor.operations.term_tree import TermTree
 
 if TYPE_CHECKING:
     from drupal_editor.auth.terminus import TerminusAuth
     from drupal_editor.auth.playwright import PlaywrightAuth
+    from drupal_editor.auth.rest import RestAuth
     from drupal_editor.tracking.changelog import ChangeLog
 
 console = Console()
@@ -38,6 +45,49 @@ class TaxonomyProposal:
     message: str = ""
 
 
+@dataclass
+class TagDelta:
+    """
+    Tag changes for one node's term reference field.
+
+    Applied in order: replacements (where the old term is present), then
+    removals, then additions. Duplicates are dropped, order otherwise kept.
+    """
+
+    nid: int
+    field_name: str
+    add: list[int] = field(default_factory=list)
+    remove: list[int] = field(default_factory=list)
+    replace: dict[int, int] = field(default_factory=dict)
+
+    def apply(self, tids: list[int]) -> list[int]:
+        """Final list of term IDs after applying this delta to `tids`."""
+        updated = [self.replace.get(tid, tid) for tid in tids]
+        updated = [tid for tid in updated if tid not in self.remove]
+        updated.extend(self.add)
+        return list(dict.fromkeys(updated))
+
+    def to_payload(self) -> dict:
+        return {
+            "nid": self.nid,
+            "field": self.field_name,
+            "add": [int(t) for t in self.add],
+            "remove": [int(t) for t in self.remove],
+            "replace": [[int(o), int(n)] for o, n in self.replace.items()],
+        }
+
+
+@dataclass
+class TermUsage:
+    """Cached result of one term usage aggregate."""
+
+    vocabulary: str
+    by_field: dict[tuple[str, str], dict[int, int]]  # (field, bundle) -> {tid: nodes}
+    totals: dict[int, int]
+    fingerprint: list
+    fetched_at: float = field(default_factory=time.time)
+
+
 class TaxonomyManager:
     """
     Manage taxonomy terms and references.
@@ -54,11 +104,27 @@ class TaxonomyManager:
 
     def __init__(
         self,
-        auth: "TerminusAuth | PlaywrightAuth",
+        auth: "TerminusAuth | PlaywrightAuth | RestAuth",
         changelog: "ChangeLog",
+        index_dir: Optional[Path] = None,
+        index_max_age: float = 300.0,
     ):
+        """
+        Initialize the manager.
+
+        Args:
+            auth: Backend to run operations through
+            changelog: Where changes are recorded
+            index_dir: Persist vocabulary indexes here between runs (optional)
+            index_max_age: Seconds before a vocabulary index is refreshed again
+        """
         self.auth = auth
         self.changelog = changelog
+        self.index_dir = Path(index_dir) if index_dir else None
+        self.index_max_age = index_max_age
+        self._indexes: dict[str, VocabularyIndex] = {}
+        self._usage: dict[tuple, TermUsage] = {}
+        self._matchers: dict[str, tuple[tuple, TermMatcher]] = {}
 
     async def propose_add_term(
         self,
@@ -132,32 +198,366 @@ class TaxonomyManager:
         )
 
     async def get_terms(self, vocabulary: str) -> list[dict]:
-        """Get all terms in a vocabulary."""
+        """
+        Get all terms in a vocabulary, in tree order.
+
+        Served from the vocabulary index, which is loaded on first use.
+        """
+        index = await self.get_index(vocabulary)
+        return index.as_tree()
+
+    async def get_index(self, vocabulary: str, refresh: bool = False) -> VocabularyIndex:
+        """
+        Get the in-memory index for a vocabulary.
+
+        The first call loads it (from disk if `index_dir` is set, then an
+        incremental refresh; otherwise a full load). Later calls reuse it,
+        refreshing incrementally once it is older than `index_max_age`.
+
+        Args:
+            vocabulary: Vocabulary machine name
+            refresh: Refresh now regardless of age
+        """
+        index = self._indexes.get(vocabulary)
+        if index is None:
+            if self.index_dir:
+                index = VocabularyIndex.load(vocabulary, self.index_dir / f"{vocabulary}.json")
+            else:
+                index = VocabularyIndex(vocabulary)
+            self._indexes[vocabulary] = index
+
+        if refresh or not index.loaded or index.age > self.index_max_age:
+            await self.refresh_index(vocabulary)
+        return index
+
+    async def refresh_index(self, vocabulary: str, full: bool = False) -> VocabularyIndex:
+        """
+        Fetch terms changed at or after the index's newest `changed` time.
+
+        `changed` has one-second resolution, so the newest second is fetched
+        again: a term saved in that second after the last refresh would
+        otherwise be missed. Re-fetched terms are upserted unchanged.
+
+        With Terminus the site's term count is compared afterwards; a
+        mismatch means terms were deleted and triggers a full reload.
+        Over JSON:API deletions are only picked up with full=True.
+        """
+        index = self._indexes.setdefault(vocabulary, VocabularyIndex(vocabulary))
+        if not index.terms:
+            full = True
+        since = 0 if full else index.max_changed
+
+        fetched = await self._fetch_term_rows(vocabulary, since)
+        if fetched is None:
+            return index
+        rows, total = fetched
+
+        if full:
+            index.clear()
+        index.upsert(rows)
+
+        if total is not None and total != len(index) and not full:
+            console.print(f"[dim]Terms were deleted from {vocabulary}, reloading index[/dim]")
+            return await self.refresh_index(vocabulary, full=True)
+
+        index.mark_refreshed()
+        index.save()
+        console.print(f"[dim]Term index {vocabulary}: {len(index)} terms ({len(rows)} fetched)[/dim]")
+        return index
+
+    async def _fetch_term_rows(
+        self,
+        vocabulary: str,
+        since: int,
+    ) -> Optional[tuple[list[dict], Optional[int]]]:
+        """
+        Fetch terms changed at or after `since` (a Unix timestamp).
+
+        Returns (rows, total term count or None), or None on failure.
+        """
+        from drupal_editor.auth.rest import RestAuth
         from drupal_editor.auth.terminus import TerminusAuth
 
         if isinstance(self.auth, TerminusAuth):
+            vocabulary_escaped = vocabulary.replace("'", "\\'")
             php_code = f"""
-$terms = \\Drupal::entityTypeManager()
-    ->getStorage('taxonomy_term')
-    ->loadTree('{vocabulary}');
-
-$result = [];
-foreach ($terms as $term) {{
-    $result[] = [
-        'tid' => $term->tid,
-        'name' => $term->name,
-        'depth' => $term->depth,
-    ];
-}}
-print json_encode($result);
+$db = \\Drupal::database();
+$query = $db->select('taxonomy_term_field_data', 't');
+$query->leftJoin('taxonomy_term__parent', 'p', 'p.entity_id = t.tid AND p.delta = 0');
+$query->fields('t', ['tid', 'name', 'weight', 'changed']);
+$query->addField('p', 'parent_target_id', 'parent');
+$query->condition('t.vid', '{vocabulary_escaped}')
+    ->condition('t.default_langcode', 1)
+    ->condition('t.changed', {since}, '>=');
+
+$total = $db->select('taxonomy_term_field_data', 't')
+    ->condition('t.vid', '{vocabulary_escaped}')
+    ->condition('t.default_langcode', 1)
+    ->countQuery()
+    ->execute()
+    ->fetchField();
+
+print json_encode([
+    'rows' => $query->execute()->fetchAll(\\PDO::FETCH_ASSOC),
+    'total' => (int) $total,
+]);
 """
             result = await self.auth.php_eval(php_code)
-            if result.success:
-                try:
-                    return json.loads(result.stdout.strip())
-                except Exception:
-                    return []
-        return []
+            if not result.success:
+                console.print(f"[red]Failed to load terms for {vocabulary}: {result.stderr}[/red]")
+                return None
+            try:
+                response = json.loads(result.stdout.strip())
+            except Exception:
+                console.print(f"[red]Invalid response loading terms: {result.stdout[:200]}[/red]")
+                return None
+            return response.get("rows", []), response.get("total")
+
+        if isinstance(self.auth, RestAuth):
+            return await self._fetch_term_rows_via_jsonapi(vocabulary, since), None
+
+        return None
+
+    async def _fetch_term_rows_via_jsonapi(self, vocabulary: str, since: int) -> list[dict]:
+        """All terms changed at or after `since`, over JSON:API."""
+        rows = []
+        async for page in self._iter_term_rows_via_jsonapi(vocabulary, since):
+            rows.extend(page)
+        return rows
+
+    async def _iter_term_rows_via_jsonapi(
+        self,
+        vocabulary: str,
+        since: int = 0,
+        page_size: int = 50,
+    ) -> AsyncIterator[list[dict]]:
+        """Page through a vocabulary over JSON:API, resolving parents via include."""
+        resource_type = f"taxonomy_term--{vocabulary}"
+        params = [
+            (f"fields[{resource_type}]", "drupal_internal__tid,name,weight,changed,parent"),
+            ("include", "parent"),
+            ("sort", "drupal_internal__tid"),
+            ("page[limit]", str(page_size)),
+        ]
+        if since:
+            params += [
+                ("filter[since][condition][path]", "changed"),
+                ("filter[since][condition][operator]", ">="),
+                ("filter[since][condition][value]", str(since)),
+            ]
+
+        async for page, included in self.auth.iter_jsonapi(
+            f"/jsonapi/taxonomy_term/{vocabulary}", params, with_included=True
+        ):
+            uuid_to_tid = {
+                resource["id"]: int(resource["attributes"]["drupal_internal__tid"])
+                for resource in page + included
+            }
+            rows = []
+            for resource in page:
+                attributes = resource.get("attributes", {})
+                # Root terms point at the "virtual" parent, which maps to 0
+                parents = resource.get("relationships", {}).get("parent", {}).get("data") or []
+                rows.append({
+                    "tid": int(attributes["drupal_internal__tid"]),
+                    "name": attributes.get("name", ""),
+                    "parent": uuid_to_tid.get(parents[0].get("id"), 0) if parents else 0,
+                    "weight": attributes.get("weight") or 0,
+                    "changed": _timestamp(attributes.get("changed")),
+                })
+            yield rows
+
+    async def export_tree(
+        self,
+        vocabulary: str,
+        include_usage: bool = False,
+        page_size: int = 5000,
+    ) -> TermTree:
+        """
+        Export a vocabulary's hierarchy as a compact TermTree.
+
+        Terms are streamed in pages (see iter_term_pages), so vocabularies
+        with tens of thousands of terms never sit in memory as dicts.
+
+        Args:
+            vocabulary: Vocabulary machine name
+            include_usage: Fill per-term usage (published nodes tagged with
+                           the term, from taxonomy_index; Terminus only)
+            page_size: Terms per remote request
+
+        Returns:
+            Finalized TermTree
+        """
+        tree = TermTree(vocabulary)
+        async for rows in self.iter_term_pages(vocabulary, include_usage, page_size):
+            tree.add_rows(rows)
+        tree.finalize()
+        console.print(f"[dim]Exported {len(tree)} terms from {vocabulary}[/dim]")
+        return tree
+
+    async def iter_term_pages(
+        self,
+        vocabulary: str,
+        include_usage: bool = False,
+        page_size: int = 5000,
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Yield pages of term rows (tid, name, parent, weight, usage), by tid.
+
+        With Terminus each page is one keyset-paginated query; over JSON:API
+        the collection's own paging is followed and usage is not available.
+        """
+        from drupal_editor.auth.rest import RestAuth
+        from drupal_editor.auth.terminus import TerminusAuth
+
+        if isinstance(self.auth, RestAuth):
+            async for rows in self._iter_term_rows_via_jsonapi(vocabulary, page_size=min(page_size, 50)):
+                yield rows
+            return
+
+        if not isinstance(self.auth, TerminusAuth):
+            console.print("[yellow]Term export is only supported via Terminus or REST[/yellow]")
+            return
+
+        vocabulary_escaped = vocabulary.replace("'", "\\'")
+        usage_php = ""
+        if include_usage:
+            usage_php = """
+$usage = $db->select('taxonomy_index', 'ti');
+$usage->addField('ti', 'tid');
+$usage->addExpression('COUNT(DISTINCT ti.nid)', 'usage_count');
+$usage->groupBy('ti.tid');
+$query->leftJoin($usage, 'u', 'u.tid = t.tid');
+$query->addExpression('COALESCE(u.usage_count, 0)', 'usage_count');
+"""
+        after = 0
+        while True:
+            php_code = f"""
+$db = \\Drupal::database();
+$query = $db->select('taxonomy_term_field_data', 't');
+$query->leftJoin('taxonomy_term__parent', 'p', 'p.entity_id = t.tid AND p.delta = 0');
+$query->fields('t', ['tid', 'name', 'weight']);
+$query->addField('p', 'parent_target_id', 'parent');
+{usage_php}
+$query->condition('t.vid', '{vocabulary_escaped}')
+    ->condition('t.default_langcode', 1)
+    ->condition('t.tid', {after}, '>')
+    ->orderBy('t.tid')
+    ->range(0, {int(page_size)});
+print json_encode($query->execute()->fetchAll(\\PDO::FETCH_ASSOC));
+"""
+            result = await self.auth.php_eval(php_code)
+            if not result.success:
+                console.print(f"[red]Failed to export terms: {result.stderr}[/red]")
+                return
+            try:
+                rows = json.loads(result.stdout.strip())
+            except json.JSONDecodeError:
+                console.print(f"[red]Invalid JSON response: {result.stdout[:200]}[/red]")
+                return
+
+            for row in rows:
+                row["usage"] = row.pop("usage_count", 0)
+            if rows:
+                yield rows
+            if len(rows) < page_size:
+                return
+            after = int(rows[-1]["tid"])
+
+    async def term_usage(
+        self,
+        vocabulary: str,
+        fields: Optional[list[str]] = None,
+        refresh: bool = False,
+    ) -> dict[int, int]:
+        """
+        Count the nodes referencing each term of a vocabulary.
+
+        One grouped count over a UNION ALL of the term reference field
+        tables runs on the server; no nodes are loaded. The result is cached.
+        Once older than `index_max_age` (or with refresh=True), a cheap
+        fingerprint query (node and term counts, latest node/term change) decides
+        whether the aggregate needs to run again.
+
+        Counts are per field, so a node tagging the same term in two fields
+        counts twice in the totals. Requires Terminus.
+
+        Args:
+            vocabulary: Vocabulary machine name
+            fields: Node fields to count (default: every term reference field)
+            refresh: Check the fingerprint now regardless of cache age
+
+        Returns:
+            Mapping of tid to node count (unused terms are omitted)
+        """
+        usage = await self._get_term_usage(vocabulary, fields, refresh)
+        return usage.totals if usage else {}
+
+    async def term_usage_by_field(
+        self,
+        vocabulary: str,
+        fields: Optional[list[str]] = None,
+        refresh: bool = False,
+    ) -> dict[tuple[str, str], dict[int, int]]:
+        """Like term_usage(), broken down by (field, bundle)."""
+        usage = await self._get_term_usage(vocabulary, fields, refresh)
+        return usage.by_field if usage else {}
+
+    async def _get_term_usage(
+        self,
+        vocabulary: str,
+        fields: Optional[list[str]],
+        refresh: bool,
+    ) -> Optional[TermUsage]:
+        """Return cached usage, revalidating or recomputing it as needed."""
+        from drupal_editor.auth.terminus import TerminusAuth
+
+        if not isinstance(self.auth, TerminusAuth):
+            console.print("[yellow]Term usage is only supported via Terminus[/yellow]")
+            return None
+
+        key = (vocabulary, tuple(sorted(fields)) if fields else None)
+        cached = self._usage.get(key)
+        if cached and not refresh and time.time() - cached.fetched_at < self.index_max_age:
+            return cached
+
+        payload = base64.b64encode(json.dumps({
+            "vocabulary": vocabulary,
+            "fields": fields or [],
+            # Skip the aggregate when nothing changed since the cached run
+            "fingerprint": cached.fingerprint if cached else None,
+        }).encode()).decode()
+
+        result = await self.auth.php_eval(_TERM_USAGE_PHP.replace("__PAYLOAD__", payload))
+        if not result.success:
+            console.print(f"[red]Term usage query failed: {result.stderr}[/red]")
+            return cached
+        try:
+            response = json.loads(result.stdout.strip())
+        except json.JSONDecodeError:
+            console.print(f"[red]Invalid JSON response: {result.stdout[:200]}[/red]")
+            return cached
+
+        if response.get("unchanged") and cached:
+            cached.fetched_at = time.time()
+            return cached
+
+        by_field: dict[tuple[str, str], dict[int, int]] = {}
+        totals: dict[int, int] = {}
+        for tid, field_name, bundle, count in response.get("rows", []):
+            tid, count = int(tid), int(count)
+            by_field.setdefault((field_name, bundle), {})[tid] = count
+            totals[tid] = totals.get(tid, 0) + count
+
+        usage = TermUsage(
+            vocabulary=vocabulary,
+            by_field=by_field,
+            totals=totals,
+            fingerprint=response.get("fingerprint", []),
+        )
+        self._usage[key] = usage
+        console.print(f"[dim]Term usage for {vocabulary}: {len(totals)} terms in use[/dim]")
+        return usage
 
     async def get_term_id_by_name(
         self,
@@ -167,6 +567,10 @@ print json_encode($result);
         """
         Look up a taxonomy term ID by its name.
 
+        Resolved from the vocabulary index (case-, whitespace- and Unicode-
+        form-insensitive). Only on a miss is the site queried; a remote hit
+        means the index is stale and it is refreshed.
+
         Args:
             vocabulary: Vocabulary machine name (e.g., "topic")
             term_name: Term name to look up
@@ -174,6 +578,75 @@ print json_encode($result);
         Returns:
             Term ID if found, None otherwise
         """
+        index = await self.get_index(vocabulary)
+        tid = index.lookup(term_name)
+        if tid is not None:
+            return tid
+
+        tid = await self._get_term_id_remote(vocabulary, term_name)
+        if tid is not None and tid not in index:
+            await self.refresh_index(vocabulary)
+        return tid
+
+    async def get_matcher(
+        self,
+        vocabulary: str,
+        synonyms: Optional[dict[str, int]] = None,
+    ) -> TermMatcher:
+        """
+        Get a fuzzy TermMatcher over the vocabulary index.
+
+        Rebuilt only when the index or the synonyms change.
+
+        Args:
+            vocabulary: Vocabulary machine name
+            synonyms: Extra names for terms, mapping synonym -> tid
+        """
+        index = await self.get_index(vocabulary)
+        version = (len(index), index.max_changed, tuple(sorted((synonyms or {}).items())))
+        cached = self._matchers.get(vocabulary)
+        if cached and cached[0] == version:
+            return cached[1]
+
+        matcher = TermMatcher.from_index(index, synonyms=synonyms)
+        self._matchers[vocabulary] = (version, matcher)
+        return matcher
+
+    async def match_terms(
+        self,
+        vocabulary: str,
+        names: list[str],
+        k: int = 5,
+        min_score: float = 0.3,
+        synonyms: Optional[dict[str, int]] = None,
+    ) -> list[list[tuple[int, float]]]:
+        """
+        Resolve many suggested tag names to candidate terms in one call.
+
+        Normalized and synonym matches score 1.0; everything else is ranked
+        by character n-gram similarity. Check for a good candidate here
+        before falling back to propose_add_term().
+
+        Args:
+            vocabulary: Vocabulary machine name
+            names: Suggested names
+            k: Candidates per name
+            min_score: Drop candidates below this similarity (0-1)
+            synonyms: Extra names for terms, mapping synonym -> tid
+
+        Returns:
+            One list of (tid, score) per name, best first
+        """
+        matcher = await self.get_matcher(vocabulary, synonyms)
+        return matcher.match(names, k=k, min_score=min_score)
+
+    async def _get_term_id_remote(
+        self,
+        vocabulary: str,
+        term_name: str,
+    ) -> Optional[int]:
+        """Look up a term ID by exact name on the site."""
+        from drupal_editor.auth.rest import RestAuth
         from drupal_editor.auth.terminus import TerminusAuth
 
         if isinstance(self.auth, TerminusAuth):
@@ -201,6 +674,16 @@ if ($terms) {{
                         return int(output)
                     except ValueError:
                         pass
+        elif isinstance(self.auth, RestAuth):
+            params = [
+                ("filter[name]", term_name),
+                (f"fields[taxonomy_term--{vocabulary}]", "drupal_internal__tid"),
+                ("page[limit]", "1"),
+            ]
+            async for page in self.auth.iter_jsonapi(f"/jsonapi/taxonomy_term/{vocabulary}", params):
+                if page:
+                    return int(page[0]["attributes"]["drupal_internal__tid"])
+                break
         return None
 
     async def add_tag_to_node(
@@ -227,8 +710,18 @@ if ($terms) {{
         Returns:
             DraftRevision with revision details
         """
+        from drupal_editor.auth.rest import RestAuth
         from drupal_editor.auth.terminus import TerminusAuth
 
+        if isinstance(self.auth, RestAuth):
+            def add(tids: list[int]) -> Optional[list[int]]:
+                return None if term_id in tids else tids + [term_id]
+
+            return await self._update_tags_via_rest(
+                nid, field_name, add, reason, moderation_state,
+                operation="add_tag_to_node", old_value="", new_value=str(term_id),
+            )
+
         if not isinstance(self.auth, TerminusAuth):
             return DraftRevision(
                 nid=nid,
@@ -236,7 +729,7 @@ if ($terms) {{
                 moderation_state="",
                 revision_url="",
                 success=False,
-                error="add_tag_to_node only supported via Terminus",
+                error="add_tag_to_node only supported via Terminus or REST",
             )
 
         reason_escaped = reason.replace("'", "\\'")
@@ -413,8 +906,18 @@ try {{
         Returns:
             DraftRevision with revision details
         """
+        from drupal_editor.auth.rest import RestAuth
         from drupal_editor.auth.terminus import TerminusAuth
 
+        if isinstance(self.auth, RestAuth):
+            def remove(tids: list[int]) -> Optional[list[int]]:
+                return [tid for tid in tids if tid != term_id] if term_id in tids else None
+
+            return await self._update_tags_via_rest(
+                nid, field_name, remove, reason, moderation_state,
+                operation="remove_tag_from_node", old_value=str(term_id), new_value="",
+            )
+
         if not isinstance(self.auth, TerminusAuth):
             return DraftRevision(
                 nid=nid,
@@ -422,7 +925,7 @@ try {{
                 moderation_state="",
                 revision_url="",
                 success=False,
-                error="remove_tag_from_node only supported via Terminus",
+                error="remove_tag_from_node only supported via Terminus or REST",
             )
 
         reason_escaped = reason.replace("'", "\\'")
@@ -590,8 +1093,22 @@ try {{
         Returns:
             DraftRevision with revision details
         """
+        from drupal_editor.auth.rest import RestAuth
         from drupal_editor.auth.terminus import TerminusAuth
 
+        if isinstance(self.auth, RestAuth):
+            def replace(tids: list[int]) -> Optional[list[int]]:
+                if old_term_id not in tids:
+                    raise ValueError("Old tag not present on node")
+                swapped = [new_term_id if tid == old_term_id else tid for tid in tids]
+                return list(dict.fromkeys(swapped))
+
+            return await self._update_tags_via_rest(
+                nid, field_name, replace, reason, moderation_state,
+                operation="replace_tag_on_node",
+                old_value=str(old_term_id), new_value=str(new_term_id),
+            )
+
         if not isinstance(self.auth, TerminusAuth):
             return DraftRevision(
                 nid=nid,
@@ -599,7 +1116,7 @@ try {{
                 moderation_state="",
                 revision_url="",
                 success=False,
-                error="replace_tag_on_node only supported via Terminus",
+                error="replace_tag_on_node only supported via Terminus or REST",
             )
 
         reason_escaped = reason.replace("'", "\\'")
@@ -744,3 +1261,660 @@ try {{
             revision_url=revision_url,
             success=True,
         )
+
+    async def apply_tag_delta(
+        self,
+        nid: int,
+        field_name: str,
+        add: Optional[list[int]] = None,
+        remove: Optional[list[int]] = None,
+        replace: Optional[dict[int, int]] = None,
+        reason: str = "Ava: Updated tags",
+        moderation_state: str = "draft",
+    ) -> DraftRevision:
+        """
+        Add, remove and replace tags on a node in a single revision.
+
+        The final tag list is computed on the server from the node's
+        current value and saved once. Nothing is saved when the delta
+        leaves the field unchanged.
+
+        Args:
+            nid: Node ID
+            field_name: Field machine name (e.g., "field_topics")
+            add: Term IDs to add
+            remove: Term IDs to remove
+            replace: Mapping of old term ID to new term ID
+            reason: Reason for the change (stored in revision log)
+            moderation_state: Target moderation state (default: "draft")
+
+        Returns:
+            DraftRevision with revision details
+        """
+        delta = TagDelta(
+            nid=nid,
+            field_name=field_name,
+            add=add or [],
+            remove=remove or [],
+            replace=replace or {},
+        )
+        results = await self.apply_tag_deltas([delta], reason, moderation_state)
+        return results[nid]
+
+    async def apply_tag_deltas(
+        self,
+        deltas: list[TagDelta],
+        reason: str,
+        moderation_state: str = "draft",
+        chunk_size: int = 25,
+    ) -> dict[int, DraftRevision]:
+        """
+        Apply tag deltas to many nodes, one revision per changed node.
+
+        With Terminus, each chunk of nodes is loaded with loadMultiple()
+        and updated in a single php:eval. Over REST each node is one GET
+        and one PATCH.
+
+        Args:
+            deltas: One TagDelta per node
+            reason: Reason for the change (stored in revision log)
+            moderation_state: Target moderation state (default: "draft")
+            chunk_size: Nodes per remote execution
+
+        Returns:
+            Mapping of node ID to DraftRevision
+        """
+        from drupal_editor.auth.rest import RestAuth
+        from drupal_editor.auth.terminus import TerminusAuth
+
+        results: dict[int, DraftRevision] = {}
+
+        if isinstance(self.auth, RestAuth):
+            for delta in deltas:
+                def transform(tids: list[int], delta: TagDelta = delta) -> Optional[list[int]]:
+                    updated = delta.apply(tids)
+                    return None if updated == tids else updated
+
+                results[delta.nid] = await self._update_tags_via_rest(
+                    delta.nid, delta.field_name, transform, reason, moderation_state,
+                    operation="apply_tag_delta",
+                )
+            return results
+
+        if not isinstance(self.auth, TerminusAuth):
+            for delta in deltas:
+                results[delta.nid] = DraftRevision(
+                    nid=delta.nid,
+                    revision_id=0,
+                    moderation_state="",
+                    revision_url="",
+                    success=False,
+                    error="apply_tag_delta only supported via Terminus or REST",
+                )
+            return results
+
+        site_url = await self.auth.get_site_url()
+
+        for start in range(0, len(deltas), chunk_size):
+            chunk = deltas[start:start + chunk_size]
+            console.print(
+                f"[yellow]Applying tag changes to nodes {start + 1}-{start + len(chunk)} of {len(deltas)}...[/yellow]"
+            )
+            responses = await self._apply_tag_chunk_via_drush(chunk, reason, moderation_state)
+
+            for delta in chunk:
+                response = responses.get(delta.nid, {"success": False, "error": "No result returned"})
+                results[delta.nid] = self._record_tag_delta(delta, response, reason, site_url)
+
+        return results
+
+    async def _apply_tag_chunk_via_drush(
+        self,
+        chunk: list[TagDelta],
+        reason: str,
+        moderation_state: str,
+    ) -> dict[int, dict]:
+        """Run one php:eval applying a chunk of tag deltas; returns responses by nid."""
+        payload = base64.b64encode(json.dumps({
+            "deltas": [delta.to_payload() for delta in chunk],
+            "reason": reason,
+            "moderation_state": moderation_state,
+        }).encode()).decode()
+
+        result = await self.auth.php_eval(_APPLY_TAG_DELTAS_PHP.replace("__PAYLOAD__", payload))
+        nids = [delta.nid for delta in chunk]
+
+        if not result.success:
+            error = f"Drush failed: {result.stderr}"
+            return {nid: {"success": False, "error": error} for nid in nids}
+
+        try:
+            response = json.loads(result.stdout.strip())
+        except json.JSONDecodeError:
+            error = f"Invalid JSON response: {result.stdout}"
+            return {nid: {"success": False, "error": error} for nid in nids}
+
+        return {int(item["nid"]): item for item in response.get("results", [])}
+
+    async def bulk_replace_term(
+        self,
+        field_name: str,
+        old_tid: int,
+        new_tid: int,
+        reason: str,
+        moderation_state: str = "draft",
+        chunk_size: int = 25,
+        checkpoint: Optional[Path] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        bundles: Optional[list[str]] = None,
+    ) -> dict[int, DraftRevision]:
+        """
+        Replace a term with another on every node that references it.
+
+        Referencing nodes are found with one query on the field table, then
+        updated in chunks through apply_tag_deltas(), so each node gets its
+        own moderated revision and each chunk is one remote execution.
+
+        With `checkpoint`, progress is written to that JSON file after every
+        chunk; calling again with the same arguments resumes where the
+        previous run stopped (nodes that failed are retried).
+
+        Args:
+            field_name: Term reference field (e.g., "field_topics")
+            old_tid: Term ID to retire
+            new_tid: Term ID to use instead
+            reason: Reason for the change (stored in revision log)
+            moderation_state: Target moderation state (default: "draft")
+            chunk_size: Nodes per remote execution
+            checkpoint: JSON file for resumable progress (optional)
+            on_progress: Called with (nodes done, total nodes) after each chunk
+            bundles: Content types to search (required over REST, where
+                     there is no cross-bundle field query)
+
+        Returns:
+            Mapping of node ID to DraftRevision for nodes processed in this call
+        """
+        state = _load_checkpoint(checkpoint, field_name, old_tid, new_tid)
+        if state is None:
+            nids = await self._find_nodes_referencing(field_name, old_tid, bundles)
+            if nids is None:
+                return {}
+            state = {
+                "field": field_name,
+                "old_tid": old_tid,
+                "new_tid": new_tid,
+                "nids": nids,
+                "done": [],
+                "failed": {},
+            }
+            _save_checkpoint(checkpoint, state)
+        else:
+            console.print(
+                f"[dim]Resuming from {checkpoint}: {len(state['done'])}/{len(state['nids'])} done[/dim]"
+            )
+
+        done = set(state["done"])
+        pending = [nid for nid in state["nids"] if nid not in done]
+        total = len(state["nids"])
+        console.print(f"[yellow]Replacing term {old_tid} → {new_tid} on {len(pending)} nodes...[/yellow]")
+
+        results: dict[int, DraftRevision] = {}
+        for start in range(0, len(pending), chunk_size):
+            chunk = pending[start:start + chunk_size]
+            deltas = [
+                TagDelta(nid=nid, field_name=field_name, replace={old_tid: new_tid})
+                for nid in chunk
+            ]
+            chunk_results = await self.apply_tag_deltas(
+                deltas, reason, moderation_state, chunk_size=chunk_size
+            )
+            results.update(chunk_results)
+
+            for nid, revision in chunk_results.items():
+                if revision.success:
+                    state["done"].append(nid)
+                    state["failed"].pop(str(nid), None)
+                else:
+                    state["failed"][str(nid)] = revision.error or "Unknown error"
+            _save_checkpoint(checkpoint, state)
+
+            if on_progress:
+                on_progress(len(state["done"]), total)
+
+        failed = len(state["failed"])
+        console.print(
+            f"[green]Replaced term on {len(state['done'])}/{total} nodes[/green]"
+            + (f" [red]({failed} failed)[/red]" if failed else "")
+        )
+        return results
+
+    async def _find_nodes_referencing(
+        self,
+        field_name: str,
+        tid: int,
+        bundles: Optional[list[str]] = None,
+    ) -> Optional[list[int]]:
+        """Node IDs whose `field_name` references term `tid`, ascending."""
+        from drupal_editor.auth.rest import RestAuth
+        from drupal_editor.auth.terminus import TerminusAuth
+
+        if isinstance(self.auth, TerminusAuth):
+            field_escaped = field_name.replace("'", "\\'")
+            php_code = f"""
+$definitions = \\Drupal::service('entity_field.manager')->getFieldStorageDefinitions('node');
+$definition = $definitions['{field_escaped}'] ?? NULL;
+if (!$definition) {{
+    print json_encode(['success' => false, 'error' => 'Field not found: {field_escaped}']);
+    return;
+}}
+$mapping = \\Drupal::entityTypeManager()->getStorage('node')->getTableMapping();
+$column = $mapping->getFieldColumnName($definition, 'target_id');
+$query = \\Drupal::database()->select($mapping->getDedicatedDataTableName($definition), 'f')
+    ->fields('f', ['entity_id'])
+    ->condition('f.' . $column, {int(tid)})
+    ->condition('f.deleted', 0)
+    ->distinct()
+    ->orderBy('f.entity_id');
+print json_encode(['success' => true, 'nids' => array_map('intval', $query->execute()->fetchCol())]);
+"""
+            result = await self.auth.php_eval(php_code)
+            if not result.success:
+                console.print(f"[red]Failed to find nodes: {result.stderr}[/red]")
+                return None
+            try:
+                response = json.loads(result.stdout.strip())
+            except json.JSONDecodeError:
+                console.print(f"[red]Invalid JSON response: {result.stdout[:200]}[/red]")
+                return None
+            if not response.get("success"):
+                console.print(f"[red]{response.get('error', 'Unknown error')}[/red]")
+                return None
+            return response["nids"]
+
+        if isinstance(self.auth, RestAuth):
+            if not bundles:
+                console.print("[red]bundles is required to find referencing nodes over REST[/red]")
+                return None
+            nids: set[int] = set()
+            for bundle in bundles:
+                params = [
+                    (f"filter[{field_name}.meta.drupal_internal__target_id]", str(tid)),
+                    (f"fields[node--{bundle}]", "drupal_internal__nid"),
+                    ("page[limit]", "50"),
+                ]
+                async for page in self.auth.iter_jsonapi(f"/jsonapi/node/{bundle}", params):
+                    nids.update(int(r["attributes"]["drupal_internal__nid"]) for r in page)
+            return sorted(nids)
+
+        console.print("[red]bulk_replace_term only supported via Terminus or REST[/red]")
+        return None
+
+    def _record_tag_delta(
+        self,
+        delta: TagDelta,
+        response: dict,
+        reason: str,
+        site_url: str,
+    ) -> DraftRevision:
+        """Log one node's tag delta result and turn it into a DraftRevision."""
+        nid = delta.nid
+        old_value = ",".join(str(t) for t in response.get("previous", []))
+        new_value = ",".join(str(t) for t in response.get("tags", []))
+
+        if not response.get("success"):
+            error_msg = response.get("error", "Unknown error")
+            self.changelog.record(
+                auth_method="terminus",
+                operation="apply_tag_delta",
+                target=f"node/{nid}",
+                field=delta.field_name,
+                old_value=old_value,
+                new_value=new_value,
+                reason=reason,
+                success=False,
+                error=error_msg,
+            )
+            return DraftRevision(
+                nid=nid,
+                revision_id=0,
+                moderation_state="",
+                revision_url="",
+                success=False,
+                error=error_msg,
+            )
+
+        revision_id = response.get("revision_id", 0)
+        revision_url = f"{site_url}/node/{nid}/revisions/{revision_id}/view"
+
+        if response.get("changed"):
+            self.changelog.record(
+                auth_method="terminus",
+                operation="apply_tag_delta",
+                target=f"node/{nid}",
+                field=delta.field_name,
+                old_value=old_value,
+                new_value=new_value,
+                reason=reason,
+                revision_id=revision_id,
+                revision_url=revision_url,
+                success=True,
+            )
+            console.print(f"[green]Updated tags on node/{nid} (revision {revision_id})[/green]")
+        else:
+            console.print(f"[dim]Tags on node/{nid} already up to date[/dim]")
+
+        return DraftRevision(
+            nid=nid,
+            revision_id=revision_id,
+            moderation_state=response.get("moderation_state", ""),
+            revision_url=revision_url,
+            success=True,
+        )
+
+    async def _update_tags_via_rest(
+        self,
+        nid: int,
+        field_name: str,
+        transform: Callable[[list[int]], Optional[list[int]]],
+        reason: str,
+        moderation_state: str,
+        operation: str,
+        old_value: Optional[str] = None,
+        new_value: Optional[str] = None,
+    ) -> DraftRevision:
+        """
+        Apply a tag change through REST: read the field, transform, PATCH once.
+
+        `transform` returns the new list of term IDs, None when nothing needs
+        to change, or raises ValueError to reject the change. Without
+        old_value/new_value the changelog gets the full before/after lists.
+        """
+        auth: RestAuth = self.auth  # type: ignore
+
+        entity = await auth.get_entity("node", nid)
+        if entity is None or field_name not in entity:
+            error = "Node not found" if entity is None else f"Field not found: {field_name}"
+            return DraftRevision(
+                nid=nid,
+                revision_id=0,
+                moderation_state="",
+                revision_url="",
+                success=False,
+                error=error,
+            )
+
+        current = [int(item["target_id"]) for item in entity[field_name] if "target_id" in item]
+        try:
+            updated = transform(current)
+        except ValueError as e:
+            return DraftRevision(
+                nid=nid,
+                revision_id=0,
+                moderation_state="",
+                revision_url="",
+                success=False,
+                error=str(e),
+            )
+
+        if updated is None:
+            revision_id = (entity.get("vid") or [{}])[0].get("value", 0)
+            return DraftRevision(
+                nid=nid,
+                revision_id=revision_id,
+                moderation_state=(entity.get("moderation_state") or [{}])[0].get("value", ""),
+                revision_url=f"{auth.base_url}/node/{nid}/revisions/{revision_id}/view",
+                success=True,
+            )
+
+        if old_value is None:
+            old_value = ",".join(str(t) for t in current)
+        if new_value is None:
+            new_value = ",".join(str(t) for t in updated)
+
+        console.print(f"[yellow]Updating {field_name} on node/{nid} via REST...[/yellow]")
+        response = await auth.set_reference_ids(
+            nid, field_name, updated, reason, moderation_state, entity=entity
+        )
+
+        if not response.get("success"):
+            error_msg = response.get("error", "Unknown error")
+            self.changelog.record(
+                auth_method="rest",
+                operation=operation,
+                target=f"node/{nid}",
+                field=field_name,
+                old_value=old_value,
+                new_value=new_value,
+                reason=reason,
+                success=False,
+                error=error_msg,
+            )
+            return DraftRevision(
+                nid=nid,
+                revision_id=0,
+                moderation_state="",
+                revision_url="",
+                success=False,
+                error=error_msg,
+            )
+
+        revision_id = response.get("revision_id", 0)
+        revision_url = f"{auth.base_url}/node/{nid}/revisions/{revision_id}/view"
+
+        self.changelog.record(
+            auth_method="rest",
+            operation=operation,
+            target=f"node/{nid}",
+            field=field_name,
+            old_value=old_value,
+            new_value=new_value,
+            reason=reason,
+            revision_id=revision_id,
+            revision_url=revision_url,
+            success=True,
+        )
+
+        console.print(f"[green]Updated {field_name} on node/{nid} (revision {revision_id})[/green]")
+
+        return DraftRevision(
+            nid=nid,
+            revision_id=revision_id,
+            moderation_state=response.get("moderation_state", ""),
+            revision_url=revision_url,
+            success=True,
+        )
+
+
+def _load_checkpoint(
+    path: Optional[Path],
+    field_name: str,
+    old_tid: int,
+    new_tid: int,
+) -> Optional[dict]:
+    """Read a bulk_replace_term checkpoint if it matches these arguments."""
+    if not path or not Path(path).exists():
+        return None
+    try:
+        state = json.loads(Path(path).read_text())
+    except (OSError, ValueError) as e:
+        console.print(f"[yellow]Ignoring unreadable checkpoint {path}: {e}[/yellow]")
+        return None
+    if (state.get("field"), state.get("old_tid"), state.get("new_tid")) != (field_name, old_tid, new_tid):
+        console.print(f"[yellow]Checkpoint {path} is for a different replacement, starting over[/yellow]")
+        return None
+    return state
+
+
+def _save_checkpoint(path: Optional[Path], state: dict) -> None:
+    """Atomically write a bulk_replace_term checkpoint (no-op without a path)."""
+    if not path:
+        return
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(state, indent=2))
+    tmp.replace(path)
+
+
+# Apply a chunk of TagDelta payloads, one revision per changed node.
+# Mirrors the checks in add_tag_to_node and TagDelta.apply().
+_APPLY_TAG_DELTAS_PHP = r"""
+$payload = json_decode(base64_decode('__PAYLOAD__'), TRUE);
+$storage = \Drupal::entityTypeManager()->getStorage('node');
+$moderation_info = \Drupal::service('content_moderation.moderation_information');
+$target_moderation_state = $payload['moderation_state'];
+$nids = array_column($payload['deltas'], 'nid');
+$nodes = $storage->loadMultiple($nids);
+$results = [];
+
+foreach ($payload['deltas'] as $delta) {
+    $nid = $delta['nid'];
+    $field_name = $delta['field'];
+    $node = $nodes[$nid] ?? NULL;
+
+    if (!$node) {
+        $results[] = ['nid' => $nid, 'success' => false, 'error' => 'Node not found'];
+        continue;
+    }
+    if (!$node->hasField($field_name)) {
+        $results[] = ['nid' => $nid, 'success' => false, 'error' => 'Field not found: ' . $field_name];
+        continue;
+    }
+    if (!$node->hasField('moderation_state')) {
+        $results[] = ['nid' => $nid, 'success' => false, 'error' => 'Content moderation not enabled for this content type. Enable it in Drupal before applying changes.'];
+        continue;
+    }
+    $workflow = $moderation_info->getWorkflowForEntity($node);
+    if (!$workflow) {
+        $results[] = ['nid' => $nid, 'success' => false, 'error' => 'No workflow found for this content type'];
+        continue;
+    }
+    $states = $workflow->getTypePlugin()->getStates();
+    if (!isset($states[$target_moderation_state])) {
+        $available = implode(', ', array_keys($states));
+        $results[] = ['nid' => $nid, 'success' => false, 'error' => "Moderation state '$target_moderation_state' not found. Available states: $available"];
+        continue;
+    }
+
+    $current = array_map('intval', array_column($node->get($field_name)->getValue(), 'target_id'));
+
+    $replace = [];
+    foreach ($delta['replace'] as [$old, $new]) {
+        $replace[$old] = $new;
+    }
+    $tags = [];
+    foreach ($current as $tid) {
+        $tags[] = $replace[$tid] ?? $tid;
+    }
+    $tags = array_values(array_diff($tags, $delta['remove']));
+    $tags = array_values(array_unique(array_merge($tags, $delta['add'])));
+
+    if ($tags === $current) {
+        $results[] = [
+            'nid' => $nid,
+            'success' => true,
+            'changed' => false,
+            'previous' => $current,
+            'tags' => $tags,
+            'revision_id' => $node->getRevisionId(),
+            'moderation_state' => $node->get('moderation_state')->value ?? 'unknown',
+        ];
+        continue;
+    }
+
+    $node->setNewRevision(TRUE);
+    $node->setRevisionLogMessage($payload['reason']);
+    $node->setRevisionCreationTime(time());
+    $node->set('moderation_state', $target_moderation_state);
+    $node->set($field_name, $tags);
+
+    try {
+        $node->save();
+        $results[] = [
+            'nid' => $nid,
+            'success' => true,
+            'changed' => true,
+            'previous' => $current,
+            'tags' => $tags,
+            'revision_id' => $node->getRevisionId(),
+            'moderation_state' => $node->get('moderation_state')->value ?? 'unknown',
+        ];
+    } catch (\Exception $e) {
+        $results[] = ['nid' => $nid, 'success' => false, 'error' => $e->getMessage(), 'previous' => $current, 'tags' => $tags];
+    }
+}
+
+$storage->resetCache($nids);
+print json_encode(['results' => $results]);
+"""
+
+
+# Node counts per (term, field, bundle) for one vocabulary, as a single
+# grouped query over a UNION ALL of the term reference field tables.
+_TERM_USAGE_PHP = r"""
+$payload = json_decode(base64_decode('__PAYLOAD__'), TRUE);
+$db = \Drupal::database();
+$vid = $payload['vocabulary'];
+
+$fingerprint = array_map('strval', [
+    $db->query('SELECT COUNT(*) FROM {node_field_data}')->fetchField(),
+    $db->query('SELECT MAX(changed) FROM {node_field_data}')->fetchField(),
+    $db->query('SELECT MAX(changed) FROM {taxonomy_term_field_data} WHERE vid = :vid', [':vid' => $vid])->fetchField(),
+    // Deleting a term changes neither max above, but does change usage
+    $db->query('SELECT COUNT(*) FROM {taxonomy_term_field_data} WHERE vid = :vid', [':vid' => $vid])->fetchField(),
+]);
+if ($payload['fingerprint'] === $fingerprint) {
+    print json_encode(['unchanged' => true, 'fingerprint' => $fingerprint]);
+    return;
+}
+
+$definitions = \Drupal::service('entity_field.manager')->getFieldStorageDefinitions('node');
+$mapping = \Drupal::entityTypeManager()->getStorage('node')->getTableMapping();
+$union = NULL;
+$i = 0;
+foreach ($definitions as $name => $definition) {
+    if ($payload['fields'] && !in_array($name, $payload['fields'], TRUE)) {
+        continue;
+    }
+    if ($definition->getType() !== 'entity_reference'
+        || $definition->getSetting('target_type') !== 'taxonomy_term'
+        || !$mapping->requiresDedicatedTableStorage($definition)) {
+        continue;
+    }
+    $select = $db->select($mapping->getDedicatedDataTableName($definition), 'f');
+    $select->addField('f', $mapping->getFieldColumnName($definition, 'target_id'), 'tid');
+    $select->addExpression(':field' . $i, 'field_name', [':field' . $i => $name]);
+    $select->addField('f', 'bundle', 'bundle');
+    $select->addField('f', 'entity_id', 'nid');
+    $select->condition('f.deleted', 0);
+    $union ? $union->union($select, 'ALL') : ($union = $select);
+    $i++;
+}
+
+$rows = [];
+if ($union) {
+    $query = $db->select($union, 'r');
+    $query->join('taxonomy_term_field_data', 't', 't.tid = r.tid AND t.default_langcode = 1');
+    $query->condition('t.vid', $vid);
+    $query->fields('r', ['tid', 'field_name', 'bundle']);
+    $query->addExpression('COUNT(DISTINCT r.nid)', 'node_count');
+    $query->groupBy('r.tid')->groupBy('r.field_name')->groupBy('r.bundle');
+    $rows = $query->execute()->fetchAll(\PDO::FETCH_NUM);
+}
+
+print json_encode(['rows' => $rows, 'fingerprint' => $fingerprint]);
+"""
+
+
+def _timestamp(value) -> int:
+    """Unix timestamp from a JSON:API `changed` value (RFC 3339 or int)."""
+    if value in (None, ""):
+        return 0
+    if isinstance(value, (int, float)):
+        return int(value)
+    from datetime import datetime
+
+    try:
+        return int(datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp())
+    except ValueError:
+        return 0
@@ -0,0 +1,231 @@
+"""
+In-memory index of a vocabulary's terms.
+
+Loaded once per vocabulary by TaxonomyManager, refreshed incrementally by
+the terms' `changed` time, and optionally persisted to disk so the next run
+only fetches what changed. Name lookups become local dict hits.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import time
+import unicodedata
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+from rich.console import Console
+
+console = Console()
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a term name for lookups (NFKC, casefold, collapsed whitespace)."""
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", name).casefold()).strip()
+
+
+@dataclass
+class IndexedTerm:
+    """One term in a VocabularyIndex."""
+
+    tid: int
+    name: str
+    parent: int = 0  # 0 for root terms
+    weight: int = 0
+    changed: int = 0
+    depth: int = 0
+
+
+class VocabularyIndex:
+    """
+    Terms of one vocabulary, keyed by tid and by normalized name.
+
+    Usage:
+        index = VocabularyIndex("topic", path=Path(".cache/topic.json"))
+        index.upsert(rows)
+        tid = index.lookup("Web  Accessibility")
+        index.save()
+    """
+
+    def __init__(self, vocabulary: str, path: Optional[Path] = None):
+        """
+        Initialize an empty index.
+
+        Args:
+            vocabulary: Vocabulary machine name
+            path: JSON file to persist the index to (optional)
+        """
+        self.vocabulary = vocabulary
+        self.path = Path(path) if path else None
+        self.terms: dict[int, IndexedTerm] = {}
+        self._by_name: dict[str, set[int]] = {}
+        self.max_changed = 0
+        self.refreshed_at = 0.0
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def __contains__(self, tid: int) -> bool:
+        return tid in self.terms
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the index has been filled from the site at least once."""
+        return self.refreshed_at > 0
+
+    @property
+    def age(self) -> float:
+        """Seconds since the last refresh."""
+        return time.time() - self.refreshed_at
+
+    def lookup(self, name: str) -> Optional[int]:
+        """
+        Resolve a term name to its tid.
+
+        When several terms share a name, the lowest tid wins, matching
+        loadByProperties() on the site.
+        """
+        tids = self._by_name.get(normalize_name(name))
+        return min(tids) if tids else None
+
+    def get(self, tid: int) -> Optional[IndexedTerm]:
+        return self.terms.get(tid)
+
+    def upsert(self, rows: Iterable[dict]) -> int:
+        """
+        Add or update terms from rows with tid, name, parent, weight and changed.
+
+        Returns the number of rows applied.
+        """
+        count = 0
+        for row in rows:
+            tid = int(row["tid"])
+            previous = self.terms.get(tid)
+            if previous:
+                self._unlink_name(previous)
+
+            term = IndexedTerm(
+                tid=tid,
+                name=row.get("name") or "",
+                parent=int(row.get("parent") or 0),
+                weight=int(row.get("weight") or 0),
+                changed=int(row.get("changed") or 0),
+            )
+            self.terms[tid] = term
+            self._by_name.setdefault(normalize_name(term.name), set()).add(tid)
+            self.max_changed = max(self.max_changed, term.changed)
+            count += 1
+
+        if count:
+            self._compute_depths()
+        return count
+
+    def remove(self, tids: Iterable[int]) -> None:
+        """Drop terms (e.g. deleted on the site)."""
+        for tid in tids:
+            term = self.terms.pop(tid, None)
+            if term:
+                self._unlink_name(term)
+        self._compute_depths()
+
+    def clear(self) -> None:
+        """Forget every term (before a full reload)."""
+        self.terms.clear()
+        self._by_name.clear()
+        self.max_changed = 0
+
+    def mark_refreshed(self) -> None:
+        self.refreshed_at = time.time()
+
+    def _unlink_name(self, term: IndexedTerm) -> None:
+        key = normalize_name(term.name)
+        tids = self._by_name.get(key)
+        if tids:
+            tids.discard(term.tid)
+            if not tids:
+                del self._by_name[key]
+
+    def _compute_depths(self) -> None:
+        """Set each term's depth from its parent chain (root terms are depth 0)."""
+        depths: dict[int, int] = {}
+        for tid in self.terms:
+            chain = []
+            current = tid
+            # Walk up until a known depth, a root or a cycle
+            while current in self.terms and current not in depths and current not in chain:
+                chain.append(current)
+                current = self.terms[current].parent
+            depth = depths.get(current, -1)
+            for node in reversed(chain):
+                depth += 1
+                depths[node] = depth
+        for tid, depth in depths.items():
+            self.terms[tid].depth = depth
+
+    def as_tree(self) -> list[dict]:
+        """
+        Terms in tree order (like loadTree): parents before children,
+        siblings by weight then name.
+        """
+        children: dict[int, list[IndexedTerm]] = {}
+        for term in self.terms.values():
+            parent = term.parent if term.parent in self.terms else 0
+            children.setdefault(parent, []).append(term)
+        for siblings in children.values():
+            siblings.sort(key=lambda t: (t.weight, t.name))
+
+        result = []
+        stack = list(reversed(children.get(0, [])))
+        while stack:
+            term = stack.pop()
+            result.append({"tid": term.tid, "name": term.name, "depth": term.depth})
+            stack.extend(reversed(children.get(term.tid, [])))
+        return result
+
+    def save(self) -> None:
+        """Write the index to `path` (no-op without a path)."""
+        if not self.path:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "vocabulary": self.vocabulary,
+            "max_changed": self.max_changed,
+            "terms": [
+                [t.tid, t.name, t.parent, t.weight, t.changed]
+                for t in self.terms.values()
+            ],
+        }
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False))
+        tmp.replace(self.path)
+
+    @classmethod
+    def load(cls, vocabulary: str, path: Path) -> VocabularyIndex:
+        """
+        Load a persisted index, or return an empty one if the file is
+        missing or unreadable.
+
+        A loaded index is not marked refreshed; the caller still runs an
+        (incremental) refresh before trusting it.
+        """
+        index = cls(vocabulary, path=path)
+        path = Path(path)
+        if not path.exists():
+            return index
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError) as e:
+            console.print(f"[yellow]Ignoring unreadable term index {path}: {e}[/yellow]")
+            return index
+        if data.get("vocabulary") != vocabulary:
+            return index
+
+        index.upsert(
+            {"tid": tid, "name": name, "parent": parent, "weight": weight, "changed": changed}
+            for tid, name, parent, weight, changed in data.get("terms", [])
+        )
+        return index
@@ -0,0 +1,305 @@
+"""
+Fuzzy matching of suggested tag names against vocabulary terms.
+
+Three tiers, cheapest first:
+1. Exact match on a normalized form ("Machine-learning" == "machine learning")
+2. Synonyms, which are indexed as extra forms of their term
+3. Character n-gram TF-IDF cosine similarity over all forms
+
+Scoring uses NumPy when it is installed (`uv sync --extra matching`) and a
+pure-Python fallback otherwise; both return the same results.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from typing import TYPE_CHECKING, Iterable, Optional
+
+from rich.console import Console
+
+from drupal_editor.operations.term_index import normalize_name
+
+if TYPE_CHECKING:
+    from drupal_editor.operations.term_index import VocabularyIndex
+
+console = Console()
+
+_SEPARATORS_RE = re.compile(r"[\W_]+", re.UNICODE)
+
+# Names scored per vectorized pass (bounds the size of the posting expansion)
+_QUERY_BLOCK = 256
+
+
+def match_key(name: str) -> str:
+    """Normalized form used for matching: punctuation and separators become spaces."""
+    return " ".join(_SEPARATORS_RE.sub(" ", normalize_name(name)).split())
+
+
+def _ngrams(key: str, n: int) -> dict[str, int]:
+    """Character n-gram counts of a match key, padded at word boundaries."""
+    padded = f" {key} "
+    counts: dict[str, int] = {}
+    for i in range(max(len(padded) - n + 1, 1)):
+        gram = padded[i:i + n]
+        counts[gram] = counts.get(gram, 0) + 1
+    return counts
+
+
+class TermMatcher:
+    """
+    Match names to term IDs with normalized forms, synonyms and n-grams.
+
+    Usage:
+        matcher = TermMatcher.from_index(index, synonyms={"ML": 17})
+        matcher.match(["Machine-learning", "a11y"], k=3)
+        # [[(17, 1.0)], [(23, 0.71), (8, 0.42)]]
+    """
+
+    def __init__(
+        self,
+        terms: Iterable[tuple[int, str]],
+        synonyms: Optional[dict[str, int]] = None,
+        n: int = 3,
+    ):
+        """
+        Build the matcher.
+
+        Args:
+            terms: (tid, name) pairs
+            synonyms: Extra names for terms, mapping synonym -> tid
+            n: Character n-gram size
+        """
+        self.n = n
+        self.forms: list[str] = []
+        self.form_tids: list[int] = []
+        self._exact: dict[str, int] = {}
+        # Forms with spaces removed ("data base" -> "database"); only consulted
+        # when the normalized form itself has no exact match
+        self._compact: dict[str, int] = {}
+
+        for tid, name in terms:
+            self._add_form(tid, name)
+        for synonym, tid in (synonyms or {}).items():
+            self._add_form(tid, synonym)
+
+        self.tids = sorted(set(self.form_tids))
+        self._term_of_tid = {tid: i for i, tid in enumerate(self.tids)}
+        self._form_terms = [self._term_of_tid[tid] for tid in self.form_tids]
+        self._build_ngram_index()
+
+    @classmethod
+    def from_index(
+        cls,
+        index: "VocabularyIndex",
+        synonyms: Optional[dict[str, int]] = None,
+        n: int = 3,
+    ) -> TermMatcher:
+        """Build a matcher over every term in a VocabularyIndex."""
+        return cls(((t.tid, t.name) for t in index.terms.values()), synonyms=synonyms, n=n)
+
+    def __len__(self) -> int:
+        return len(self.tids)
+
+    def _add_form(self, tid: int, name: str) -> None:
+        key = match_key(name)
+        if not key:
+            return
+        # The lowest tid owns an exact form, matching loadByProperties()
+        if key not in self._exact or tid < self._exact[key]:
+            self._exact[key] = tid
+        compact = key.replace(" ", "")
+        if compact not in self._compact or tid < self._compact[compact]:
+            self._compact[compact] = tid
+        self.forms.append(key)
+        self.form_tids.append(tid)
+
+    def _build_ngram_index(self) -> None:
+        """Inverted index of L2-normalized TF-IDF n-gram weights."""
+        form_grams = [_ngrams(form, self.n) for form in self.forms]
+        df: dict[str, int] = {}
+        for grams in form_grams:
+            for gram in grams:
+                df[gram] = df.get(gram, 0) + 1
+
+        total = len(self.forms)
+        self.idf = {gram: math.log((total + 1) / (count + 1)) + 1.0 for gram, count in df.items()}
+
+        postings: dict[str, list[tuple[int, float]]] = {}
+        for row, grams in enumerate(form_grams):
+            weights = {gram: tf * self.idf[gram] for gram, tf in grams.items()}
+            norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+            for gram, weight in weights.items():
+                postings.setdefault(gram, []).append((row, weight / norm))
+
+        # CSR layout: gram -> slice of (form row, weight)
+        self.gram_ids = {gram: i for i, gram in enumerate(postings)}
+        self._post_ptr = [0]
+        self._post_rows: list[int] = []
+        self._post_weights: list[float] = []
+        for gram in postings:
+            for row, weight in postings[gram]:
+                self._post_rows.append(row)
+                self._post_weights.append(weight)
+            self._post_ptr.append(len(self._post_rows))
+
+        self._np = _numpy()
+        if self._np is not None:
+            np = self._np
+            self._np_ptr = np.asarray(self._post_ptr, dtype=np.int64)
+            self._np_rows = np.asarray(self._post_rows, dtype=np.int64)
+            self._np_weights = np.asarray(self._post_weights, dtype=np.float64)
+            self._np_form_terms = np.asarray(self._form_terms, dtype=np.int64)
+            self._np_tids = np.asarray(self.tids, dtype=np.int64)
+
+    def _query_vector(self, key: str) -> list[tuple[int, float]]:
+        """(gram id, weight) pairs of a query; unknown grams are dropped."""
+        grams = _ngrams(key, self.n)
+        weights = {gram: tf * self.idf.get(gram, 0.0) for gram, tf in grams.items()}
+        # Normalize over all grams, so unseen ones still lower the score
+        norm = math.sqrt(sum(
+            (tf * self.idf.get(gram, math.log(len(self.forms) + 1) + 1.0)) ** 2
+            for gram, tf in grams.items()
+        )) or 1.0
+        return [
+            (self.gram_ids[gram], weight / norm)
+            for gram, weight in weights.items()
+            if gram in self.gram_ids
+        ]
+
+    def lookup(self, name: str) -> Optional[int]:
+        """Exact match on the normalized form, else the compact form (incl. synonyms)."""
+        key = match_key(name)
+        tid = self._exact.get(key)
+        if tid is None:
+            tid = self._compact.get(key.replace(" ", ""))
+        return tid
+
+    def match(
+        self,
+        names: list[str],
+        k: int = 5,
+        min_score: float = 0.3,
+    ) -> list[list[tuple[int, float]]]:
+        """
+        Top-k candidate terms for each name.
+
+        Exact (normalized or synonym) matches return [(tid, 1.0)]; other
+        names are scored by n-gram cosine similarity, best form per term.
+
+        Args:
+            names: Names to resolve
+            k: Candidates per name
+            min_score: Drop candidates below this similarity
+
+        Returns:
+            One list of (tid, score) per name, best first
+        """
+        results: list[Optional[list[tuple[int, float]]]] = [None] * len(names)
+        fuzzy: list[tuple[int, list[tuple[int, float]]]] = []
+        for i, name in enumerate(names):
+            tid = self.lookup(name)
+            if tid is not None:
+                results[i] = [(tid, 1.0)]
+            else:
+                fuzzy.append((i, self._query_vector(match_key(name))))
+
+        if fuzzy and self.forms:
+            score = self._score_numpy if self._np is not None else self._score_python
+            for i, candidates in zip((i for i, _ in fuzzy), score([q for _, q in fuzzy], k, min_score)):
+                results[i] = candidates
+
+        return [r or [] for r in results]
+
+    def _score_python(
+        self,
+        queries: list[list[tuple[int, float]]],
+        k: int,
+        min_score: float,
+    ) -> list[list[tuple[int, float]]]:
+        results = []
+        for query in queries:
+            form_scores: dict[int, float] = {}
+            for gram_id, q_weight in query:
+                for p in range(self._post_ptr[gram_id], self._post_ptr[gram_id + 1]):
+                    row = self._post_rows[p]
+                    form_scores[row] = form_scores.get(row, 0.0) + q_weight * self._post_weights[p]
+
+            term_scores: dict[int, float] = {}
+            for row, value in form_scores.items():
+                term = self._form_terms[row]
+                if value >= min_score and value > term_scores.get(term, 0.0):
+                    term_scores[term] = value
+
+            best = sorted(term_scores.items(), key=lambda item: (-item[1], self.tids[item[0]]))
+            results.append([(self.tids[term], round(value, 4)) for term, value in best[:k]])
+        return results
+
+    def _score_numpy(
+        self,
+        queries: list[list[tuple[int, float]]],
+        k: int,
+        min_score: float,
+    ) -> list[list[tuple[int, float]]]:
+        np = self._np
+        n_forms = len(self.forms)
+        results = []
+
+        for start in range(0, len(queries), _QUERY_BLOCK):
+            chunk = queries[start:start + _QUERY_BLOCK]
+            q_index = np.asarray([qi for qi, query in enumerate(chunk) for _ in query], dtype=np.int64)
+            gram_ids = np.asarray([g for query in chunk for g, _ in query], dtype=np.int64)
+            q_weights = np.asarray([w for query in chunk for _, w in query], dtype=np.float64)
+            block_results: list[list[tuple[int, float]]] = [[] for _ in chunk]
+
+            if gram_ids.size:
+                # Expand every query gram into its postings
+                starts = self._np_ptr[gram_ids]
+                lengths = self._np_ptr[gram_ids + 1] - starts
+                offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+                cells = np.repeat(q_index, lengths) * n_forms + self._np_rows[offsets]
+                weights = self._np_weights[offsets] * np.repeat(q_weights, lengths)
+
+                # Sum per touched (query, form) cell only, then drop weak
+                # cells before any sorting (a term's best form must pass too)
+                cells, inverse = np.unique(cells, return_inverse=True)
+                scores = np.bincount(inverse.ravel(), weights=weights)
+                strong = scores >= min_score
+                cells, scores = cells[strong], scores[strong]
+                queries_of = cells // n_forms
+                terms_of = self._np_form_terms[cells % n_forms]
+
+                # Best form per (query, term)
+                order = np.lexsort((-scores, terms_of, queries_of))
+                queries_of, terms_of, scores = queries_of[order], terms_of[order], scores[order]
+                first = np.ones(len(order), dtype=bool)
+                first[1:] = (queries_of[1:] != queries_of[:-1]) | (terms_of[1:] != terms_of[:-1])
+                queries_of, terms_of, scores = queries_of[first], terms_of[first], scores[first]
+
+                # Top k per query: best score first, lowest tid on ties
+                tids = self._np_tids[terms_of]
+                order = np.lexsort((tids, -scores, queries_of))
+                queries_of, tids, scores = queries_of[order], tids[order], scores[order]
+                group_starts = np.searchsorted(queries_of, np.arange(len(chunk)))
+                keep = np.arange(len(queries_of)) - group_starts[queries_of] < k
+
+                for qi, tid, value in zip(queries_of[keep], tids[keep], scores[keep]):
+                    block_results[qi].append((int(tid), round(float(value), 4)))
+
+            results.extend(block_results)
+        return results
+
+_numpy_warned = False
+
+
+def _numpy():
+    """Return the numpy module, or None (with a one-time notice) if missing."""
+    global _numpy_warned
+    try:
+        import numpy
+    except ImportError:
+        if not _numpy_warned:
+            console.print("[dim]NumPy not installed - using pure-Python term matching[/dim]")
+            _numpy_warned = True
+        return None
+    return numpy
@@ -0,0 +1,234 @@
+"""
+Compact, array-backed vocabulary tree.
+
+Terms are stored as parallel arrays (tid, parent row, weight, name id,
+usage) with names interned in a shared table. After building, the rows are
+laid out in pre-order, so every subtree is a contiguous slice: descendant
+queries are slices and ancestor checks are two integer comparisons.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Iterable, Iterator, Optional
+
+
+class TermTree:
+    """
+    A vocabulary's hierarchy in parallel arrays.
+
+    Build it with add() / add_rows() (page by page is fine), then call
+    finalize() before querying. Terms with several parents are placed under
+    their first parent; terms whose parent is missing become roots.
+
+    Usage:
+        tree = TermTree("topic")
+        async for rows in manager.iter_term_pages("topic"):
+            tree.add_rows(rows)
+        tree.finalize()
+
+        tree.ancestors(42)        # [parent_tid, grandparent_tid, ...]
+        tree.descendants(7)       # every tid below 7, in tree order
+        tree.subtree_usage(7)     # usage of 7 plus all its descendants
+    """
+
+    def __init__(self, vocabulary: str):
+        self.vocabulary = vocabulary
+        self.tids = array("q")
+        self.parent_tids = array("q")
+        self.weights = array("l")
+        self.name_ids = array("l")
+        self.usage = array("q")
+        self.names: list[str] = []
+        self._name_ids: dict[str, int] = {}
+        self._row_of: dict[int, int] = {}
+
+        # Filled by finalize()
+        self.parents = array("l")  # parent row, -1 for roots
+        self.depths = array("l")
+        self.order = array("l")  # rows in pre-order
+        self.position = array("l")  # row -> index into order
+        self.sizes = array("l")  # subtree size including the term
+        self._finalized = False
+
+    def __len__(self) -> int:
+        return len(self.tids)
+
+    def __contains__(self, tid: int) -> bool:
+        return tid in self._row_of
+
+    def add(self, tid: int, name: str, parent: int = 0, weight: int = 0, usage: int = 0) -> None:
+        """Add a term (or overwrite it if the tid is already present)."""
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._name_ids[name] = len(self.names)
+            self.names.append(name)
+
+        row = self._row_of.get(tid)
+        if row is None:
+            self._row_of[tid] = len(self.tids)
+            self.tids.append(tid)
+            self.parent_tids.append(parent)
+            self.weights.append(weight)
+            self.name_ids.append(name_id)
+            self.usage.append(usage)
+        else:
+            self.parent_tids[row] = parent
+            self.weights[row] = weight
+            self.name_ids[row] = name_id
+            self.usage[row] = usage
+        self._finalized = False
+
+    def add_rows(self, rows: Iterable[dict]) -> None:
+        """Add rows with tid, name, parent, weight and (optionally) usage."""
+        for row in rows:
+            self.add(
+                int(row["tid"]),
+                row.get("name") or "",
+                int(row.get("parent") or 0),
+                int(row.get("weight") or 0),
+                int(row.get("usage") or 0),
+            )
+
+    def finalize(self) -> TermTree:
+        """Resolve parent rows and compute the pre-order layout and depths."""
+        n = len(self.tids)
+        row_of = self._row_of
+        self.parents = array("l", (row_of.get(p, -1) if p else -1 for p in self.parent_tids))
+
+        # Children lists in (weight, name) order; cycles are broken by
+        # treating any term not reached from a root as a root itself
+        children: list[list[int]] = [[] for _ in range(n)]
+        roots = []
+        for row in range(n):
+            parent = self.parents[row]
+            if parent < 0 or parent == row:
+                self.parents[row] = -1
+                roots.append(row)
+            else:
+                children[parent].append(row)
+
+        def sort_key(row: int) -> tuple[int, str]:
+            return self.weights[row], self.names[self.name_ids[row]]
+
+        for siblings in children:
+            siblings.sort(key=sort_key)
+        roots.sort(key=sort_key)
+
+        self.order = array("l")
+        self.position = array("l", [-1]) * n
+        self.depths = array("l", [0]) * n
+        self.sizes = array("l", [1]) * n
+
+        def walk(start: int) -> None:
+            stack = [(start, 0, False)]
+            while stack:
+                row, depth, closing = stack.pop()
+                if closing:
+                    # All descendants have been placed after this row
+                    self.sizes[row] = len(self.order) - self.position[row]
+                    continue
+                if self.position[row] >= 0:
+                    continue
+                self.position[row] = len(self.order)
+                self.order.append(row)
+                self.depths[row] = depth
+                stack.append((row, depth, True))
+                for child in reversed(children[row]):
+                    stack.append((child, depth + 1, False))
+
+        for root in roots:
+            walk(root)
+        for row in range(n):
+            if self.position[row] < 0:
+                self.parents[row] = -1
+                walk(row)
+
+        self._finalized = True
+        return self
+
+    def _row(self, tid: int) -> int:
+        if not self._finalized:
+            raise RuntimeError("TermTree.finalize() must be called before querying")
+        row = self._row_of.get(tid)
+        if row is None:
+            raise KeyError(tid)
+        return row
+
+    def name(self, tid: int) -> str:
+        return self.names[self.name_ids[self._row(tid)]]
+
+    def parent(self, tid: int) -> int:
+        """Parent tid, or 0 for a root term."""
+        parent = self.parents[self._row(tid)]
+        return self.tids[parent] if parent >= 0 else 0
+
+    def depth(self, tid: int) -> int:
+        return self.depths[self._row(tid)]
+
+    def children(self, tid: int) -> list[int]:
+        """Direct children in tree order."""
+        row = self._row(tid)
+        start = self.position[row] + 1
+        end = self.position[row] + self.sizes[row]
+        child_depth = self.depths[row] + 1
+        return [
+            self.tids[r]
+            for r in self.order[start:end]
+            if self.depths[r] == child_depth
+        ]
+
+    def ancestors(self, tid: int) -> list[int]:
+        """Parent, grandparent, ... up to the root."""
+        result = []
+        row = self.parents[self._row(tid)]
+        while row >= 0:
+            result.append(self.tids[row])
+            row = self.parents[row]
+        return result
+
+    def descendants(self, tid: int) -> list[int]:
+        """Every term below `tid`, in tree order."""
+        row = self._row(tid)
+        start = self.position[row] + 1
+        return [self.tids[r] for r in self.order[start:self.position[row] + self.sizes[row]]]
+
+    def is_ancestor(self, ancestor: int, tid: int) -> bool:
+        """Whether `ancestor` is strictly above `tid` in the tree."""
+        a = self._row(ancestor)
+        pos = self.position[self._row(tid)]
+        return self.position[a] < pos < self.position[a] + self.sizes[a]
+
+    def subtree_usage(self, tid: int) -> int:
+        """Usage of `tid` plus all its descendants."""
+        row = self._row(tid)
+        start = self.position[row]
+        return sum(self.usage[r] for r in self.order[start:start + self.sizes[row]])
+
+    def roots(self) -> list[int]:
+        return [self.tids[r] for r in self.order if self.parents[r] < 0]
+
+    def iter_rows(self) -> Iterator[dict]:
+        """Terms in tree order as dicts (tid, name, parent, weight, depth, usage)."""
+        if not self._finalized:
+            self.finalize()
+        for row in self.order:
+            parent = self.parents[row]
+            yield {
+                "tid": self.tids[row],
+                "name": self.names[self.name_ids[row]],
+                "parent": self.tids[parent] if parent >= 0 else 0,
+                "weight": self.weights[row],
+                "depth": self.depths[row],
+                "usage": self.usage[row],
+            }
+
+    def find(self, name: str) -> Optional[int]:
+        """First tid (in tree order) with exactly this name."""
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            return None
+        for row in self.order:
+            if self.name_ids[row] == name_id:
+                return self.tids[row]
+        return None
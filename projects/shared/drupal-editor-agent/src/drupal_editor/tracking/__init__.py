@@ -1,6 +1,35 @@
 """Change tracking and reporting."""
 
 from drupal_editor.tracking.changelog import ChangeLog, ChangeRecord
-from drupal_editor.tracking.summary import SummaryGenerator
+from drupal_editor.tracking.diff import DiffHunk, ValueDiff, compute_diff
+from drupal_editor.tracking.columnar import read_arrow, read_parquet, write_arrow, write_parquet
+from drupal_editor.tracking.ndjson import FsyncPolicy, NDJSONSink, read_ndjson
+from drupal_editor.tracking.shards import MergeResult, find_shards, iter_merged, merge_shards, open_shard
+from drupal_editor.tracking.store import ChangeStore, OperationStats, SessionInfo, SQLiteSink
+from drupal_editor.tracking.summary import StreamingSummary, SummaryGenerator
 
-__all__ = ["ChangeLog", "ChangeRecord", "SummaryGenerator"]
+__all__ = [
+    "ChangeLog",
+    "ChangeRecord",
+    "ChangeStore",
+    "DiffHunk",
+    "FsyncPolicy",
+    "MergeResult",
+    "NDJSONSink",
+    "OperationStats",
+    "SessionInfo",
+    "SQLiteSink",
+    "StreamingSummary",
+    "SummaryGenerator",
+    "ValueDiff",
+    "compute_diff",
+    "find_shards",
+    "iter_merged",
+    "merge_shards",
+    "open_shard",
+    "read_arrow",
+    "read_ndjson",
+    "read_parquet",
+    "write_arrow",
+    "write_parquet",
+]
@@ -8,47 +8,274 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from itertools import count
+from typing import TYPE_CHECKING, Iterator, Optional
 from pathlib import Path
 import json
+import sys
+import threading
+import uuid
+
+from drupal_editor.tracking.diff import ValueDiff, compute_diff
+from drupal_editor.tracking.values import ValueStore
+
+if TYPE_CHECKING:
+    from drupal_editor.tracking.ndjson import NDJSONSink
+    from drupal_editor.tracking.store import SQLiteSink
+    from drupal_editor.tracking.writer import SinkWriter
+
+
+# Values up to this many characters are kept inline on the record; longer
+# ones (HTML bodies) go to the changelog's ValueStore and the record keeps a key
+INLINE_VALUE_LIMIT = 256
 
 
-@dataclass
 class ChangeRecord:
-    """A single change made to the Drupal site."""
-
-    timestamp: datetime
-    auth_method: str  # "terminus" or "playwright"
-    operation: str  # "update_node", "update_taxonomy", "update_media"
-    target: str  # "node/123", "taxonomy_term/456", "media/789"
-    field: str  # Field that was changed
-    old_value: str
-    new_value: str
-    reason: str  # Why this change was made
-    revision_id: Optional[int] = None
-    revision_url: Optional[str] = None
-    screenshot_path: Optional[str] = None  # For Playwright operations
-    success: bool = True
-    error: Optional[str] = None
-
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
+    """
+    A single change made to the Drupal site.
+
+    Slotted and compact: auth method, operation, field and reason are
+    interned, the revision URL's site prefix is shared, and long old/new
+    values live in the owning ChangeLog's ValueStore (deduplicated,
+    compressed, the new value as a delta against the old one) so a record
+    costs a bounded few hundred bytes regardless of body size. Records built
+    without a store (read back from NDJSON, SQLite or Parquet) keep their
+    values inline and free them with the record. Attribute access is
+    unchanged.
+
+    `diff` is the word-level change between the two values (computed on
+    first use). With retain_values=False only the diff is kept: old_value
+    and new_value read as "", and summaries and exports use the diff.
+
+    With defer_packing=True the raw values are kept as given until pack()
+    is called; ChangeLog.record() uses this so the hashing, compression and
+    diffing happen on its writer thread.
+    """
+
+    __slots__ = (
+        "seq",  # Position in the session, from ChangeLog
+        "timestamp",
+        "auth_method",  # "terminus", "rest" or "playwright"
+        "operation",  # "update_node", "update_taxonomy", "update_media"
+        "target",  # "node/123", "taxonomy_term/456", "media/789"
+        "field",  # Field that was changed
+        "_old",  # str, or ValueStore key (bytes)
+        "_new",
+        "_store",  # ValueStore holding keyed values, or None
+        "_retain",  # retain_values, until pack() has run (then None)
+        "reason",  # Why this change was made
+        "revision_id",
+        "_revision_base",
+        "_revision_path",
+        "screenshot_path",  # For Playwright operations
+        "success",
+        "error",
+        "_diff",  # ValueDiff, computed lazily while values are retained
+    )
+
+    def __init__(
+        self,
+        timestamp: datetime,
+        auth_method: str,
+        operation: str,
+        target: str,
+        field: str,
+        old_value: str,
+        new_value: str,
+        reason: str,
+        revision_id: Optional[int] = None,
+        revision_url: Optional[str] = None,
+        screenshot_path: Optional[str] = None,
+        success: bool = True,
+        error: Optional[str] = None,
+        diff: Optional[ValueDiff] = None,
+        retain_values: bool = True,
+        seq: Optional[int] = None,
+        store: Optional[ValueStore] = None,
+        defer_packing: bool = False,
+    ):
+        self.seq = seq
+        self._store = store
+        self.timestamp = timestamp
+        self.auth_method = sys.intern(auth_method)
+        self.operation = sys.intern(operation)
+        self.target = target
+        self.field = sys.intern(field)
+        self.reason = sys.intern(reason)
+        self.revision_id = revision_id
+        self.revision_url = revision_url
+        self.screenshot_path = screenshot_path
+        self.success = success
+        self.error = error
+        self._old = old_value or ""
+        self._new = new_value or ""
+        self._diff = diff
+        self._retain: Optional[bool] = retain_values
+        if not defer_packing:
+            self.pack()
+
+    def pack(self) -> None:
+        """Move long values into the store, or reduce them to the diff."""
+        retain, self._retain = self._retain, None
+        if retain is None:
+            return
+        if retain:
+            self._old = _pack_value(self._store, self._old)
+            self._new = _pack_value(self._store, self._new, base=self._old)
+        else:
+            # Set the diff before dropping the values it is computed from
+            self._diff = self._diff or compute_diff(self._old, self._new)
+            self._old = self._new = ""
+
+    @property
+    def old_value(self) -> str:
+        return _unpack_value(self._store, self._old)
+
+    @old_value.setter
+    def old_value(self, value: str) -> None:
+        self.pack()
+        self._old = _pack_value(self._store, value)
+        self._diff = None
+
+    @property
+    def new_value(self) -> str:
+        return _unpack_value(self._store, self._new)
+
+    @new_value.setter
+    def new_value(self, value: str) -> None:
+        self.pack()
+        self._new = _pack_value(self._store, value, base=self._old)
+        self._diff = None
+
+    @property
+    def diff(self) -> ValueDiff:
+        """Word-level diff from old_value to new_value."""
+        if self._diff is None:
+            self._diff = compute_diff(self.old_value, self.new_value)
+        return self._diff
+
+    @property
+    def revision_url(self) -> Optional[str]:
+        if self._revision_path is None:
+            return None
+        return self._revision_base + self._revision_path
+
+    @revision_url.setter
+    def revision_url(self, url: Optional[str]) -> None:
+        if url is None:
+            self._revision_base, self._revision_path = "", None
+            return
+        # "https://example.com" is shared by every record of a site
+        scheme_end = url.find("//")
+        path_start = url.find("/", scheme_end + 2) if scheme_end >= 0 else -1
+        if path_start < 0:
+            self._revision_base, self._revision_path = "", url
+        else:
+            self._revision_base = sys.intern(url[:path_start])
+            self._revision_path = url[path_start:]
+
+    @property
+    def old_value_hash(self) -> str:
+        """Content hash of old_value (hex), for cheap equality checks."""
+        return _value_hash(self._old)
+
+    @property
+    def new_value_hash(self) -> str:
+        """Content hash of new_value (hex)."""
+        return _value_hash(self._new)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ChangeRecord):
+            return NotImplemented
+        return self.to_dict(truncate=None) == other.to_dict(truncate=None)
+
+    __hash__ = None  # type: ignore[assignment]  # mutable, like the dataclass was
+
+    def __repr__(self) -> str:
+        return (
+            f"ChangeRecord(seq={self.seq!r}, timestamp={self.timestamp!r}, operation={self.operation!r}, "
+            f"target={self.target!r}, field={self.field!r}, "
+            f"change={self.diff.format(max_chars=60)!r}, success={self.success!r})"
+        )
+
+    def to_dict(self, truncate: Optional[int] = 100) -> dict:
+        """
+        Convert to dictionary for JSON serialization.
+
+        Values (and the removed/added spans of the diff) longer than
+        `truncate` characters are shortened for display; pass truncate=None
+        to keep them whole (e.g. for the NDJSON log).
+        """
         return {
+            "seq": self.seq,
             "timestamp": self.timestamp.isoformat(),
             "auth_method": self.auth_method,
             "operation": self.operation,
             "target": self.target,
             "field": self.field,
-            "old_value": self.old_value[:100] + "..." if len(self.old_value) > 100 else self.old_value,
-            "new_value": self.new_value[:100] + "..." if len(self.new_value) > 100 else self.new_value,
+            "old_value": _truncate(self.old_value, truncate),
+            "new_value": _truncate(self.new_value, truncate),
             "reason": self.reason,
             "revision_id": self.revision_id,
             "revision_url": self.revision_url,
             "screenshot_path": self.screenshot_path,
             "success": self.success,
             "error": self.error,
+            "diff": self.diff.to_dict(truncate),
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> ChangeRecord:
+        """Rebuild a record from to_dict() output."""
+        return cls(
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            auth_method=data["auth_method"],
+            operation=data["operation"],
+            target=data["target"],
+            field=data["field"],
+            old_value=data.get("old_value") or "",
+            new_value=data.get("new_value") or "",
+            reason=data.get("reason") or "",
+            revision_id=data.get("revision_id"),
+            revision_url=data.get("revision_url"),
+            screenshot_path=data.get("screenshot_path"),
+            success=data.get("success", True),
+            error=data.get("error"),
+            diff=ValueDiff.from_dict(data["diff"]) if data.get("diff") else None,
+            seq=data.get("seq"),
+        )
+
+
+def _pack_value(store: Optional[ValueStore], value: str, base: str | bytes | None = None) -> str | bytes:
+    """Keep short values (or any, without a store) inline; store long ones and return their key."""
+    value = value or ""
+    if store is None or len(value) <= INLINE_VALUE_LIMIT:
+        return value
+    return store.put(value, base=base if isinstance(base, bytes) else None)
+
+
+def _unpack_value(store: Optional[ValueStore], packed: str | bytes) -> str:
+    if isinstance(packed, bytes):
+        return store.get(packed)  # type: ignore[union-attr]
+    return packed
+
+
+def _value_hash(packed: str | bytes) -> str:
+    if isinstance(packed, bytes):
+        return packed.hex()
+    return ValueStore.key_for(packed).hex()
+
+
+def new_session_id() -> str:
+    """Readable, sortable and collision-free: "20251227_143022_1a2b3c4d"."""
+    return f"{datetime.now():%Y%m%d_%H%M%S}_{uuid.uuid4().hex[:8]}"
+
+
+def _truncate(value: str, limit: Optional[int]) -> str:
+    if limit is None or len(value) <= limit:
+        return value
+    return value[:limit] + "..."
+
 
 @dataclass
 class ChangeLog:
@@ -66,10 +293,80 @@ class ChangeLog:
             new_value="New text",
             reason="Ava: Fixed spelling",
         )
+
+        # Also append each record to an NDJSON file as it happens
+        changelog.stream_to("logs/changes.ndjson", fsync="every_n", fsync_every=50)
+
+        # ...and/or to the SQLite store shared by all sessions
+        changelog.store_to("logs/changes.db")
+
+        # Worker processes of one job: same session ID, one shard each
+        changelog = ChangeLog(session_id=job_session_id)
+        changelog.shard_to("logs/shards")
+
+        # Keep only word-level diffs, not full before/after copies
+        changelog = ChangeLog(retain_values=False)
+
+        # Indexed lookups, no scans
+        changelog.by_target("node/123")
+        changelog.by_operation("update_media", success=False)
+
+    Records must be added through record() (or passed to the constructor)
+    so the indexes stay in sync; lists returned by the lookup methods are
+    the live indexes and must not be modified.
+
+    record() is safe to call from concurrent asyncio tasks and threads and
+    takes no locks: every record gets a unique, increasing `seq` from an
+    atomic counter, is appended to the (GIL-atomic) lists, and is handed to
+    a background writer thread. That thread packs its values into the
+    ValueStore (or reduces them to the diff) and then writes it to the
+    sinks; until then the record holds the raw values. close() or flush()
+    waits for it. Under threads, list order can differ slightly from seq
+    order; ordered() sorts by seq.
     """
 
     records: list[ChangeRecord] = field(default_factory=list)
-    session_id: str = field(default_factory=lambda: datetime.now().strftime("%Y%m%d_%H%M%S"))
+    session_id: str = field(default_factory=lambda: new_session_id())
+    sinks: list["NDJSONSink | SQLiteSink"] = field(default_factory=list, repr=False)
+    retain_values: bool = True  # False: keep only each record's diff
+
+    _successful: list[ChangeRecord] = field(default_factory=list, init=False, repr=False)
+    _failed: list[ChangeRecord] = field(default_factory=list, init=False, repr=False)
+    _by_target: dict[str, list[ChangeRecord]] = field(default_factory=dict, init=False, repr=False)
+    _by_operation: dict[tuple[str, Optional[bool]], list[ChangeRecord]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _by_auth_method: dict[str, list[ChangeRecord]] = field(default_factory=dict, init=False, repr=False)
+    _by_revision: dict[int, list[ChangeRecord]] = field(default_factory=dict, init=False, repr=False)
+    _seq: Iterator[int] = field(init=False, repr=False)
+    # Long values of this log's records; freed with the log and its records
+    _values: ValueStore = field(default_factory=ValueStore, init=False, repr=False, compare=False)
+    _writer: Optional["SinkWriter"] = field(default=None, init=False, repr=False)
+    _writer_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+    _closed: bool = field(default=False, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        initial, self.records = self.records, []
+        next_seq = 0
+        for record in initial:
+            if record.seq is None:
+                record.seq = next_seq
+            next_seq = max(next_seq, record.seq + 1)
+            self._append(record)
+        self._seq = count(next_seq)
+        if self.sinks:
+            self._start_writer()
+
+    def _append(self, record: ChangeRecord) -> None:
+        """Add a record to the list and every index."""
+        self.records.append(record)
+        (self._successful if record.success else self._failed).append(record)
+        self._by_target.setdefault(record.target, []).append(record)
+        self._by_operation.setdefault((record.operation, None), []).append(record)
+        self._by_operation.setdefault((record.operation, record.success), []).append(record)
+        self._by_auth_method.setdefault(record.auth_method, []).append(record)
+        if record.revision_id is not None:
+            self._by_revision.setdefault(record.revision_id, []).append(record)
 
     def record(
         self,
@@ -86,8 +383,9 @@ class ChangeLog:
         success: bool = True,
         error: Optional[str] = None,
     ) -> ChangeRecord:
-        """Record a change."""
+        """Record a change (safe to call concurrently)."""
         change = ChangeRecord(
+            seq=next(self._seq),
             timestamp=datetime.now(),
             auth_method=auth_method,
             operation=operation,
@@ -101,17 +399,149 @@ class ChangeLog:
             screenshot_path=screenshot_path,
             success=success,
             error=error,
+            retain_values=self.retain_values,
+            store=self._values,
+            defer_packing=True,
         )
-        self.records.append(change)
+        self._append(change)
+        writer = self._writer or self._start_writer()
+        if writer is None:
+            change.pack()  # closed: nothing will pick it up
+        else:
+            writer.submit(change, self.session_id)
         return change
 
+    def add_sink(self, sink: "NDJSONSink | SQLiteSink") -> None:
+        """Write every future record to `sink` as well (from the writer thread)."""
+        self.sinks.append(sink)
+        self._start_writer()
+
+    def _start_writer(self) -> Optional["SinkWriter"]:
+        """Start the writer thread once (None after close())."""
+        with self._writer_lock:
+            if self._writer is None and not self._closed:
+                from drupal_editor.tracking.writer import SinkWriter
+
+                self._writer = SinkWriter(self.sinks)
+            return self._writer
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all records so far have reached the sinks."""
+        writer = self._writer
+        if writer is None:
+            return True
+        return writer.flush(timeout)
+
+    def stream_to(self, path: Path | str, **options) -> "NDJSONSink":
+        """
+        Append records to an NDJSON file as they are recorded.
+
+        Options are passed to NDJSONSink (fsync, fsync_every, fsync_interval,
+        buffer_size). Returns the sink.
+        """
+        from drupal_editor.tracking.ndjson import NDJSONSink
+
+        sink = NDJSONSink(path, **options)
+        self.add_sink(sink)
+        return sink
+
+    def shard_to(self, directory: Path | str, worker: Optional[str] = None, **options) -> "NDJSONSink":
+        """
+        Write records to this worker's shard of a multi-process session.
+
+        Every worker must use the same session_id; merge the shards with
+        tracking.shards.merge_shards(). Options are passed to NDJSONSink.
+        """
+        from drupal_editor.tracking.shards import open_shard
+
+        sink = open_shard(directory, self.session_id, worker, **options)
+        self.add_sink(sink)
+        return sink
+
+    def store_to(self, path: Path | str, **options) -> "SQLiteSink":
+        """
+        Write records to a SQLite ChangeStore in batched transactions.
+
+        Options are passed to SQLiteSink (batch_size, flush_interval).
+        Returns the sink; closing it also closes the database.
+        """
+        from drupal_editor.tracking.store import ChangeStore, SQLiteSink
+
+        sink = SQLiteSink(ChangeStore(path), close_store=True, **options)
+        self.add_sink(sink)
+        return sink
+
+    def close(self) -> None:
+        """Write out queued records, then sync and close all sinks."""
+        with self._writer_lock:
+            self._closed = True
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.close()
+        for sink in self.sinks:
+            sink.close()
+
+    def ordered(self) -> list[ChangeRecord]:
+        """Records in seq order."""
+        return sorted(self.records, key=lambda r: r.seq)
+
+    @classmethod
+    def from_ndjson(cls, path: Path | str) -> ChangeLog:
+        """
+        Rebuild a changelog from an NDJSON file written by NDJSONSink.
+
+        The session ID comes from the first record (or the file name).
+        """
+        from drupal_editor.tracking.ndjson import read_ndjson
+
+        records = []
+        session_id = None
+        for data in read_ndjson(path):
+            session_id = session_id or data.get("session_id")
+            records.append(ChangeRecord.from_dict(data))
+        return cls(records=records, session_id=session_id or Path(path).stem)
+
     def get_successful(self) -> list[ChangeRecord]:
         """Get all successful changes."""
-        return [r for r in self.records if r.success]
+        return self._successful
 
     def get_failed(self) -> list[ChangeRecord]:
         """Get all failed changes."""
-        return [r for r in self.records if not r.success]
+        return self._failed
+
+    @property
+    def successful_count(self) -> int:
+        return len(self._successful)
+
+    @property
+    def failed_count(self) -> int:
+        return len(self._failed)
+
+    @property
+    def auth_methods(self) -> list[str]:
+        """Auth methods used in this session, sorted."""
+        return sorted(self._by_auth_method)
+
+    @property
+    def operations(self) -> list[str]:
+        """Operations recorded in this session, sorted."""
+        return sorted({operation for operation, _ in self._by_operation})
+
+    def by_target(self, target: str) -> list[ChangeRecord]:
+        """All changes to one target (e.g. "node/123"), in order."""
+        return self._by_target.get(target, [])
+
+    def by_operation(self, operation: str, success: Optional[bool] = None) -> list[ChangeRecord]:
+        """Changes for one operation, optionally only successes or failures."""
+        return self._by_operation.get((operation, success), [])
+
+    def by_auth_method(self, auth_method: str) -> list[ChangeRecord]:
+        """Changes made through one backend."""
+        return self._by_auth_method.get(auth_method, [])
+
+    def by_revision(self, revision_id: int) -> list[ChangeRecord]:
+        """Changes that produced a given revision ID."""
+        return self._by_revision.get(revision_id, [])
 
     def to_json(self) -> str:
         """Export changelog as JSON."""
@@ -119,8 +549,8 @@ class ChangeLog:
             {
                 "session_id": self.session_id,
                 "total_changes": len(self.records),
-                "successful": len(self.get_successful()),
-                "failed": len(self.get_failed()),
+                "successful": self.successful_count,
+                "failed": self.failed_count,
                 "records": [r.to_dict() for r in self.records],
             },
             indent=2,
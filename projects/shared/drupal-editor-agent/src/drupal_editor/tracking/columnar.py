@@ -0,0 +1,272 @@
+"""
+Columnar changelog export (Apache Arrow / Parquet).
+
+Records are written in batches from any iterable (a ChangeLog, a
+ChangeStore query, an NDJSON file), so histories larger than memory can be
+exported. Columns are typed; the low-cardinality operation, auth_method,
+field and target type ("node" in "node/123") columns are dictionary-encoded.
+Free-form text such as reason and session_id stays plain strings.
+
+Parquet is the compact format for storage and for other tools. Arrow IPC
+files can be memory-mapped and loaded zero-copy.
+
+Needs pyarrow: `uv sync --extra analytics`.
+"""
+
+from __future__ import annotations
+
+import json
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from drupal_editor.tracking.changelog import ChangeLog, ChangeRecord
+
+# Dictionary-encoded string columns: only ones with a handful of distinct
+# values, so the cumulative dictionary stays tiny
+_DICTIONARY_COLUMNS = ("auth_method", "operation", "target_type", "field")
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError("pyarrow not installed. Run: uv sync --extra analytics") from e
+    return pyarrow
+
+
+def changelog_schema() -> "pa.Schema":
+    """Arrow schema of exported changelogs."""
+    pa = _pyarrow()
+    dictionary = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ("session_id", pa.string()),
+        ("seq", pa.int64()),
+        ("timestamp", pa.timestamp("us")),
+        ("auth_method", dictionary),
+        ("operation", dictionary),
+        ("target_type", dictionary),
+        ("target_id", pa.int64()),
+        ("target", pa.string()),
+        ("field", dictionary),
+        ("old_value", pa.string()),
+        ("new_value", pa.string()),
+        ("reason", pa.string()),
+        ("revision_id", pa.int64()),
+        ("revision_url", pa.string()),
+        ("screenshot_path", pa.string()),
+        ("success", pa.bool_()),
+        ("error", pa.string()),
+        ("diff", pa.string()),  # ValueDiff.to_dict() as JSON
+    ])
+
+
+class _BatchEncoder:
+    """
+    Turn ChangeRecords into record batches.
+
+    Dictionaries only ever grow, so each batch's dictionary extends the
+    previous one: the IPC writer can emit deltas, and codes stay stable
+    across the whole file. The dictionary array is only rebuilt when a
+    batch adds new values.
+    """
+
+    def __init__(self, session_id: Optional[str]):
+        self.pa = _pyarrow()
+        self.schema = changelog_schema()
+        self.session_id = session_id
+        self._values: dict[str, list[str]] = {name: [] for name in _DICTIONARY_COLUMNS}
+        self._codes: dict[str, dict[str, int]] = {name: {} for name in _DICTIONARY_COLUMNS}
+        self._dictionaries: dict[str, "pa.Array"] = {}
+
+    def _encode(self, column: str, values: list[Optional[str]]) -> "pa.DictionaryArray":
+        pa = self.pa
+        codes = self._codes[column]
+        known = self._values[column]
+        indices = []
+        for value in values:
+            if value is None:
+                indices.append(None)
+                continue
+            code = codes.get(value)
+            if code is None:
+                code = codes[value] = len(known)
+                known.append(value)
+            indices.append(code)
+        dictionary = self._dictionaries.get(column)
+        if dictionary is None or len(dictionary) != len(known):
+            dictionary = self._dictionaries[column] = pa.array(known, type=pa.string())
+        return pa.DictionaryArray.from_arrays(pa.array(indices, type=pa.int32()), dictionary)
+
+    def encode(self, items: list["ChangeRecord | tuple[str, ChangeRecord]"]) -> "pa.RecordBatch":
+        """Encode records, or (session_id, record) pairs from several sessions."""
+        pa = self.pa
+        records = []
+        session_ids = []
+        for item in items:
+            if isinstance(item, tuple):
+                session_ids.append(item[0])
+                records.append(item[1])
+            else:
+                session_ids.append(self.session_id)
+                records.append(item)
+
+        target_types = []
+        target_ids = []
+        for record in records:
+            kind, _, ident = record.target.partition("/")
+            target_types.append(kind)
+            target_ids.append(int(ident) if ident.isdigit() else None)
+
+        columns = {
+            "session_id": pa.array(session_ids, type=pa.string()),
+            "seq": pa.array([r.seq for r in records], type=pa.int64()),
+            "timestamp": pa.array([r.timestamp for r in records], type=pa.timestamp("us")),
+            "auth_method": self._encode("auth_method", [r.auth_method for r in records]),
+            "operation": self._encode("operation", [r.operation for r in records]),
+            "target_type": self._encode("target_type", target_types),
+            "target_id": pa.array(target_ids, type=pa.int64()),
+            "target": pa.array([r.target for r in records], type=pa.string()),
+            "field": self._encode("field", [r.field for r in records]),
+            "old_value": pa.array([r.old_value for r in records], type=pa.string()),
+            "new_value": pa.array([r.new_value for r in records], type=pa.string()),
+            "reason": pa.array([r.reason for r in records], type=pa.string()),
+            "revision_id": pa.array([r.revision_id for r in records], type=pa.int64()),
+            "revision_url": pa.array([r.revision_url for r in records], type=pa.string()),
+            "screenshot_path": pa.array([r.screenshot_path for r in records], type=pa.string()),
+            "success": pa.array([r.success for r in records], type=pa.bool_()),
+            "error": pa.array([r.error for r in records], type=pa.string()),
+            "diff": pa.array([_diff_json(r) for r in records], type=pa.string()),
+        }
+        return pa.RecordBatch.from_arrays([columns[f.name] for f in self.schema], schema=self.schema)
+
+
+def _diff_json(record: "ChangeRecord") -> str:
+    return json.dumps(record.diff.to_dict(), ensure_ascii=False, separators=(",", ":"))
+
+
+def _batches(records: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(records)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _session_of(records: Iterable, session_id: Optional[str]) -> Optional[str]:
+    """The given session ID, or the ChangeLog's own."""
+    return session_id if session_id is not None else getattr(records, "session_id", None)
+
+
+def write_parquet(
+    records: "ChangeLog | Iterable[ChangeRecord | tuple[str, ChangeRecord]]",
+    path: Path | str,
+    session_id: Optional[str] = None,
+    row_group_size: int = 50_000,
+    compression: str = "zstd",
+) -> int:
+    """
+    Write records to a Parquet file, one row group per batch.
+
+    Args:
+        records: ChangeRecords or (session_id, record) pairs, e.g. a
+                 ChangeLog or ChangeStore.iter_history(with_session=True);
+                 consumed once, in batches
+        path: Output file
+        session_id: Session column value (default: the ChangeLog's ID)
+        row_group_size: Records per row group (bounds memory use)
+        compression: Parquet codec
+
+    Returns:
+        Number of records written
+    """
+    encoder = _BatchEncoder(_session_of(records, session_id))
+    import pyarrow.parquet as pq
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    written = 0
+    with pq.ParquetWriter(path, encoder.schema, compression=compression) as writer:
+        for batch in _batches(records, row_group_size):
+            writer.write_batch(encoder.encode(batch), row_group_size=row_group_size)
+            written += len(batch)
+    return written
+
+
+def write_arrow(
+    records: "ChangeLog | Iterable[ChangeRecord | tuple[str, ChangeRecord]]",
+    path: Path | str,
+    session_id: Optional[str] = None,
+    batch_size: int = 50_000,
+) -> int:
+    """
+    Write records to an Arrow IPC file for zero-copy loading with read_arrow().
+
+    Args:
+        records: ChangeRecords or (session_id, record) pairs, e.g. a
+                 ChangeLog or ChangeStore.iter_history(with_session=True);
+                 consumed once, in batches
+        path: Output file
+        session_id: Session column value (default: the ChangeLog's ID)
+        batch_size: Records per record batch (bounds memory use)
+
+    Returns:
+        Number of records written
+    """
+    pa = _pyarrow()
+    encoder = _BatchEncoder(_session_of(records, session_id))
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Uncompressed, so reading can point straight into the mapped file
+    options = pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True)
+    written = 0
+    with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, encoder.schema, options=options) as writer:
+        for batch in _batches(records, batch_size):
+            writer.write_batch(encoder.encode(batch))
+            written += len(batch)
+    return written
+
+
+def read_arrow(path: Path | str) -> "pa.Table":
+    """Memory-map an Arrow IPC changelog; column buffers are not copied."""
+    pa = _pyarrow()
+    # The table's buffers point into the mapping and keep it alive
+    source = pa.memory_map(str(path), "r")
+    return pa.ipc.open_file(source).read_all()
+
+
+def read_parquet(path: Path | str, columns: Optional[list[str]] = None) -> "pa.Table":
+    """Read a Parquet changelog (optionally only some columns)."""
+    _pyarrow()
+    import pyarrow.parquet as pq
+
+    return pq.read_table(path, columns=columns, memory_map=True)
+
+
+def iter_table_records(table: "pa.Table") -> Iterator["ChangeRecord"]:
+    """Rebuild ChangeRecords from an exported table, batch by batch."""
+    from drupal_editor.tracking.changelog import ChangeRecord
+    from drupal_editor.tracking.diff import ValueDiff
+
+    for batch in table.to_batches():
+        for row in batch.to_pylist():
+            yield ChangeRecord(
+                timestamp=row["timestamp"],
+                auth_method=row["auth_method"],
+                operation=row["operation"],
+                target=row["target"],
+                field=row["field"],
+                old_value=row["old_value"] or "",
+                new_value=row["new_value"] or "",
+                reason=row["reason"] or "",
+                revision_id=row["revision_id"],
+                revision_url=row["revision_url"],
+                screenshot_path=row["screenshot_path"],
+                success=row["success"],
+                error=row["error"],
+                diff=ValueDiff.from_dict(json.loads(row["diff"])) if row.get("diff") else None,
+                seq=row.get("seq"),
+            )
@@ -0,0 +1,322 @@
+"""
+Word-level diffs of changed field values.
+
+A one-word spelling fix in a 20 KB body should be recorded (and shown) as
+that word plus a little context, not as two copies of the body. The common
+prefix and suffix are trimmed first, in C-speed slice comparisons, so only
+the changed middle is compared, first sentence by sentence and then word
+by word inside the sentences that differ. Unusually large rewrites fall
+back to a single replace hunk instead of an expensive word diff.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from typing import Optional
+
+# HTML tags, words, whitespace runs and single punctuation characters
+_TOKEN_RE = re.compile(r"<[^>]*>|\w+|\s+|[^\w\s]", re.UNICODE)
+
+# Sentences/blocks: text up to and including ., !, ?, > or a newline
+_SEGMENT_RE = re.compile(r"[^.!?>\n]*(?:[.!?>\n]+\s*|$)")
+
+# Above this many (old x new) tokens or segments, SequenceMatcher's
+# worst case gets slow; such regions become a single replace hunk
+_MAX_DIFF_CELLS = 2_000_000
+
+# Characters compared per step while trimming the common prefix/suffix
+_TRIM_STEP = 4096
+
+
+@dataclass
+class DiffHunk:
+    """One changed span: `removed` at `offset` in the old value became `added`."""
+
+    offset: int
+    removed: str
+    added: str
+    before: str = ""  # Unchanged context preceding the span
+    after: str = ""  # Unchanged context following the span
+
+    def to_dict(self, truncate: Optional[int] = None) -> dict:
+        return {
+            "at": self.offset,
+            "del": _clip(self.removed, truncate),
+            "ins": _clip(self.added, truncate),
+            "before": self.before,
+            "after": self.after,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> DiffHunk:
+        return cls(
+            offset=data["at"],
+            removed=data.get("del", ""),
+            added=data.get("ins", ""),
+            before=data.get("before", ""),
+            after=data.get("after", ""),
+        )
+
+
+@dataclass
+class ValueDiff:
+    """
+    The word-level changes between an old and a new value.
+
+    Usage:
+        diff = compute_diff(old_body, new_body)
+        diff.format("markdown")  # '...will ~~recieve~~ **receive** the...'
+        diff.apply(old_body) == new_body
+    """
+
+    old_length: int
+    new_length: int
+    hunks: list[DiffHunk] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.hunks)
+
+    def apply(self, old: str) -> str:
+        """Rebuild the new value from the old one."""
+        parts = []
+        position = 0
+        for hunk in self.hunks:
+            end = hunk.offset + len(hunk.removed)
+            if old[hunk.offset:end] != hunk.removed:
+                raise ValueError(f"Diff does not apply at offset {hunk.offset}")
+            parts.append(old[position:hunk.offset])
+            parts.append(hunk.added)
+            position = end
+        parts.append(old[position:])
+        return "".join(parts)
+
+    def format(self, style: str = "text", max_chars: Optional[int] = None) -> str:
+        """
+        Render the changes with their context.
+
+        Args:
+            style: "text" ([-removed-]{+added+}) or "markdown" (~~removed~~ **added**)
+            max_chars: Cut the result to about this length, noting how many
+                       further changes were left out
+
+        Returns:
+            The rendered changes, or "(no change)"
+        """
+        if not self.hunks:
+            return "(no change)"
+
+        pieces = []
+        length = 0
+        for i, hunk in enumerate(self.hunks):
+            piece = _render_hunk(hunk, style, self.old_length)
+            if max_chars is not None and pieces and length + len(piece) > max_chars:
+                pieces.append(f"(+{len(self.hunks) - i} more)")
+                break
+            pieces.append(piece)
+            length += len(piece) + 1
+
+        text = " ".join(pieces)
+        if max_chars is not None and len(text) > max_chars + 20:
+            text = text[:max_chars] + "..."
+        return text
+
+    def to_dict(self, truncate: Optional[int] = None) -> dict:
+        """Serializable form; `truncate` shortens long removed/added spans."""
+        return {
+            "old_len": self.old_length,
+            "new_len": self.new_length,
+            "hunks": [hunk.to_dict(truncate) for hunk in self.hunks],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ValueDiff:
+        return cls(
+            old_length=data.get("old_len", 0),
+            new_length=data.get("new_len", 0),
+            hunks=[DiffHunk.from_dict(h) for h in data.get("hunks", [])],
+        )
+
+
+def compute_diff(old: str, new: str, context: int = 6) -> ValueDiff:
+    """
+    Word-level diff of two values.
+
+    Args:
+        old: Previous value
+        new: New value
+        context: Unchanged words kept on each side of a change
+
+    Returns:
+        ValueDiff with one hunk per changed span
+    """
+    old = old or ""
+    new = new or ""
+    diff = ValueDiff(old_length=len(old), new_length=len(new))
+    if old == new:
+        return diff
+
+    # Trim the common ends, backing off so no word is split in either value
+    prefix = _common_prefix(old, new)
+    for _ in range(100):
+        if not (_inside_word(old, prefix) or _inside_word(new, prefix)):
+            break
+        prefix -= 1
+    suffix = _common_suffix(old, new, min(len(old), len(new)) - prefix)
+    for _ in range(100):
+        if not (_inside_word(old, len(old) - suffix) or _inside_word(new, len(new) - suffix)):
+            break
+        suffix -= 1
+
+    spans = _segment_spans(old[prefix:len(old) - suffix], new[prefix:len(new) - suffix], prefix)
+
+    previous_end = 0
+    for i, (offset, removed, added) in enumerate(spans):
+        end = offset + len(removed)
+        next_start = spans[i + 1][0] if i + 1 < len(spans) else len(old)
+        diff.hunks.append(DiffHunk(
+            offset=offset,
+            removed=removed,
+            added=added,
+            before=_context_before(old, offset, previous_end, context),
+            after=_context_after(old, end, next_start, context),
+        ))
+        previous_end = end
+    return diff
+
+
+def _segment_spans(old: str, new: str, base: int) -> list[tuple[int, str, str]]:
+    """Spans from a sentence-level diff, refined word by word."""
+    old_segments = [seg for seg in _SEGMENT_RE.findall(old) if seg]
+    new_segments = [seg for seg in _SEGMENT_RE.findall(new) if seg]
+    if len(old_segments) * len(new_segments) > _MAX_DIFF_CELLS:
+        return [(base, old, new)]
+
+    offsets = [base]
+    for segment in old_segments:
+        offsets.append(offsets[-1] + len(segment))
+
+    spans: list[tuple[int, str, str]] = []
+    matcher = SequenceMatcher(None, old_segments, new_segments, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        removed = "".join(old_segments[i1:i2])
+        added = "".join(new_segments[j1:j2])
+        old_tokens = _TOKEN_RE.findall(removed)
+        new_tokens = _TOKEN_RE.findall(added)
+        if len(old_tokens) * len(new_tokens) > _MAX_DIFF_CELLS:
+            spans.append((offsets[i1], removed, added))
+        else:
+            spans.extend(_token_spans(old_tokens, new_tokens, offsets[i1]))
+    return spans
+
+
+def _token_spans(old_tokens: list[str], new_tokens: list[str], base: int) -> list[tuple[int, str, str]]:
+    """(old offset, removed, added) spans from a token-level SequenceMatcher."""
+    offsets = [base]
+    for token in old_tokens:
+        offsets.append(offsets[-1] + len(token))
+
+    spans: list[tuple[int, str, str]] = []
+    pending: Optional[list] = None  # [i1, i2, j1, j2] of the span being built
+    matcher = SequenceMatcher(None, old_tokens, new_tokens, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            # Changes split only by whitespace read better as one span
+            if pending is not None and not "".join(old_tokens[i1:i2]).isspace():
+                spans.append(_span(pending, old_tokens, new_tokens, offsets))
+                pending = None
+            continue
+        if pending is None:
+            pending = [i1, i2, j1, j2]
+        else:
+            pending[1], pending[3] = i2, j2
+    if pending is not None:
+        spans.append(_span(pending, old_tokens, new_tokens, offsets))
+    return spans
+
+
+def _span(bounds: list, old_tokens: list[str], new_tokens: list[str], offsets: list[int]) -> tuple[int, str, str]:
+    i1, i2, j1, j2 = bounds
+    return offsets[i1], "".join(old_tokens[i1:i2]), "".join(new_tokens[j1:j2])
+
+
+def _common_prefix(a: str, b: str) -> int:
+    limit = min(len(a), len(b))
+    n = 0
+    while n + _TRIM_STEP <= limit and a[n:n + _TRIM_STEP] == b[n:n + _TRIM_STEP]:
+        n += _TRIM_STEP
+    while n < limit and a[n] == b[n]:
+        n += 1
+    return n
+
+
+def _common_suffix(a: str, b: str, limit: int) -> int:
+    la, lb = len(a), len(b)
+    n = 0
+    while n + _TRIM_STEP <= limit and a[la - n - _TRIM_STEP:la - n] == b[lb - n - _TRIM_STEP:lb - n]:
+        n += _TRIM_STEP
+    while n < limit and a[la - n - 1] == b[lb - n - 1]:
+        n += 1
+    return n
+
+
+def _inside_word(text: str, index: int) -> bool:
+    """Whether `index` falls between two word characters of `text`."""
+    if index <= 0 or index >= len(text):
+        return False
+    before, after = text[index - 1], text[index]
+    return (before.isalnum() or before == "_") and (after.isalnum() or after == "_")
+
+
+def _context_before(text: str, end: int, floor: int, words: int) -> str:
+    """Up to `words` words ending at `end`, not reaching back past `floor`."""
+    window = text[max(floor, end - words * 24):end]
+    tokens = _TOKEN_RE.findall(window)
+    kept = 0
+    start = len(tokens)
+    while start > 0 and kept < words:
+        start -= 1
+        if not tokens[start].isspace():
+            kept += 1
+    return "".join(tokens[start:])
+
+
+def _context_after(text: str, start: int, ceiling: int, words: int) -> str:
+    """Up to `words` words starting at `start`, not reaching past `ceiling`."""
+    window = text[start:min(ceiling, start + words * 24)]
+    tokens = _TOKEN_RE.findall(window)
+    kept = 0
+    end = 0
+    while end < len(tokens) and kept < words:
+        if not tokens[end].isspace():
+            kept += 1
+        end += 1
+    return "".join(tokens[:end])
+
+
+def _render_hunk(hunk: DiffHunk, style: str, old_length: int) -> str:
+    before = " ".join(hunk.before.split())
+    after = " ".join(hunk.after.split())
+    removed = " ".join(hunk.removed.split())
+    added = " ".join(hunk.added.split())
+    if style == "markdown":
+        change = " ".join(p for p in (f"~~{removed}~~" if removed else "", f"**{added}**" if added else "") if p)
+    else:
+        change = f"{f'[-{removed}-]' if removed else ''}{f'{{+{added}+}}' if added else ''}"
+    # Ellipses only where the context stops short of the value's ends
+    if hunk.offset - len(hunk.before) > 0:
+        before = "..." + before
+    if hunk.offset + len(hunk.removed) + len(hunk.after) < old_length:
+        after += "..."
+    parts = [p for p in (before, change, after) if p]
+    return " ".join(parts)
+
+
+def _clip(value: str, limit: Optional[int]) -> str:
+    if limit is None or len(value) <= limit:
+        return value
+    return value[:limit] + "..."
@@ -0,0 +1,190 @@
+"""
+Append-only NDJSON changelog storage.
+
+Each ChangeRecord is written as one JSON line the moment it is recorded,
+so a crash loses at most the records since the last sync instead of the
+whole session, and writing stays O(1) per record.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import time
+from enum import Enum
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Iterator, Optional
+
+from rich.console import Console
+
+if TYPE_CHECKING:
+    from drupal_editor.tracking.changelog import ChangeRecord
+
+console = Console()
+
+
+class FsyncPolicy(str, Enum):
+    """When buffered records are flushed and fsynced to disk."""
+
+    ALWAYS = "always"  # After every record
+    EVERY_N = "every_n"  # After every `fsync_every` records
+    INTERVAL = "interval"  # At most every `fsync_interval` seconds
+    OFF = "off"  # Only on flush()/close(); the OS decides otherwise
+
+
+class NDJSONSink:
+    """
+    Write ChangeRecords to an NDJSON file as they happen.
+
+    Usage:
+        changelog = ChangeLog()
+        changelog.add_sink(NDJSONSink("logs/session.ndjson", fsync="every_n", fsync_every=50))
+        ...
+        changelog.close()
+
+        # Later, or after a crash
+        changelog = ChangeLog.from_ndjson("logs/session.ndjson")
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        fsync: FsyncPolicy | str = FsyncPolicy.INTERVAL,
+        fsync_every: int = 100,
+        fsync_interval: float = 1.0,
+        buffer_size: int = 64 * 1024,
+        extra_fields: Optional[dict] = None,
+    ):
+        """
+        Open (or append to) an NDJSON file.
+
+        Args:
+            path: File to append records to
+            fsync: FsyncPolicy or its string value
+            fsync_every: Records between syncs under EVERY_N
+            fsync_interval: Seconds between syncs under INTERVAL
+            buffer_size: Write buffer size in bytes
+            extra_fields: Added to every line (e.g. {"worker": "w1"} for shards)
+        """
+        self.path = Path(path)
+        self.policy = FsyncPolicy(fsync)
+        self.fsync_every = max(1, fsync_every)
+        self.fsync_interval = fsync_interval
+        self.extra_fields = extra_fields or {}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        _truncate_torn_line(self.path)
+        self._file: Optional[IO[str]] = open(self.path, "a", encoding="utf-8", buffering=buffer_size)
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self.written = 0
+        atexit.register(self.close)
+
+    def write(self, record: "ChangeRecord", session_id: Optional[str] = None) -> None:
+        """Append one record, syncing according to the policy."""
+        if self._file is None:
+            raise ValueError(f"NDJSON sink {self.path} is closed")
+
+        data = record.to_dict(truncate=None)
+        if session_id:
+            data["session_id"] = session_id
+        data.update(self.extra_fields)
+        self._file.write(json.dumps(data, ensure_ascii=False, separators=(",", ":")) + "\n")
+        self.written += 1
+        self._unsynced += 1
+
+        if self.policy == FsyncPolicy.ALWAYS:
+            self.sync()
+        elif self.policy == FsyncPolicy.EVERY_N and self._unsynced >= self.fsync_every:
+            self.sync()
+        elif self.policy == FsyncPolicy.INTERVAL and time.monotonic() - self._last_sync >= self.fsync_interval:
+            self.sync()
+
+    def flush(self) -> None:
+        """Hand buffered lines to the OS (no fsync)."""
+        if self._file is not None:
+            self._file.flush()
+
+    def sync(self) -> None:
+        """Flush and fsync, so records survive a machine crash."""
+        if self._file is None:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        """Sync remaining records and close the file."""
+        if self._file is None:
+            return
+        try:
+            self.sync()
+        finally:
+            self._file.close()
+            self._file = None
+            atexit.unregister(self.close)
+
+    def __enter__(self) -> NDJSONSink:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _truncate_torn_line(path: Path) -> None:
+    """
+    Cut a partial last line left by a crash mid-write.
+
+    Appending after it would glue the next record onto the fragment and
+    leave a malformed line in the middle of the file.
+    """
+    try:
+        f = open(path, "r+b")
+    except FileNotFoundError:
+        return
+    with f:
+        size = f.seek(0, os.SEEK_END)
+        if size == 0:
+            return
+        f.seek(size - 1)
+        if f.read(1) == b"\n":
+            return
+
+        # Find the last newline, reading backwards in blocks
+        end = size
+        keep = 0
+        while end > 0:
+            start = max(0, end - 64 * 1024)
+            f.seek(start)
+            newline = f.read(end - start).rfind(b"\n")
+            if newline >= 0:
+                keep = start + newline + 1
+                break
+            end = start
+        f.truncate(keep)
+    console.print(f"[yellow]Dropped a torn last line ({size - keep} bytes) from {path}[/yellow]")
+
+
+def read_ndjson(path: Path | str) -> Iterator[dict]:
+    """
+    Yield the record dicts of an NDJSON changelog.
+
+    A torn last line (from a crash mid-write) is skipped with a warning;
+    a malformed line elsewhere raises ValueError.
+    """
+    path = Path(path)
+    with open(path, encoding="utf-8") as f:
+        pending_error: Optional[str] = None
+        for number, line in enumerate(f, 1):
+            if pending_error:
+                raise ValueError(pending_error)
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                pending_error = f"{path}:{number}: invalid record: {e}"
+        if pending_error:
+            console.print(f"[yellow]Skipped incomplete last line of {path}[/yellow]")
@@ -0,0 +1,215 @@
+"""
+Sharded changelogs for jobs split across worker processes.
+
+Each worker writes its own NDJSON shard, `<session_id>.<worker>.ndjson`,
+whose lines carry the worker ID next to the record's seq and timestamp.
+merge_shards() streams all shards of a session through a k-way heap merge
+ordered by (timestamp, worker, seq) and writes one session log. Memory use
+is one pending record per shard plus a small reorder window, however large
+the shards are.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import os
+import re
+import socket
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from rich.console import Console
+
+from drupal_editor.tracking.ndjson import NDJSONSink, read_ndjson
+from drupal_editor.tracking.summary import StreamingSummary
+
+console = Console()
+
+# A worker's records can leave its writer thread slightly out of timestamp
+# order; each shard is re-sorted within this many records before merging
+REORDER_WINDOW = 1024
+
+_UNSAFE_RE = re.compile(r"[^\w.-]+")
+
+
+def default_worker_id() -> str:
+    """Host name and PID, e.g. "web-2-4711"."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+def shard_path(directory: Path | str, session_id: str, worker: str) -> Path:
+    """Shard file for one worker of a session."""
+    return Path(directory) / f"{session_id}.{_UNSAFE_RE.sub('_', worker)}.ndjson"
+
+
+def find_shards(directory: Path | str, session_id: str) -> list[Path]:
+    """All shard files of a session, sorted by name."""
+    return sorted(Path(directory).glob(f"{session_id}.*.ndjson"))
+
+
+def open_shard(
+    directory: Path | str,
+    session_id: str,
+    worker: Optional[str] = None,
+    **options,
+) -> NDJSONSink:
+    """
+    NDJSON sink for this worker's shard.
+
+    Args:
+        directory: Shard directory shared by all workers
+        session_id: The job's session ID (the same in every worker)
+        worker: Worker ID (default: host name and PID)
+        **options: Passed to NDJSONSink (fsync, fsync_every, ...)
+    """
+    worker = worker or default_worker_id()
+    return NDJSONSink(
+        shard_path(directory, session_id, worker),
+        extra_fields={"worker": worker},
+        **options,
+    )
+
+
+@dataclass
+class MergeResult:
+    """Outcome of a shard merge, with a streaming summary of the merged log."""
+
+    session_id: str
+    output: Optional[Path]
+    shards: int = 0
+    records: int = 0
+    duplicates: int = 0
+    by_worker: dict[str, int] = field(default_factory=dict)
+    stream: StreamingSummary = field(default_factory=StreamingSummary, repr=False)
+
+    def _add(self, data: dict) -> None:
+        self.records += 1
+        worker = data.get("worker", "")
+        self.by_worker[worker] = self.by_worker.get(worker, 0) + 1
+        self.stream.add_dict(data)
+
+    @property
+    def failed(self) -> int:
+        return self.stream.failed
+
+    def _workers_line(self) -> str:
+        return f"**Workers:** {len(self.by_worker)} ({self.shards} shards, {self.duplicates} duplicates dropped)"
+
+    def _prepare(self) -> StreamingSummary:
+        """The streaming summary, with the session ID and the workers line in its header."""
+        self.stream.session_id = self.session_id or self.stream.session_id
+        self.stream.header_lines = [self._workers_line()]
+        return self.stream
+
+    def summary(self) -> str:
+        """Markdown summary of the merged session."""
+        return self._prepare().render()
+
+    def pages(self, max_chars: int = 3500) -> list[str]:
+        """The summary split into messages of at most `max_chars`."""
+        return self._prepare().pages(max_chars)
+
+
+def _merge_key(data: dict, timestamp: datetime) -> tuple:
+    return timestamp, data.get("worker", ""), data.get("seq") if data.get("seq") is not None else -1
+
+
+def _iter_shard(path: Path, window: int) -> Iterator[tuple[tuple, dict, datetime]]:
+    """(merge key, record dict, timestamp) of one shard, sorted within `window` records."""
+    fallback_worker = path.name.split(".", 1)[1].rsplit(".", 1)[0] if path.name.count(".") >= 2 else path.stem
+    heap: list = []
+    for position, data in enumerate(read_ndjson(path)):
+        data.setdefault("worker", fallback_worker)
+        timestamp = datetime.fromisoformat(data["timestamp"])
+        # position breaks ties so dicts are never compared
+        heapq.heappush(heap, (_merge_key(data, timestamp), position, data, timestamp))
+        if len(heap) > window:
+            key, _, data, timestamp = heapq.heappop(heap)
+            yield key, data, timestamp
+    while heap:
+        key, _, data, timestamp = heapq.heappop(heap)
+        yield key, data, timestamp
+
+
+def iter_merged(
+    paths: Iterable[Path | str],
+    window: int = REORDER_WINDOW,
+    result: Optional[MergeResult] = None,
+) -> Iterator[dict]:
+    """
+    Stream the records of several shards in (timestamp, worker, seq) order.
+
+    Records with the same worker and seq as the previous one (a shard
+    copied or passed twice, a retried upload) are dropped; since equal keys
+    come out of the merge next to each other, no set of seen keys is kept.
+
+    Args:
+        paths: Shard files
+        window: Per-shard reorder window
+        result: Optional MergeResult to collect totals into
+    """
+    paths = [Path(p) for p in paths]
+    if result is not None:
+        result.shards = len(paths)
+
+    previous: Optional[tuple] = None
+    for key, data, timestamp in heapq.merge(*(_iter_shard(p, window) for p in paths), key=lambda item: item[0]):
+        if key == previous and key[2] >= 0:
+            if result is not None:
+                result.duplicates += 1
+            continue
+        if previous is not None and key < previous:
+            console.print(f"[yellow]Record {key[1]}#{key[2]} is outside the reorder window[/yellow]")
+        previous = key
+        if result is not None:
+            result._add(data)
+        yield data
+
+
+def merge_shards(
+    paths: Iterable[Path | str],
+    output: Optional[Path | str] = None,
+    session_id: Optional[str] = None,
+    window: int = REORDER_WINDOW,
+) -> MergeResult:
+    """
+    Merge worker shards into one ordered, deduplicated NDJSON session log.
+
+    Usage:
+        # In each worker process (same session_id everywhere)
+        changelog = ChangeLog(session_id=job_session_id)
+        changelog.shard_to("logs/shards")
+
+        # Afterwards
+        result = merge_shards(find_shards("logs/shards", job_session_id), "logs/job.ndjson")
+        print(result.summary())
+
+    Args:
+        paths: Shard files
+        output: Merged NDJSON file (None to only compute the summary)
+        session_id: Session ID for the summary (default: from the records)
+        window: Per-shard reorder window
+
+    Returns:
+        MergeResult with counts and summary()
+    """
+    result = MergeResult(session_id=session_id or "", output=Path(output) if output else None)
+    records = iter_merged(paths, window=window, result=result)
+
+    if output is None:
+        for data in records:
+            result.session_id = result.session_id or data.get("session_id", "")
+        return result
+
+    path = Path(output)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8", buffering=64 * 1024) as f:
+        for data in records:
+            result.session_id = result.session_id or data.get("session_id", "")
+            f.write(json.dumps(data, ensure_ascii=False, separators=(",", ":")) + "\n")
+    os.replace(tmp_path, path)
+    return result
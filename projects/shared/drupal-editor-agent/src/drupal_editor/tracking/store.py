@@ -0,0 +1,506 @@
+"""
+Persistent SQLite changelog store.
+
+Every session can write its ChangeRecords to one database, which is then
+queryable across sessions: "what did we change on node/123 in the last 30
+days", "failure rate by operation this week". Records are inserted in
+batched transactions; old/new values are stored once per distinct content,
+zlib-compressed, in a side table, so the main table stays narrow and the
+indexed queries stay fast over millions of rows.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import sqlite3
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, Optional
+
+from rich.console import Console
+
+from drupal_editor.tracking.diff import ValueDiff
+from drupal_editor.tracking.values import ValueStore
+
+if TYPE_CHECKING:
+    from drupal_editor.tracking.changelog import ChangeLog, ChangeRecord
+
+console = Console()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    session_id TEXT NOT NULL UNIQUE,
+    started_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS change_values (
+    hash BLOB PRIMARY KEY,
+    data BLOB NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS changes (
+    id INTEGER PRIMARY KEY,
+    session INTEGER NOT NULL REFERENCES sessions(id),
+    ts REAL NOT NULL,
+    auth_method TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    target TEXT NOT NULL,
+    field TEXT NOT NULL,
+    old_hash BLOB,
+    new_hash BLOB,
+    reason TEXT NOT NULL,
+    revision_id INTEGER,
+    revision_url TEXT,
+    screenshot_path TEXT,
+    success INTEGER NOT NULL,
+    error TEXT,
+    diff TEXT,
+    seq INTEGER
+);
+
+CREATE INDEX IF NOT EXISTS changes_session ON changes (session, id);
+CREATE INDEX IF NOT EXISTS changes_target_ts ON changes (target, ts);
+CREATE INDEX IF NOT EXISTS changes_operation_ts ON changes (operation, ts);
+-- Covers the per-operation stats query without touching the table
+CREATE INDEX IF NOT EXISTS changes_ts ON changes (ts, operation, success);
+"""
+
+_COLUMNS = (
+    "c.ts, c.auth_method, c.operation, c.target, c.field, c.old_hash, c.new_hash, "
+    "c.reason, c.revision_id, c.revision_url, c.screenshot_path, c.success, c.error, c.diff, c.seq"
+)
+
+
+@dataclass
+class OperationStats:
+    """Success/failure counts for one operation over a time range."""
+
+    operation: str
+    total: int
+    failed: int
+
+    @property
+    def succeeded(self) -> int:
+        return self.total - self.failed
+
+    @property
+    def failure_rate(self) -> float:
+        return self.failed / self.total if self.total else 0.0
+
+
+@dataclass
+class SessionInfo:
+    """A session in the store."""
+
+    session_id: str
+    started_at: datetime
+    total: int
+    failed: int
+
+
+class ChangeStore:
+    """
+    SQLite database of ChangeRecords from every session.
+
+    Usage:
+        store = ChangeStore("logs/changes.db")
+        client.changelog.add_sink(store.sink())   # or changelog.store_to(path)
+
+        store.history(target="node/123", days=30)
+        for stats in store.failure_rates(days=7):
+            print(stats.operation, f"{stats.failure_rate:.1%}")
+
+        changelog = store.load_session()  # most recent session
+    """
+
+    def __init__(self, path: Path | str):
+        """
+        Open (and create if needed) a store.
+
+        Args:
+            path: Database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        # Columns added after the first release of the store
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(changes)")}
+        for column, declaration in (("diff", "TEXT"), ("seq", "INTEGER")):
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE changes ADD COLUMN {column} {declaration}")
+        self._session_rows: dict[str, int] = {}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> ChangeStore:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def sink(self, batch_size: int = 500, flush_interval: float = 2.0) -> SQLiteSink:
+        """A changelog sink that writes into this store in batches."""
+        return SQLiteSink(self, batch_size=batch_size, flush_interval=flush_interval)
+
+    def _session_row(self, session_id: str, started_at: float) -> int:
+        row = self._session_rows.get(session_id)
+        if row is None:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO sessions (session_id, started_at) VALUES (?, ?)",
+                (session_id, started_at),
+            )
+            row = self._conn.execute(
+                "SELECT id FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()[0]
+            self._session_rows[session_id] = row
+        return row
+
+    def add_records(self, records: list[tuple[str, "ChangeRecord"]]) -> None:
+        """
+        Insert (session_id, record) pairs in one transaction.
+
+        Values are stored by content hash, so repeated bodies cost one row.
+        """
+        if not records:
+            return
+        rows = []
+        values: dict[bytes, bytes] = {}
+        try:
+            self._insert(records, rows, values)
+        except sqlite3.Error:
+            # Session rows created in the rolled-back transaction are gone
+            self._session_rows.clear()
+            raise
+
+    def _insert(
+        self,
+        records: list[tuple[str, "ChangeRecord"]],
+        rows: list[tuple],
+        values: dict[bytes, bytes],
+    ) -> None:
+        with self._conn:
+            for session_id, record in records:
+                ts = record.timestamp.timestamp()
+                old_hash = _value_key(record.old_value, values)
+                new_hash = _value_key(record.new_value, values)
+                rows.append((
+                    self._session_row(session_id, ts),
+                    ts,
+                    record.auth_method,
+                    record.operation,
+                    record.target,
+                    record.field,
+                    old_hash,
+                    new_hash,
+                    record.reason,
+                    record.revision_id,
+                    record.revision_url,
+                    record.screenshot_path,
+                    int(record.success),
+                    record.error,
+                    json.dumps(record.diff.to_dict(), ensure_ascii=False, separators=(",", ":")),
+                    record.seq,
+                ))
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO change_values (hash, data) VALUES (?, ?)",
+                values.items(),
+            )
+            self._conn.executemany(
+                "INSERT INTO changes (session, ts, auth_method, operation, target, field, "
+                "old_hash, new_hash, reason, revision_id, revision_url, screenshot_path, "
+                "success, error, diff, seq) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def import_changelog(self, changelog: "ChangeLog") -> int:
+        """Store every record of an existing changelog. Returns the count."""
+        self.add_records([(changelog.session_id, record) for record in changelog.records])
+        return len(changelog.records)
+
+    def history(
+        self,
+        target: Optional[str] = None,
+        operation: Optional[str] = None,
+        session_id: Optional[str] = None,
+        success: Optional[bool] = None,
+        days: Optional[float] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = 100,
+    ) -> list["ChangeRecord"]:
+        """
+        Changes matching all given filters, newest first.
+
+        Args:
+            target: e.g. "node/123"
+            operation: e.g. "update_node"
+            session_id: Only this session
+            success: Only successes (True) or failures (False)
+            days: Only the last N days (shorthand for since)
+            since: Only changes at or after this time
+            until: Only changes before this time
+            limit: Maximum records (None for all)
+        """
+        return list(self.iter_history(
+            target=target, operation=operation, session_id=session_id, success=success,
+            days=days, since=since, until=until, limit=limit, newest_first=True,
+        ))
+
+    def iter_history(
+        self,
+        target: Optional[str] = None,
+        operation: Optional[str] = None,
+        session_id: Optional[str] = None,
+        success: Optional[bool] = None,
+        days: Optional[float] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        newest_first: bool = False,
+        with_session: bool = False,
+    ) -> Iterator["ChangeRecord | tuple[str, ChangeRecord]"]:
+        """
+        Like history(), but streams records (oldest first by default).
+
+        With with_session=True, yields (session_id, record) pairs.
+        """
+        from drupal_editor.tracking.changelog import ChangeRecord
+
+        where, params = _filters(target, operation, session_id, success, days, since, until)
+        sql = f"SELECT {_COLUMNS}, s.session_id FROM changes c JOIN sessions s ON s.id = c.session"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY c.ts DESC, c.id DESC" if newest_first else " ORDER BY c.ts, c.id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        cursor = self._conn.execute(sql, params)
+        while True:
+            batch = cursor.fetchmany(500)
+            if not batch:
+                break
+            values = self._load_values({h for row in batch for h in (row[5], row[6]) if h})
+            for row in batch:
+                record = ChangeRecord(
+                    timestamp=datetime.fromtimestamp(row[0]),
+                    auth_method=row[1],
+                    operation=row[2],
+                    target=row[3],
+                    field=row[4],
+                    old_value=values.get(row[5], ""),
+                    new_value=values.get(row[6], ""),
+                    reason=row[7],
+                    revision_id=row[8],
+                    revision_url=row[9],
+                    screenshot_path=row[10],
+                    success=bool(row[11]),
+                    error=row[12],
+                    diff=ValueDiff.from_dict(json.loads(row[13])) if row[13] else None,
+                    seq=row[14],
+                )
+                yield (row[15], record) if with_session else record
+
+    def _load_values(self, hashes: set[bytes]) -> dict[bytes, str]:
+        values = {}
+        hashes = list(hashes)
+        # Stay under SQLite's default bound-parameter limit
+        for start in range(0, len(hashes), 900):
+            chunk = hashes[start:start + 900]
+            placeholders = ",".join("?" * len(chunk))
+            for key, data in self._conn.execute(
+                f"SELECT hash, data FROM change_values WHERE hash IN ({placeholders})", chunk
+            ):
+                values[key] = zlib.decompress(data).decode("utf-8")
+        return values
+
+    def failure_rates(
+        self,
+        days: Optional[float] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> list[OperationStats]:
+        """Per-operation totals and failures, most failures first."""
+        where, params = _filters(None, None, None, None, days, since, until)
+        sql = "SELECT c.operation, COUNT(*), SUM(c.success = 0) FROM changes c"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " GROUP BY c.operation"
+        stats = [
+            OperationStats(operation=operation, total=total, failed=failed or 0)
+            for operation, total, failed in self._conn.execute(sql, params)
+        ]
+        stats.sort(key=lambda s: (-s.failed, s.operation))
+        return stats
+
+    def sessions(self, limit: Optional[int] = 20) -> list[SessionInfo]:
+        """Most recent sessions with their change counts."""
+        sql = (
+            "SELECT s.session_id, s.started_at, "
+            "(SELECT COUNT(*) FROM changes c WHERE c.session = s.id), "
+            "(SELECT COUNT(*) FROM changes c WHERE c.session = s.id AND c.success = 0) "
+            "FROM sessions s ORDER BY s.started_at DESC, s.id DESC"
+        )
+        params: list = []
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [
+            SessionInfo(session_id=sid, started_at=datetime.fromtimestamp(started), total=total, failed=failed)
+            for sid, started, total, failed in self._conn.execute(sql, params)
+        ]
+
+    def load_session(self, session_id: Optional[str] = None) -> Optional["ChangeLog"]:
+        """
+        Rebuild one session as a ChangeLog (the latest if no ID is given).
+
+        Returns None if the store has no such session.
+        """
+        from drupal_editor.tracking.changelog import ChangeLog
+
+        if session_id is None:
+            row = self._conn.execute(
+                "SELECT session_id FROM sessions ORDER BY started_at DESC, id DESC LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+            session_id = row[0]
+        elif self._conn.execute(
+            "SELECT 1 FROM sessions WHERE session_id = ?", (session_id,)
+        ).fetchone() is None:
+            return None
+
+        return ChangeLog(records=list(self.iter_history(session_id=session_id)), session_id=session_id)
+
+
+class SQLiteSink:
+    """
+    Changelog sink that batches records into a ChangeStore.
+
+    Records are buffered and written in one transaction once `batch_size`
+    are pending or `flush_interval` seconds have passed, and on close().
+    """
+
+    def __init__(
+        self,
+        store: ChangeStore,
+        batch_size: int = 500,
+        flush_interval: float = 2.0,
+        close_store: bool = False,
+    ):
+        self.store = store
+        self.close_store = close_store
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self._pending: list[tuple[str, "ChangeRecord"]] = []
+        self._last_flush = time.monotonic()
+        self._closed = False
+        self.written = 0
+        atexit.register(self.close)
+
+    def write(self, record: "ChangeRecord", session_id: Optional[str] = None) -> None:
+        """Queue one record, committing the batch when it is due."""
+        if self._closed:
+            raise ValueError(f"SQLite sink for {self.store.path} is closed")
+        self._pending.append((session_id or "", record))
+        if (
+            len(self._pending) >= self.batch_size
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Commit pending records."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        try:
+            self.store.add_records(pending)
+        except sqlite3.Error as e:
+            # Keep them for the next attempt rather than losing the batch
+            self._pending = pending + self._pending
+            console.print(f"[yellow]Could not write changes to {self.store.path}: {e}[/yellow]")
+            return
+        self.written += len(pending)
+        self._last_flush = time.monotonic()
+
+    def sync(self) -> None:
+        self.flush()
+
+    def close(self) -> None:
+        """
+        Commit pending records (and close the store if the sink owns it).
+
+        If the final commit fails the sink stays open, with its records
+        still queued, so close() can be retried (it runs again at exit).
+        """
+        if self._closed:
+            return
+        self.flush()
+        if self._pending:
+            targets = ", ".join(f"{r.target}.{r.field}" for _, r in self._pending[:5])
+            more = f" and {len(self._pending) - 5} more" if len(self._pending) > 5 else ""
+            console.print(
+                f"[red]{len(self._pending)} changes not written to {self.store.path} "
+                f"({targets}{more}); sink left open for a retry[/red]"
+            )
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        if self.close_store:
+            self.store.close()
+
+
+def _value_key(value: str, values: dict[bytes, bytes]) -> Optional[bytes]:
+    """Hash a value, queueing its compressed data; None for empty values."""
+    if not value:
+        return None
+    key = ValueStore.key_for(value)
+    if key not in values:
+        values[key] = zlib.compress(value.encode("utf-8"), 6)
+    return key
+
+
+def _filters(
+    target: Optional[str],
+    operation: Optional[str],
+    session_id: Optional[str],
+    success: Optional[bool],
+    days: Optional[float],
+    since: Optional[datetime],
+    until: Optional[datetime],
+) -> tuple[list[str], list]:
+    """WHERE clauses and parameters for the query methods."""
+    where: list[str] = []
+    params: list = []
+    if target is not None:
+        where.append("c.target = ?")
+        params.append(target)
+    if operation is not None:
+        where.append("c.operation = ?")
+        params.append(operation)
+    if session_id is not None:
+        where.append("s.session_id = ?")
+        params.append(session_id)
+    if success is not None:
+        where.append("c.success = ?")
+        params.append(int(success))
+    if days is not None:
+        since = max(since, datetime.now() - timedelta(days=days)) if since else datetime.now() - timedelta(days=days)
+    if since is not None:
+        where.append("c.ts >= ?")
+        params.append(since.timestamp())
+    if until is not None:
+        where.append("c.ts < ?")
+        params.append(until.timestamp())
+    return where, params
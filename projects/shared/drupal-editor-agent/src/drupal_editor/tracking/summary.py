@@ -2,111 +2,441 @@
 Summary generation for Drupal changes.
 
 Produces human-readable summaries suitable for Slack notifications.
+
+Summaries are built in one pass with bounded memory: changes are grouped
+by operation (and counted per target), only the first few examples per
+operation and the first few failures are kept, and the rendered text can
+be split into pages under a size limit. The same code summarizes an
+in-memory ChangeLog, a ChangeStore query or an NDJSON file on disk.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Optional
+
 from drupal_editor.tracking.changelog import ChangeLog
+from drupal_editor.tracking.diff import ValueDiff, compute_diff
 
+if TYPE_CHECKING:
+    from drupal_editor.tracking.changelog import ChangeRecord
 
-class SummaryGenerator:
-    """Generate summaries from a changelog."""
+# Slack's message limit is 4,000 characters; leave room for formatting
+DEFAULT_PAGE_CHARS = 3500
 
-    def __init__(self, changelog: ChangeLog):
-        self.changelog = changelog
 
-    def generate_slack_summary(self) -> str:
-        """
-        Generate a Slack-friendly markdown summary.
+@dataclass
+class _Example:
+    target: str
+    field: str
+    change: str
+    reason: str
+    revision_url: Optional[str]
 
-        Example output:
-        ## Ava Changes Summary
-        **Session:** 20251227_143022
-        **Method:** Terminus/Drush
-        **Changes:** 3 successful, 0 failed
 
-        | Target | Field | Change | Review |
-        |--------|-------|--------|--------|
-        | node/123 | body | "recieve" → "receive" | [Review](url) |
+@dataclass
+class _OperationGroup:
+    total: int = 0
+    failed: int = 0
+    fields: dict[str, int] = field(default_factory=dict)
+    examples: list[_Example] = field(default_factory=list)
+
+
+@dataclass
+class _Section:
+    """A heading, an optional table header and rows, for pagination."""
+
+    title: Optional[str]
+    header: list[str]
+    rows: list[str]
+
+
+class StreamingSummary:
+    """
+    Single-pass, bounded-memory session summary.
+
+    Usage:
+        summary = StreamingSummary(session_id=changelog.session_id)
+        for record in changelog:
+            summary.add(record)
+        for page in summary.pages(max_chars=3500):
+            post_to_slack(page)
+
+        # Straight from a log on disk, without building ChangeRecords
+        summary = StreamingSummary.from_ndjson("logs/changes.ndjson")
+    """
+
+    def __init__(
+        self,
+        session_id: Optional[str] = None,
+        max_examples: int = 5,
+        max_failures: int = 20,
+        max_targets: int = 10,
+        target_capacity: int = 10_000,
+    ):
+        """
+        Args:
+            session_id: Shown in the header (default: taken from NDJSON records)
+            max_examples: Example changes kept per operation
+            max_failures: Failed changes listed individually
+            max_targets: Most-changed targets listed
+            target_capacity: Distinct targets counted exactly; beyond this
+                             the least-changed are pruned and counts become
+                             lower bounds
         """
-        successful = self.changelog.get_successful()
-        failed = self.changelog.get_failed()
+        self.session_id = session_id
+        self.max_examples = max_examples
+        self.max_failures = max_failures
+        self.max_targets = max_targets
+        self.target_capacity = max(target_capacity, max_targets * 2)
 
-        if not self.changelog.records:
-            return "No changes recorded."
+        self.total = 0
+        self.failed = 0
+        self.auth_methods: set[str] = set()
+        self.first: Optional[datetime] = None
+        self.last: Optional[datetime] = None
+        self.operations: dict[str, _OperationGroup] = {}
+        self.failures: list[tuple[str, str, str]] = []  # (target, field, error)
+        self.errors: dict[str, int] = {}
+        self._targets: dict[str, int] = {}
+        self._targets_pruned = False
+        # Extra "**Label:** value" lines for the header (e.g. merge totals)
+        self.header_lines: list[str] = []
+
+    @classmethod
+    def from_records(cls, records: Iterable["ChangeRecord"], **options) -> StreamingSummary:
+        """Summarize any iterable of ChangeRecords (a ChangeLog, a store query...)."""
+        summary = cls(session_id=getattr(records, "session_id", None), **options)
+        for record in records:
+            summary.add(record)
+        return summary
+
+    @classmethod
+    def from_ndjson(cls, path: Path | str, **options) -> StreamingSummary:
+        """Summarize an NDJSON changelog or merged shard log, line by line."""
+        from drupal_editor.tracking.ndjson import read_ndjson
+
+        summary = cls(**options)
+        for data in read_ndjson(path):
+            summary.add_dict(data)
+        return summary
+
+    def add(self, record: "ChangeRecord") -> None:
+        """Count one record."""
+        self._add(
+            timestamp=record.timestamp,
+            auth_method=record.auth_method,
+            operation=record.operation,
+            target=record.target,
+            field_name=record.field,
+            success=record.success,
+            error=record.error,
+            reason=record.reason,
+            revision_url=record.revision_url,
+            diff=lambda: record.diff,
+        )
+
+    def add_dict(self, data: dict) -> None:
+        """Count one record dict (ChangeRecord.to_dict() / NDJSON line)."""
+        if self.session_id is None and data.get("session_id"):
+            self.session_id = data["session_id"]
+
+        def diff() -> ValueDiff:
+            if data.get("diff"):
+                return ValueDiff.from_dict(data["diff"])
+            return compute_diff(data.get("old_value") or "", data.get("new_value") or "")
+
+        self._add(
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            auth_method=data.get("auth_method", ""),
+            operation=data.get("operation", ""),
+            target=data.get("target", ""),
+            field_name=data.get("field", ""),
+            success=data.get("success", True),
+            error=data.get("error"),
+            reason=data.get("reason") or "",
+            revision_url=data.get("revision_url"),
+            diff=diff,
+        )
 
-        # Determine primary auth method
-        auth_methods = set(r.auth_method for r in self.changelog.records)
-        method_str = ", ".join(sorted(auth_methods))
+    def _add(
+        self,
+        timestamp: datetime,
+        auth_method: str,
+        operation: str,
+        target: str,
+        field_name: str,
+        success: bool,
+        error: Optional[str],
+        reason: str,
+        revision_url: Optional[str],
+        diff,
+    ) -> None:
+        self.total += 1
+        if auth_method:
+            self.auth_methods.add(auth_method)
+        if self.first is None or timestamp < self.first:
+            self.first = timestamp
+        if self.last is None or timestamp > self.last:
+            self.last = timestamp
 
+        group = self.operations.get(operation)
+        if group is None:
+            group = self.operations[operation] = _OperationGroup()
+        group.total += 1
+        group.fields[field_name] = group.fields.get(field_name, 0) + 1
+
+        self._count_target(target)
+
+        if not success:
+            self.failed += 1
+            group.failed += 1
+            first_line = (error or "").strip().splitlines()
+            message = first_line[0][:200] if first_line else "Unknown error"
+            if message in self.errors or len(self.errors) < 50:
+                self.errors[message] = self.errors.get(message, 0) + 1
+            else:
+                self.errors["(other errors)"] = self.errors.get("(other errors)", 0) + 1
+            if len(self.failures) < self.max_failures:
+                self.failures.append((target, field_name, message))
+        elif len(group.examples) < self.max_examples:
+            # The diff is only looked at (or computed) for kept examples
+            group.examples.append(_Example(
+                target=target,
+                field=field_name,
+                change=diff().format("markdown", max_chars=120),
+                reason=reason,
+                revision_url=revision_url,
+            ))
+
+    def _count_target(self, target: str) -> None:
+        self._targets[target] = self._targets.get(target, 0) + 1
+        if len(self._targets) > self.target_capacity:
+            # Keep the busiest half; amortized O(1) per record
+            keep = sorted(self._targets.items(), key=lambda item: -item[1])[: self.target_capacity // 2]
+            self._targets = dict(keep)
+            self._targets_pruned = True
+
+    @property
+    def successful(self) -> int:
+        return self.total - self.failed
+
+    def top_targets(self) -> list[tuple[str, int]]:
+        """Most-changed targets with their change counts (lower bounds if pruned)."""
+        busiest = sorted(self._targets.items(), key=lambda item: (-item[1], item[0]))
+        return [(target, n) for target, n in busiest[: self.max_targets] if n > 1]
+
+    def _header(self) -> list[str]:
         lines = [
             "## Ava Changes Summary",
-            f"**Session:** {self.changelog.session_id}",
-            f"**Method:** {method_str}",
-            f"**Changes:** {len(successful)} successful, {len(failed)} failed",
-            "",
+            f"**Session:** {self.session_id or '-'}",
+            f"**Method:** {', '.join(sorted(self.auth_methods)) or '-'}",
+            f"**Changes:** {self.successful} successful, {self.failed} failed",
         ]
+        if self.first and self.last and self.first != self.last:
+            lines.append(f"**Time:** {self.first:%Y-%m-%d %H:%M} - {self.last:%Y-%m-%d %H:%M}")
+        lines.extend(self.header_lines)
+        return lines
 
-        if successful:
-            lines.append("### Successful Changes")
-            lines.append("")
-            lines.append("| Target | Field | Change | Review |")
-            lines.append("|--------|-------|--------|--------|")
+    def _sections(self) -> list[_Section]:
+        sections = []
+        operations = sorted(self.operations.items(), key=lambda item: (-item[1].total, item[0]))
 
-            for record in successful:
-                # Truncate values for display
-                old_display = self._truncate(record.old_value, 20)
-                new_display = self._truncate(record.new_value, 20)
-                change_str = f'"{old_display}" → "{new_display}"'
+        if len(operations) > 1 or any(group.total > len(group.examples) for _, group in operations):
+            sections.append(_Section(
+                "By Operation",
+                ["| Operation | Changes | Failed | Fields |", "|-----------|---------|--------|--------|"],
+                [
+                    f"| {operation} | {group.total} | {group.failed} | {_top_fields(group.fields)} |"
+                    for operation, group in operations
+                ],
+            ))
 
-                review_link = f"[Review]({record.revision_url})" if record.revision_url else "-"
+        for operation, group in operations:
+            if not group.examples:
+                continue
+            shown = len(group.examples)
+            successful = group.total - group.failed
+            title = f"{operation}" if shown == successful else f"{operation} ({shown} of {successful} changes)"
+            sections.append(_Section(
+                title,
+                ["| Target | Field | Change | Review |", "|--------|-------|--------|--------|"],
+                [
+                    f"| {e.target} | {e.field} | {e.change.replace('|', chr(92) + '|')} | "
+                    f"{f'[Review]({e.revision_url})' if e.revision_url else '-'} |"
+                    for e in group.examples
+                ],
+            ))
 
-                lines.append(f"| {record.target} | {record.field} | {change_str} | {review_link} |")
+        targets = self.top_targets()
+        if targets:
+            at_least = "at least " if self._targets_pruned else ""
+            sections.append(_Section(
+                "Most Changed Targets",
+                [],
+                [f"- {target}: {at_least}{n} changes" for target, n in targets],
+            ))
 
-            lines.append("")
+        if self.failed:
+            rows = [f"- **{target}** ({field_name}): {error}" for target, field_name, error in self.failures]
+            if self.failed > len(self.failures):
+                rows.append(f"- ...and {self.failed - len(self.failures)} more")
+                rows.extend(
+                    f"  - {message}: {n}"
+                    for message, n in sorted(self.errors.items(), key=lambda item: -item[1])[:10]
+                )
+            sections.append(_Section("Failed Changes", [], rows))
 
-        if failed:
-            lines.append("### Failed Changes")
-            lines.append("")
-            for record in failed:
-                lines.append(f"- **{record.target}**: {record.error}")
-            lines.append("")
+        return sections
 
+    def render(self) -> str:
+        """The whole summary as one markdown message."""
+        if not self.total:
+            return "No changes recorded."
+        lines = self._header() + [""]
+        for section in self._sections():
+            lines.extend(_section_intro(section, continued=False))
+            lines.extend(section.rows)
+            lines.append("")
         return "\n".join(lines)
 
+    def pages(self, max_chars: int = DEFAULT_PAGE_CHARS) -> list[str]:
+        """
+        The summary split into messages of at most `max_chars` characters.
+
+        Pages break between rows; a table continued on the next page gets
+        its heading and header row again.
+        """
+        if not self.total:
+            return ["No changes recorded."]
+
+        # Room for the page footer
+        max_chars -= 20
+        pages: list[list[str]] = []
+        current = self._header() + [""]
+        size = _size(current)
+
+        def new_page() -> None:
+            nonlocal current, size
+            pages.append(current)
+            current, size = [], 0
+
+        for section in self._sections():
+            intro = _section_intro(section, continued=False)
+            rows = section.rows or [""]
+            for i, row in enumerate(rows):
+                lead = intro if i == 0 else []
+                needed = _size(lead) + len(row) + 1
+                if current and size + needed > max_chars:
+                    new_page()
+                    lead = _section_intro(section, continued=i > 0)
+                    needed = _size(lead) + len(row) + 1
+                current.extend(lead)
+                current.append(_clip_line(row, max_chars - _size(lead) - 1))
+                size += needed
+            current.append("")
+            size += 1
+        if current:
+            pages.append(current)
+
+        texts = ["\n".join(page).strip("\n") for page in pages]
+        if len(texts) > 1:
+            texts = [f"{text}\n\n_Page {i}/{len(texts)}_" for i, text in enumerate(texts, 1)]
+        return texts
+
+
+class SummaryGenerator:
+    """Generate summaries from a changelog."""
+
+    def __init__(self, changelog: ChangeLog, max_examples: int = 5, max_failures: int = 20):
+        self.changelog = changelog
+        self.max_examples = max_examples
+        self.max_failures = max_failures
+
+    def _summary(self) -> StreamingSummary:
+        return StreamingSummary.from_records(
+            self.changelog,
+            max_examples=self.max_examples,
+            max_failures=self.max_failures,
+        )
+
+    def generate_slack_summary(self) -> str:
+        """
+        Generate a Slack-friendly markdown summary.
+
+        Changes are grouped by operation with a few examples each, so the
+        message stays short however large the session is.
+
+        Example output:
+        ## Ava Changes Summary
+        **Session:** 20251227_143022_1a2b3c4d
+        **Method:** terminus
+        **Changes:** 3 successful, 0 failed
+
+        ### update_node
+
+        | Target | Field | Change | Review |
+        |--------|-------|--------|--------|
+        | node/123 | body | ...will ~~recieve~~ **receive** the... | [Review](url) |
+        """
+        return self._summary().render()
+
+    def generate_slack_pages(self, max_chars: int = DEFAULT_PAGE_CHARS) -> list[str]:
+        """The Slack summary split into messages of at most `max_chars`."""
+        return self._summary().pages(max_chars)
+
     def generate_plain_summary(self) -> str:
         """Generate a plain text summary."""
-        successful = self.changelog.get_successful()
-        failed = self.changelog.get_failed()
+        summary = self._summary()
 
         lines = [
             f"Session: {self.changelog.session_id}",
-            f"Total changes: {len(self.changelog)}",
-            f"Successful: {len(successful)}",
-            f"Failed: {len(failed)}",
+            f"Total changes: {summary.total}",
+            f"Successful: {summary.successful}",
+            f"Failed: {summary.failed}",
             "",
         ]
 
-        if successful:
-            lines.append("Successful changes:")
-            for record in successful:
-                lines.append(f"  - {record.target}.{record.field}: {record.reason}")
-                if record.revision_url:
-                    lines.append(f"    Review: {record.revision_url}")
+        for operation, group in sorted(summary.operations.items()):
+            lines.append(f"{operation}: {group.total} changes, {group.failed} failed")
+            for example in group.examples:
+                lines.append(f"  - {example.target}.{example.field}: {example.reason}")
+                lines.append(f"    Change: {example.change}")
+                if example.revision_url:
+                    lines.append(f"    Review: {example.revision_url}")
+            remaining = group.total - group.failed - len(group.examples)
+            if remaining > 0:
+                lines.append(f"  ...and {remaining} more")
 
-        if failed:
+        if summary.failures:
             lines.append("")
             lines.append("Failed changes:")
-            for record in failed:
-                lines.append(f"  - {record.target}.{record.field}: {record.error}")
+            for target, field_name, error in summary.failures:
+                lines.append(f"  - {target}.{field_name}: {error}")
+            if summary.failed > len(summary.failures):
+                lines.append(f"  ...and {summary.failed - len(summary.failures)} more")
 
         return "\n".join(lines)
 
-    @staticmethod
-    def _truncate(text: str, max_length: int) -> str:
-        """Truncate text for display."""
-        # Remove newlines for compact display
-        text = text.replace("\n", " ").strip()
-        if len(text) > max_length:
-            return text[: max_length - 3] + "..."
-        return text
+
+def _section_intro(section: _Section, continued: bool) -> list[str]:
+    lines = []
+    if section.title:
+        lines.extend([f"### {section.title}{' (continued)' if continued else ''}", ""])
+    return lines + section.header
+
+
+def _size(lines: list[str]) -> int:
+    return sum(len(line) + 1 for line in lines)
+
+
+def _clip_line(line: str, limit: int) -> str:
+    return line if len(line) <= limit else line[: max(limit - 3, 0)] + "..."
+
+
+def _top_fields(fields: dict[str, int], limit: int = 3) -> str:
+    busiest = sorted(fields.items(), key=lambda item: (-item[1], item[0]))
+    names = ", ".join(name for name, _ in busiest[:limit])
+    return names + (f" +{len(fields) - limit}" if len(fields) > limit else "")
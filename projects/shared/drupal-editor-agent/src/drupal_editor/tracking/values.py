@@ -0,0 +1,241 @@
+"""
+Content-addressed storage for changelog values.
+
+Node edits record whole HTML bodies as old/new values. Instead of keeping
+two full copies per record, values above a small size are stored once per
+distinct content (keyed by a 16-byte BLAKE2b digest), zlib-compressed, and
+a new value can be compressed against its old value as a preset
+dictionary, so a one-word fix in a 20 KB body costs a few dozen bytes.
+Delta chains are capped at a few links, so reading a value never has to
+decompress more than that many entries. Once the in-memory budget is
+exceeded, a background thread moves the oldest entries to a temporary
+spill file, so put() itself never does file I/O.
+
+Each ChangeLog owns one store; it is freed (spill file included) once the
+log and its records are gone.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import threading
+import weakref
+import zlib
+from collections import OrderedDict
+from typing import Optional
+
+# zlib only uses the last 32 KB of a preset dictionary
+_ZDICT_LIMIT = 32 * 1024
+
+# Longest chain of values compressed against each other; the next value
+# in a chain is stored in full
+MAX_DELTA_CHAIN = 8
+
+
+class ValueStore:
+    """
+    Deduplicated, compressed value storage with spill-to-disk.
+
+    Usage:
+        store = ValueStore(max_memory_bytes=32 * 1024 * 1024)
+        old_key = store.put(old_html)
+        new_key = store.put(new_html, base=old_key)  # compressed against old
+        assert store.get(new_key) == new_html
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        spill_dir: Optional[str] = None,
+    ):
+        """
+        Initialize an empty store.
+
+        Args:
+            max_memory_bytes: Compressed bytes kept in memory before spilling
+            spill_dir: Directory for the spill file (default: system temp dir)
+        """
+        self.max_memory_bytes = max_memory_bytes
+        self.spill_dir = spill_dir
+        self._memory: OrderedDict[bytes, bytes] = OrderedDict()
+        self._spilled: dict[bytes, tuple[int, int]] = {}
+        self._bases: dict[bytes, tuple[bytes, int]] = {}  # key -> (base key, chain depth)
+        self._memory_bytes = 0
+        self._spill_file = None
+        self._spill_thread: Optional[threading.Thread] = None
+        self._spill_wanted = threading.Event()
+        self._closed = False
+        # _lock only guards the in-memory maps and is never held during I/O;
+        # _file_lock serializes access to the spill file
+        self._lock = threading.Lock()
+        self._file_lock = threading.Lock()
+
+    def __contains__(self, key: bytes) -> bool:
+        return key in self._memory or key in self._spilled
+
+    def __len__(self) -> int:
+        return len(self._memory) + len(self._spilled)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Compressed bytes currently held in memory."""
+        return self._memory_bytes
+
+    @staticmethod
+    def key_for(text: str) -> bytes:
+        """Content hash used as the key for a value."""
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    def put(self, text: str, base: Optional[bytes] = None) -> bytes:
+        """
+        Store a value and return its key.
+
+        Args:
+            text: Value to store
+            base: Key of a related value (e.g. the old value) to compress
+                  against; only used if that value is in the store
+        """
+        key = self.key_for(text)
+        if key in self:
+            return key
+
+        data = text.encode("utf-8")
+        depth = 0
+        base_text = None
+        if base is not None and base != key and base in self:
+            depth = self._bases[base][1] + 1 if base in self._bases else 1
+            if depth <= MAX_DELTA_CHAIN:
+                base_text = self.get(base)
+        if base_text is not None:
+            zdict = base_text.encode("utf-8")[-_ZDICT_LIMIT:]
+            compressor = zlib.compressobj(level=6, zdict=zdict)
+            blob = compressor.compress(data) + compressor.flush()
+        else:
+            blob = zlib.compress(data, 6)
+
+        with self._lock:
+            if key in self:
+                return key
+            if base_text is not None:
+                self._bases[key] = (base, depth)  # type: ignore[assignment]
+            self._memory[key] = blob
+            self._memory_bytes += len(blob)
+            over_budget = self._memory_bytes > self.max_memory_bytes
+        if over_budget:
+            self._request_spill()
+        return key
+
+    def get(self, key: bytes) -> str:
+        """Return the value stored under `key` (KeyError if unknown)."""
+        # Walk back to the entry stored in full, then decompress forwards
+        chain = [key]
+        while chain[-1] in self._bases:
+            chain.append(self._bases[chain[-1]][0])
+
+        text: Optional[str] = None
+        for link in reversed(chain):
+            blob = self._blob(link)
+            if text is None:
+                data = zlib.decompress(blob)
+            else:
+                decompressor = zlib.decompressobj(zdict=text.encode("utf-8")[-_ZDICT_LIMIT:])
+                data = decompressor.decompress(blob) + decompressor.flush()
+            text = data.decode("utf-8")
+        return text  # type: ignore[return-value]
+
+    def _blob(self, key: bytes) -> bytes:
+        # Entries are added to _spilled before leaving _memory, so a key
+        # being spilled is always found in one of them
+        blob = self._memory.get(key)
+        if blob is not None:
+            return blob
+        location = self._spilled.get(key)
+        if location is None:
+            raise KeyError(key)
+        offset, length = location
+        with self._file_lock:
+            self._spill_file.seek(offset)
+            return self._spill_file.read(length)
+
+    def _request_spill(self) -> None:
+        """Wake the spill thread, starting it on first use."""
+        if self._spill_thread is None:
+            with self._lock:
+                if self._spill_thread is None:
+                    # The thread only holds a weak reference, and is woken
+                    # to exit when the store is garbage collected
+                    self._spill_thread = threading.Thread(
+                        target=self._spill_loop,
+                        args=(weakref.ref(self), self._spill_wanted),
+                        name="value-store-spill",
+                        daemon=True,
+                    )
+                    weakref.finalize(self, self._spill_wanted.set)
+                    self._spill_thread.start()
+        self._spill_wanted.set()
+
+    @staticmethod
+    def _spill_loop(store_ref: weakref.ref, wanted: threading.Event) -> None:
+        while True:
+            wanted.wait()
+            wanted.clear()
+            store = store_ref()
+            if store is None or store._closed:
+                return
+            try:
+                store._spill()
+            except OSError:
+                # Keep the values in memory rather than lose them
+                pass
+            del store
+
+    def _spill(self) -> None:
+        """Move the oldest in-memory entries to the spill file."""
+        target = self.max_memory_bytes // 2
+        with self._lock:
+            excess = self._memory_bytes - target
+            batch = []
+            for key, blob in self._memory.items():
+                if excess <= 0:
+                    break
+                batch.append((key, blob))
+                excess -= len(blob)
+        if not batch:
+            return
+
+        with self._file_lock:
+            if self._closed:
+                return
+            if self._spill_file is None:
+                fd, path = tempfile.mkstemp(prefix="drupal-editor-values-", suffix=".bin", dir=self.spill_dir)
+                self._spill_file = os.fdopen(fd, "a+b")
+                # Nothing else needs the file by name; it goes away with the process
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+            self._spill_file.seek(0, os.SEEK_END)
+            locations = []
+            for key, blob in batch:
+                locations.append((key, self._spill_file.tell(), len(blob)))
+                self._spill_file.write(blob)
+            self._spill_file.flush()
+
+        with self._lock:
+            for key, offset, length in locations:
+                self._spilled[key] = (offset, length)
+                if self._memory.pop(key, None) is not None:
+                    self._memory_bytes -= length
+
+    def close(self) -> None:
+        """Stop spilling and drop the spill file."""
+        self._closed = True
+        self._spill_wanted.set()
+        with self._file_lock:
+            if self._spill_file is not None:
+                self._spill_file.close()
+                self._spill_file = None
+        with self._lock:
+            self._spilled.clear()
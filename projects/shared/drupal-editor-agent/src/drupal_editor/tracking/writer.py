@@ -0,0 +1,112 @@
+"""
+Background writer that feeds changelog sinks.
+
+ChangeLog.record() may be called from many asyncio tasks or worker threads
+at once. Rather than serializing them around value compression and file
+and database writes, it only appends to a deque (atomic, no lock); this
+single thread drains the deque, packs each record's values, and writes it
+to the sinks, so sinks never see concurrent calls and no lock is ever held
+during I/O.
+"""
+
+from __future__ import annotations
+
+import atexit
+import threading
+from collections import deque
+from typing import TYPE_CHECKING, Optional
+
+from rich.console import Console
+
+if TYPE_CHECKING:
+    from drupal_editor.tracking.changelog import ChangeRecord
+    from drupal_editor.tracking.ndjson import NDJSONSink
+    from drupal_editor.tracking.store import SQLiteSink
+
+console = Console()
+
+_STOP = object()
+
+
+class SinkWriter:
+    """
+    Single consumer thread between ChangeLog.record() and its sinks.
+
+    Packs each record (ChangeRecord.pack()) before writing it, even when
+    there are no sinks.
+
+    Usage:
+        writer = SinkWriter(sinks)
+        writer.submit(record, session_id)  # from any thread, never blocks
+        writer.flush()                     # wait until everything is written
+        writer.close()                     # drain and stop (sinks stay open)
+    """
+
+    def __init__(self, sinks: list["NDJSONSink | SQLiteSink"]):
+        self.sinks = sinks
+        self._queue: deque = deque()
+        self._wake = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="changelog-writer", daemon=True)
+        self._thread.start()
+        # Runs before the sinks' own atexit hooks (registered earlier)
+        atexit.register(self.close)
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
+    def submit(self, record: "ChangeRecord", session_id: Optional[str]) -> None:
+        """Queue a record for every sink."""
+        self._queue.append((record, session_id))
+        self._wake.set()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every record submitted so far is written and the sinks
+        are flushed. Returns False on timeout.
+        """
+        if not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.append(done)
+        self._wake.set()
+        return done.wait(timeout)
+
+    def close(self) -> None:
+        """Write everything still queued, then stop the thread."""
+        if not self._thread.is_alive():
+            return
+        self._queue.append(_STOP)
+        self._wake.set()
+        self._thread.join()
+        atexit.unregister(self.close)
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            while self._queue:
+                item = self._queue.popleft()
+                if item is _STOP:
+                    return
+                if isinstance(item, threading.Event):
+                    self._flush_sinks()
+                    item.set()
+                    continue
+                record, session_id = item
+                try:
+                    record.pack()
+                except Exception as e:
+                    console.print(f"[red]Could not pack changelog values: {e}[/red]")
+                for sink in self.sinks:
+                    try:
+                        sink.write(record, session_id=session_id)
+                    except Exception as e:
+                        console.print(f"[red]Changelog sink {type(sink).__name__} failed: {e}[/red]")
+
+    def _flush_sinks(self) -> None:
+        for sink in self.sinks:
+            try:
+                sink.flush()
+            except Exception as e:
+                console.print(f"[red]Changelog sink {type(sink).__name__} failed: {e}[/red]")
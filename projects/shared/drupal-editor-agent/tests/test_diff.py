@@ -0,0 +1,102 @@
+"""Tests for word-level value diffs."""
+
+import pytest
+
+from drupal_editor.tracking import diff as diff_module
+from drupal_editor.tracking.diff import ValueDiff, compute_diff
+
+
+def long_body(words: int = 2000) -> str:
+    return "<p>" + " ".join(f"word{i}" for i in range(words)) + ".</p>"
+
+
+def test_identical_values_have_no_hunks():
+    diff = compute_diff("Same text", "Same text")
+
+    assert not diff.changed
+    assert diff.format() == "(no change)"
+
+
+def test_one_word_fix_in_long_body_is_one_small_hunk():
+    # Far past the first trim step, so both the chunked and the per-character
+    # prefix/suffix loops run
+    old = long_body()
+    new = old.replace("word1500 ", "fixed1500 ")
+
+    diff = compute_diff(old, new)
+
+    assert len(diff.hunks) == 1
+    hunk = diff.hunks[0]
+    assert hunk.offset == old.index("word1500 ")
+    assert (hunk.removed, hunk.added) == ("word1500", "fixed1500")
+    assert hunk.before.split()[-1] == "word1499"
+    assert hunk.after.split()[0] == "word1501"
+
+
+def test_trimming_backs_off_to_word_boundaries():
+    diff = compute_diff("The cat sat down", "The car sat down")
+
+    assert [(h.removed, h.added) for h in diff.hunks] == [("cat", "car")]
+    assert diff.format() == "The [-cat-]{+car+} sat down"
+
+
+def test_edits_at_both_ends_and_middle_round_trip():
+    old = long_body(300)
+    new = "Intro. " + old.replace("word150", "changed").replace(".</p>", "!</p>") + " Outro."
+
+    diff = compute_diff(old, new)
+
+    assert len(diff.hunks) >= 3
+    assert diff.apply(old) == new
+
+
+def test_insert_and_delete_round_trip():
+    for old, new in [("", "New text"), ("Old text", ""), ("a b c", "a b x c"), ("a b c", "a c")]:
+        assert compute_diff(old, new).apply(old) == new
+
+
+def test_large_rewrite_falls_back_to_single_hunk(monkeypatch):
+    monkeypatch.setattr(diff_module, "_MAX_DIFF_CELLS", 4)
+    old = "One. Two. Three"
+    new = "Uno. Dos. Tres"
+
+    diff = compute_diff(old, new)
+
+    assert [(h.offset, h.removed, h.added) for h in diff.hunks] == [(0, old, new)]
+    assert diff.apply(old) == new
+
+
+def test_apply_rejects_diff_of_another_value():
+    diff = compute_diff("The cat sat down", "The car sat down")
+
+    with pytest.raises(ValueError):
+        diff.apply("The dog sat down")
+
+
+def test_dict_round_trip():
+    old = long_body(500)
+    new = old.replace("word10 ", "").replace("word400", "changed")
+    diff = compute_diff(old, new)
+
+    restored = ValueDiff.from_dict(diff.to_dict())
+
+    assert restored == diff
+    assert restored.apply(old) == new
+
+
+def test_to_dict_truncates_long_spans():
+    diff = compute_diff("Short.", "Short. " + "x" * 500)
+
+    hunk = diff.to_dict(truncate=20)["hunks"][0]
+
+    assert hunk["ins"].endswith("...")
+    assert len(hunk["ins"]) == 23
+
+
+def test_format_styles_and_limit():
+    old = " ".join(f"w{i}" for i in range(200))
+    new = old.replace("w20 ", "x20 ").replace("w100 ", "x100 ").replace("w180 ", "x180 ")
+    diff = compute_diff(old, new)
+
+    assert "~~w20~~ **x20**" in diff.format("markdown")
+    assert diff.format(max_chars=60).endswith("(+2 more)")
@@ -0,0 +1,161 @@
+"""Tests for the REST backend against a stub Drupal server."""
+
+import json
+
+import httpx
+import pytest
+
+from drupal_editor.auth.rest import RestAuth, RestAuthError
+
+
+class StubDrupal:
+    """Minimal in-process stand-in for Drupal's core REST routes."""
+
+    def __init__(self, new_revision=True, moderated=False, node_type_resource=True, login_ok=True):
+        self.new_revision = new_revision
+        self.moderated = moderated
+        self.node_type_resource = node_type_resource
+        self.login_ok = login_ok
+        self.vid = 10
+        self.body = "Old text"
+        self.requests: list[httpx.Request] = []
+        self.patches: list[dict] = []
+
+    def node(self) -> dict:
+        node = {
+            "nid": [{"value": 1}],
+            "vid": [{"value": self.vid}],
+            "type": [{"target_id": "article"}],
+            "title": [{"value": "Title"}],
+            "body": [{"value": self.body, "format": "basic_html"}],
+            "revision_log": [],
+        }
+        if self.moderated:
+            node["moderation_state"] = [{"value": "published"}]
+        return node
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path
+        if path == "/user/login":
+            if not self.login_ok:
+                return httpx.Response(403, json={"message": "Sorry, unrecognized username or password."})
+            return httpx.Response(200, json={"csrf_token": "token"})
+        if path == "/user/login_status":
+            return httpx.Response(200, text="1")
+        if path == "/entity/node_type/article":
+            if not self.node_type_resource:
+                return httpx.Response(404, json={"message": "No route found"})
+            return httpx.Response(200, json={"type": "article", "new_revision": self.new_revision})
+        if path == "/node/1" and request.method == "GET":
+            return httpx.Response(200, json=self.node())
+        if path == "/node/1" and request.method == "PATCH":
+            body = json.loads(request.content)
+            self.patches.append(body)
+            self.body = body["body"][0]["value"]
+            if self.new_revision or self.moderated:
+                self.vid += 1
+            return httpx.Response(200, json=self.node())
+        return httpx.Response(404, json={"message": "Not found"})
+
+
+def make_auth(stub: StubDrupal) -> RestAuth:
+    auth = RestAuth(base_url="https://drupal.test", auth_type="cookie", username="agent", password="secret")
+    auth._client = httpx.AsyncClient(base_url=auth.base_url, transport=httpx.MockTransport(stub.handler))
+    return auth
+
+
+async def test_update_node_creates_revision_with_log():
+    stub = StubDrupal()
+    auth = make_auth(stub)
+
+    result = await auth.update_node(1, {"body": "New text"}, "Ava: Fixed typo")
+
+    assert result["success"] is True
+    assert result["revision_id"] == 11
+    assert result["new_revision"] is True
+    assert result["previous"] == {"body": "Old text"}
+    patch = stub.patches[0]
+    assert patch["revision_log"] == [{"value": "Ava: Fixed typo"}]
+    assert patch["body"] == [{"value": "New text", "format": "basic_html"}]
+    await auth.close()
+
+
+async def test_update_node_refuses_bundle_without_revisions():
+    stub = StubDrupal(new_revision=False)
+    auth = make_auth(stub)
+
+    result = await auth.update_node(1, {"body": "New text"}, "Ava: Fixed typo")
+
+    assert result["success"] is False
+    assert "does not create new revisions" in result["error"]
+    assert stub.patches == []
+    assert stub.body == "Old text"
+    await auth.close()
+
+
+async def test_update_node_moderated_bundle_skips_node_type_lookup():
+    stub = StubDrupal(new_revision=False, moderated=True)
+    auth = make_auth(stub)
+
+    result = await auth.update_node(1, {"body": "New text"}, "Ava: Fixed typo", "ava_suggestion")
+
+    assert result["success"] is True
+    assert stub.patches[0]["moderation_state"] == [{"value": "ava_suggestion"}]
+    assert not any(r.url.path.startswith("/entity/node_type") for r in stub.requests)
+    await auth.close()
+
+
+async def test_update_node_refuses_unknown_revision_setting():
+    # node_type resource unavailable, so the setting can't be checked up front
+    stub = StubDrupal(new_revision=False, node_type_resource=False)
+    auth = make_auth(stub)
+
+    result = await auth.update_node(1, {"body": "New text"}, "Ava: Fixed typo")
+
+    assert result["success"] is False
+    assert "unknown revision setting" in result["error"]
+    assert stub.patches == []
+    assert stub.body == "Old text"
+    await auth.close()
+
+
+async def test_update_node_in_place_requires_opt_in():
+    stub = StubDrupal(new_revision=False, node_type_resource=False)
+    auth = make_auth(stub)
+    auth.allow_in_place = True
+
+    result = await auth.update_node(1, {"body": "New text"}, "Ava: Fixed typo")
+
+    assert result["success"] is True
+    assert result["new_revision"] is False
+    assert stub.body == "New text"
+    await auth.close()
+
+
+async def test_update_node_fails_when_revision_not_created():
+    # The content type claims to create revisions, but the save didn't
+    stub = StubDrupal(new_revision=True)
+    auth = make_auth(stub)
+    stub.new_revision = False
+    auth._bundle_revisions["article"] = True
+
+    result = await auth.update_node(1, {"body": "New text"}, "Ava: Fixed typo")
+
+    assert result["success"] is False
+    assert "without a new revision" in result["error"]
+    await auth.close()
+
+
+async def test_request_raises_when_authentication_fails():
+    stub = StubDrupal(login_ok=False)
+    auth = make_auth(stub)
+
+    with pytest.raises(RestAuthError):
+        await auth.request("GET", "/node/1")
+    assert [r.url.path for r in stub.requests] == ["/user/login"]
+
+    result = await auth.update_node(1, {"body": "New text"}, "Ava: Fixed typo")
+    assert result["success"] is False
+    assert stub.patches == []
+    await auth.close()
@@ -0,0 +1,134 @@
+"""Tests for merging per-worker changelog shards."""
+
+import json
+from datetime import datetime, timedelta
+
+from drupal_editor.tracking.changelog import ChangeLog
+from drupal_editor.tracking.ndjson import read_ndjson
+from drupal_editor.tracking.shards import find_shards, iter_merged, merge_shards, shard_path
+
+START = datetime(2026, 1, 5, 9, 0, 0)
+
+
+def record(worker: str, seq: int, seconds: float, **extra) -> dict:
+    data = {
+        "session_id": "job1",
+        "worker": worker,
+        "seq": seq,
+        "timestamp": (START + timedelta(seconds=seconds)).isoformat(),
+        "auth_method": "rest",
+        "operation": "update_node",
+        "target": f"node/{seq}",
+        "field": "body",
+        "old_value": "Old text",
+        "new_value": "New text",
+        "reason": "Ava: Fixed typo",
+        "success": True,
+    }
+    data.update(extra)
+    return data
+
+
+def write_shard(directory, worker: str, records: list[dict]):
+    path = shard_path(directory, "job1", worker)
+    path.write_text("".join(json.dumps(r) + "\n" for r in records))
+    return path
+
+
+def keys(records) -> list[tuple]:
+    return [(r["timestamp"], r["worker"], r["seq"]) for r in records]
+
+
+def test_merge_orders_by_timestamp_worker_and_seq(tmp_path):
+    a = write_shard(tmp_path, "a", [record("a", 0, 0), record("a", 1, 2), record("a", 2, 4)])
+    b = write_shard(tmp_path, "b", [record("b", 0, 1), record("b", 1, 2), record("b", 2, 3)])
+
+    merged = list(iter_merged([b, a]))
+
+    assert keys(merged) == sorted(keys(merged))
+    assert [(r["worker"], r["seq"]) for r in merged] == [
+        ("a", 0), ("b", 0), ("a", 1), ("b", 1), ("b", 2), ("a", 2),
+    ]
+
+
+def test_reorder_window_sorts_late_records(tmp_path):
+    # The writer thread let seq 1 out ahead of seq 0
+    shard = write_shard(tmp_path, "a", [record("a", 1, 1), record("a", 0, 0), record("a", 2, 2)])
+
+    merged = list(iter_merged([shard], window=4))
+
+    assert [r["seq"] for r in merged] == [0, 1, 2]
+
+
+def test_records_outside_reorder_window_are_kept(tmp_path):
+    shard = write_shard(tmp_path, "a", [record("a", 1, 1), record("a", 2, 2), record("a", 0, 0)])
+
+    merged = list(iter_merged([shard], window=1))
+
+    assert sorted(r["seq"] for r in merged) == [0, 1, 2]
+    assert [r["seq"] for r in merged] != [0, 1, 2]
+
+
+def test_duplicate_shard_records_are_dropped(tmp_path):
+    records = [record("a", 0, 0), record("a", 1, 1)]
+    first = write_shard(tmp_path, "a", records)
+    copy = tmp_path / "copy" / first.name
+    copy.parent.mkdir()
+    copy.write_text(first.read_text())
+
+    result = merge_shards([first, copy], tmp_path / "merged.ndjson")
+
+    assert result.records == 2
+    assert result.duplicates == 2
+    assert [r["seq"] for r in read_ndjson(tmp_path / "merged.ndjson")] == [0, 1]
+
+
+def test_records_without_seq_are_never_deduplicated(tmp_path):
+    first = record("a", 0, 0)
+    first.pop("seq")
+    shard = write_shard(tmp_path, "a", [first, dict(first)])
+
+    assert len(list(iter_merged([shard]))) == 2
+
+
+def test_worker_falls_back_to_shard_name(tmp_path):
+    data = record("a", 0, 0)
+    data.pop("worker")
+    shard = write_shard(tmp_path, "web-1", [data])
+
+    assert next(iter_merged([shard]))["worker"] == "web-1"
+
+
+def test_merge_changelog_shards(tmp_path):
+    for worker in ("w1", "w2"):
+        log = ChangeLog(session_id="job1")
+        log.shard_to(tmp_path, worker=worker)
+        for i in range(3):
+            log.record("rest", "update_node", f"node/{i}", "body", "Old", f"New {worker}", "Ava: Fix")
+        log.close()
+
+    result = merge_shards(find_shards(tmp_path, "job1"), tmp_path / "job1.ndjson")
+
+    assert result.records == 6
+    assert result.by_worker == {"w1": 3, "w2": 3}
+    assert result.session_id == "job1"
+    merged = list(read_ndjson(tmp_path / "job1.ndjson"))
+    assert keys(merged) == sorted(keys(merged))
+
+
+def test_workers_line_is_inside_every_summary(tmp_path):
+    records = [
+        record("a", i, i, target=f"node/{i}", operation=f"op{i % 7}", reason=f"Reason {i} " + "x" * 80)
+        for i in range(60)
+    ]
+    shard = write_shard(tmp_path, "a", records)
+    result = merge_shards([shard])
+
+    assert "**Workers:** 1 (1 shards, 0 duplicates dropped)" in result.summary()
+
+    pages = result.pages(max_chars=800)
+    assert len(pages) > 1
+    assert all(len(page) <= 800 for page in pages)
+    assert "**Workers:**" in pages[0]
+    for page in pages:
+        assert page.rstrip().endswith(f"/{len(pages)}_")